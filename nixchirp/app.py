@@ -5,15 +5,30 @@ from __future__ import annotations
 import argparse
 import ctypes
 import logging
-import queue
 import time
+from collections import deque
 from pathlib import Path
 
-import sdl2
+from sdl2 import (
+    SDL_Event,
+    SDL_KEYDOWN,
+    SDL_MOUSEMOTION,
+    SDL_MOUSEWHEEL,
+    SDL_PollEvent,
+    SDL_QUIT,
+    SDL_SCANCODE_F1,
+    SDL_WINDOWEVENT,
+    SDL_WINDOWEVENT_EXPOSED,
+    SDL_WINDOWEVENT_MAXIMIZED,
+    SDL_WINDOWEVENT_MINIMIZED,
+    SDL_WINDOWEVENT_RESTORED,
+    SDL_WaitEventTimeout,
+)
 
 from nixchirp.assets.cache import FrameCache
+from nixchirp.assets.eviction import make_eviction_policy
 from nixchirp.assets.loader import LoadedAnimation
-from nixchirp.config import AppConfig, StateConfig, load_profile
+from nixchirp.config import AppConfig, StateConfig, load_profile, parse_hex_color
 from nixchirp.constants import (
     CHROMA_GREEN,
     DEFAULT_BG_COLOR,
@@ -24,6 +39,7 @@ from nixchirp.constants import (
     OUTPUT_VIRTUAL_CAM,
 )
 from nixchirp.gui.imgui_sdl2 import ImGuiSDL2
+from nixchirp.gui.general_panel import update_general_timer
 from nixchirp.gui.overlay import draw_overlay
 from nixchirp.input.hotkeys import HotkeyInput, HotkeyMapping
 from nixchirp.input.idle import SleepEvent, SleepTimer
@@ -38,6 +54,64 @@ from nixchirp.state.transitions import Transition, TransitionType, parse_transit
 
 logger = logging.getLogger(__name__)
 
+# Mic events that count as activity for the sleep timer
+_ACTIVE_MIC: frozenset[EventType] = frozenset({EventType.MIC_ACTIVE, EventType.MIC_INTENSE})
+
+# Crossfade blend within this of 0 or 1 is drawn as a single frame
+_BLEND_EPS = 0.01
+
+# With no input, the settings overlay is rebuilt at this interval and the
+# previous draw data re-submitted in between (live readouts stay current)
+_GUI_IDLE_REBUILD_NS = 100_000_000
+# Frames rebuilt after input, so ImGui can settle (popups, auto-sizing)
+_GUI_INPUT_REBUILD_FRAMES = 2
+
+# Debug volume meter bars, indexed by filled length
+_VOLUME_BAR_WIDTH = 50
+_VOLUME_BARS = tuple(
+    "#" * n + "-" * (_VOLUME_BAR_WIDTH - n) for n in range(_VOLUME_BAR_WIDTH + 1)
+)
+
+
+def _coalesce_key(event: SDL_Event) -> tuple[int, ...] | None:
+    """Return a key identifying events that can be merged, else None.
+
+    Mouse wheel events merge by summing their deltas; for the others only
+    the latest matters.
+    """
+    if event.type == SDL_MOUSEMOTION:
+        return (event.type, event.motion.windowID)
+    if event.type == SDL_MOUSEWHEEL:
+        return (event.type, event.wheel.windowID, event.wheel.direction)
+    if (event.type == SDL_WINDOWEVENT
+            and event.window.event == SDL_WINDOWEVENT_EXPOSED):
+        return (event.type, event.window.windowID, event.window.event)
+    return None
+
+
+def _advance_playhead(
+    timer_ms: float,
+    index: int,
+    frame_dur_ms: float,
+    frame_count: int,
+    loop: bool,
+) -> tuple[float, int]:
+    """Consume whole frame durations from *timer_ms*, advancing *index*.
+
+    Returns the new (timer_ms, index).  Non-looping playback stops on the
+    last frame with the timer reset.  Runs in constant time however long
+    the stall that produced *timer_ms* was.
+    """
+    if timer_ms < frame_dur_ms:
+        return timer_ms, index
+    advance, timer_ms = divmod(timer_ms, frame_dur_ms)
+    index += int(advance)
+    if index >= frame_count:
+        if not loop:
+            return 0.0, frame_count - 1
+        index %= frame_count
+    return timer_ms, index
+
 
 class App:
     """NixChirp main application."""
@@ -46,11 +120,21 @@ class App:
         self.config = config
         self.window: Window | None = None
         self.renderer: GLRenderer | None = None
-        self.cache = FrameCache(max_mb=config.general.cache_max_mb)
+        self.cache = FrameCache(
+            max_mb=config.general.cache_max_mb,
+            cache_format=config.general.cache_format,
+            policy=make_eviction_policy(config.general.cache_policy),
+            stream_threshold_mb=config.general.stream_threshold_mb,
+        )
 
         # State machine
         self._state_machine = StateMachine()
-        self._event_queue: queue.Queue[StateEvent] = queue.Queue()
+        # Shared input queue: mic/MIDI/hotkey threads append(), the main
+        # loop popleft()s.  deque ops are atomic, so no lock is needed.
+        self._event_queue: deque[StateEvent] = deque(maxlen=256)
+        # Only the newest mic transition matters each frame, so the mic
+        # gets its own one-slot deque that simply overwrites older events
+        self._mic_events: deque[StateEvent] = deque(maxlen=1)
 
         # Input
         self._mic: MicInput | None = None
@@ -60,10 +144,18 @@ class App:
 
         # Virtual camera output
         self._virtual_cam: VirtualCamera | None = None
+        # Parsed chroma color, re-parsed only when the config string changes
+        self._vcam_bg_hex: str = ""
+        self._vcam_bg_rgb: tuple[int, int, int] = (0, 255, 0)
+        self._vcam_bg_gl: tuple[float, float, float] = (0.0, 1.0, 0.0)
 
         # GUI
         self._imgui = ImGuiSDL2()
         self._gui_visible = False
+        self._window_minimized = False  # Nothing of the overlay is visible
+        self._gui_rebuild_frames = _GUI_INPUT_REBUILD_FRAMES  # Pending input rebuilds
+        self._gui_next_rebuild_ns: int = 0
+        self._gui_dt: float = 0.0  # Time since the last rebuild, for ImGui
 
         # Animation playback — current state
         self._current_animation: LoadedAnimation | None = None
@@ -77,6 +169,12 @@ class App:
         # restarting from frame 0 on every mic idle↔speaking cycle.
         self._anim_positions: dict[str, tuple[int, float]] = {}
 
+        # Resolved asset paths keyed by State.file.  Only paths that exist
+        # are cached, so a missing file is looked up again on next use.
+        self._resolved_paths: dict[str, Path] = {}
+        # Asset paths of the active group's mic states, pinned in the cache
+        self._pinned_paths: set[Path] = set()
+
         # Flag: True when processing mic-driven state changes.
         # Mic transitions use instant swap keeping the current frame position
         # so idle/speaking animations stay in sync (same body, different mouth).
@@ -93,21 +191,31 @@ class App:
         self._default_transition_type = parse_transition_type(config.transitions.default_type)
         self._default_transition_duration = config.transitions.default_duration_ms
 
-        # Timing
-        self._last_time: float = 0.0
+        # Last presented frame: (frame_index, mode, w, h) plus the animation
+        # it came from.  Identical output is not redrawn or swapped.
+        self._last_render_key: tuple[int, str, int, int] | None = None
+        self._last_render_anim: LoadedAnimation | None = None
+
+        # SDL event polling scratch space, reused every frame
+        self._sdl_event = SDL_Event()
+        self._sdl_event_ref = ctypes.byref(self._sdl_event)
+        self._pending_sdl_events: list[SDL_Event] = []
+
+        # Timing (integer nanoseconds from time.monotonic_ns)
+        self._last_time_ns: int = 0
         self._fps_cap = config.general.fps_cap or DEFAULT_FPS_CAP
-        self._frame_time_target = 1.0 / self._fps_cap
+        self._frame_time_target_ns = 1_000_000_000 // self._fps_cap
 
         # State groups: group_name → (idle_state, active_state, intense_state)
         self._state_groups: dict[str, tuple[str, str, str]] = {}
         self._active_group: str = ""  # "" means default (from mic config)
         self._group_revert_pending: bool = False
         self._group_revert_timer: float = 0.0
-        self._group_activate_time: float = 0.0  # monotonic time when group was activated
-        self._group_mic_lock_until: float = 0.0  # suppress mic transitions until this time
+        self._group_activate_ns: int = 0  # monotonic_ns when group was activated
+        self._group_mic_lock_until_ns: int = 0  # suppress mic transitions until this time
 
-        # Volume meter for debug logging
-        self._volume_log_timer: float = 0.0
+        # Volume meter for debug logging (frames since the last log line)
+        self._volume_log_frames: int = 0
 
     def run(self) -> None:
         """Run the main application loop."""
@@ -163,6 +271,7 @@ class App:
 
         # Preload all configured states into cache
         self._preload_states()
+        self._pin_mic_states()
 
         # Set initial state's animation
         current = self._state_machine.current_state
@@ -172,7 +281,7 @@ class App:
         # Start mic input
         mic_cfg = self.config.mic
         self._mic = MicInput(
-            event_queue=self._event_queue,
+            event_queue=self._mic_events,
             device=mic_cfg.device,
             open_threshold=mic_cfg.open_threshold,
             close_threshold=mic_cfg.close_threshold,
@@ -250,7 +359,7 @@ class App:
         if mode == OUTPUT_VIRTUAL_CAM:
             self.open_virtual_cam()
 
-        self._last_time = time.monotonic()
+        self._last_time_ns = time.monotonic_ns()
 
         # First-run: auto-show GUI if no states configured
         if not self.config.states:
@@ -276,6 +385,31 @@ class App:
 
         return p
 
+    def _find_asset(self, file_path: str) -> Path | None:
+        """Resolve an asset path, returning it only if the file exists."""
+        path = self._resolved_paths.get(file_path)
+        if path is not None:
+            return path
+        path = self._resolve_asset_path(file_path)
+        if path is None or not path.exists():
+            return None
+        self._resolved_paths[file_path] = path
+        return path
+
+    def _get_state_animation(self, state: State) -> LoadedAnimation | None:
+        """Fetch a state's animation from the cache, loading it if needed."""
+        file_path = self._find_asset(state.file)
+        if file_path is None:
+            logger.warning("Asset not found for state '%s': %s", state.name, state.file)
+            return None
+        try:
+            return self.cache.get_or_load(file_path)
+        except FileNotFoundError:
+            # Removed from disk since it was resolved
+            self._resolved_paths.pop(state.file, None)
+            logger.warning("Asset not found for state '%s': %s", state.name, state.file)
+            return None
+
     def _preload_states(self) -> None:
         """Preload all configured state animations into cache at startup."""
         paths_to_load: list[tuple[str, Path]] = []
@@ -283,8 +417,8 @@ class App:
             state = self._state_machine.get_state(state_name)
             if state is None:
                 continue
-            file_path = self._resolve_asset_path(state.file)
-            if file_path and file_path.exists():
+            file_path = self._find_asset(state.file)
+            if file_path is not None:
                 paths_to_load.append((state_name, file_path))
             else:
                 logger.warning("Asset not found for state '%s': %s", state_name, state.file)
@@ -292,27 +426,45 @@ class App:
         if not paths_to_load:
             return
 
-        original_max = self.cache._max_bytes
-        self.cache._max_bytes = 2**63
+        original_max = self.cache.max_mb
+        self.cache.max_mb = 2**40
 
         logger.info("Preloading %d state animations...", len(paths_to_load))
-        for state_name, file_path in paths_to_load:
-            self.cache.get_or_load(file_path)
+        self.cache.preload([file_path for _, file_path in paths_to_load])
 
         loaded_mb = int(self.cache.current_mb)
-        new_max = max(original_max // (1024 * 1024), loaded_mb + 100)
-        self.cache._max_bytes = new_max * 1024 * 1024
+        new_max = max(original_max, loaded_mb + 100)
+        self.cache.max_mb = new_max
         logger.info("Preloaded %d states (%.0f MB). Cache limit: %d MB",
                      len(paths_to_load), self.cache.current_mb, new_max)
 
+    def _pin_mic_states(self) -> None:
+        """Pin the current mic idle/active/intense states' animations in the cache.
+
+        Unpins whatever the previously active group had pinned.
+        """
+        sm = self._state_machine
+        paths: set[Path] = set()
+        for name in (sm.mic_idle_state, sm.mic_active_state, sm.mic_intense_state):
+            state = sm.get_state(name) if name else None
+            if state is None:
+                continue
+            path = self._find_asset(state.file)
+            if path is not None:
+                paths.add(path)
+
+        for path in self._pinned_paths - paths:
+            self.cache.unpin(path)
+        for path in paths - self._pinned_paths:
+            self.cache.pin(path)
+        self._pinned_paths = paths
+
     def _load_state_animation(self, state: State) -> LoadedAnimation | None:
         """Load an animation for a state, using the cache."""
-        file_path = self._resolve_asset_path(state.file)
-        if file_path is None or not file_path.exists():
-            logger.warning("Asset not found for state '%s': %s", state.name, state.file)
+        anim = self._get_state_animation(state)
+        if anim is None:
             return None
 
-        anim = self.cache.get_or_load(file_path)
         self._current_animation = anim
         self._speed_multiplier = state.speed
         self._loop = state.loop
@@ -336,9 +488,8 @@ class App:
             # position.  Since idle/speaking GIFs are the same body animation
             # (same length & FPS), keeping the frame index means the body
             # stays perfectly in sync — only the mouth changes.
-            file_path = self._resolve_asset_path(new_state.file)
-            if file_path and file_path.exists():
-                anim = self.cache.get_or_load(file_path)
+            anim = self._get_state_animation(new_state)
+            if anim is not None:
                 self._current_animation = anim
                 self._speed_multiplier = new_state.speed
                 self._loop = new_state.loop
@@ -348,9 +499,10 @@ class App:
             # No transition, no prev_animation setup
             self._transition = None
             self._prev_animation = None
-            logger.info("State: %s → %s (mic swap)",
-                         old_state.name if old_state else "None",
-                         new_state.name)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("State: %s → %s (mic swap)",
+                            old_state.name if old_state else "None",
+                            new_state.name)
             return
 
         if old_state and self._current_animation:
@@ -365,8 +517,7 @@ class App:
             self._prev_speed = self._speed_multiplier
 
             if self.renderer and self._prev_animation.frame_count > 0:
-                frame = self._prev_animation.get_frame(self._prev_frame_index)
-                self.renderer.upload_frame(frame, slot="b")
+                self._upload_anim_frame(self._prev_animation, self._prev_frame_index, "b")
 
         self._load_state_animation(new_state)
 
@@ -375,11 +526,12 @@ class App:
         self._transition = Transition(trans_type, duration)
         self._transition.start()
 
-        logger.info("State: %s → %s (%s, %dms)",
-                     old_state.name if old_state else "None",
-                     new_state.name,
-                     trans_type.name.lower(),
-                     duration)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("State: %s → %s (%s, %dms)",
+                        old_state.name if old_state else "None",
+                        new_state.name,
+                        trans_type.name.lower(),
+                        duration)
 
     def _main_loop(self) -> None:
         """SDL2 event loop with frame timing."""
@@ -387,9 +539,9 @@ class App:
         assert self.renderer is not None
 
         while self.window.running:
-            frame_start = time.monotonic()
-            dt = frame_start - self._last_time
-            self._last_time = frame_start
+            frame_start = time.monotonic_ns()
+            dt = (frame_start - self._last_time_ns) * 1e-9
+            self._last_time_ns = frame_start
 
             # Poll and process SDL events
             self._poll_and_dispatch_events()
@@ -403,7 +555,7 @@ class App:
                 if self._group_revert_timer <= 0:
                     self._group_revert_pending = False
                     self._set_active_group("")
-                    self._group_mic_lock_until = time.monotonic() + 0.15
+                    self._group_mic_lock_until_ns = time.monotonic_ns() + 150_000_000
                     self._state_machine.update()
 
             # Tick sleep timer
@@ -437,57 +589,114 @@ class App:
             # Update animation(s)
             self._update_animation(dt)
 
-            # Update transition
+            # Update transition, on the frame's own timestamp
             if self._transition and self._transition.active:
-                self._transition.update()
+                self._transition.tick(frame_start)
 
             # Render avatar
-            self._render_frame()
+            drawn = self._render_frame()
 
             # Write frame to virtual camera (if active)
             if self._virtual_cam and self._virtual_cam.is_open:
                 self._write_virtual_cam_frame()
 
-            # Render ImGui overlay
-            if self._gui_visible:
-                win_w, win_h = ctypes.c_int(), ctypes.c_int()
-                sdl2.SDL_GetWindowSize(self.window._window, ctypes.byref(win_w), ctypes.byref(win_h))
-                fb_w, fb_h = self.window.get_size()
-                self._imgui.new_frame(win_w.value, win_h.value, fb_w, fb_h, dt)
-                draw_overlay(self, dt)
-                self._imgui.render()
+            # GUI timers keep running while the overlay is hidden
+            update_general_timer(dt)
+
+            # Render ImGui overlay.  Widgets are only rebuilt after input, while
+            # a text field is being edited, or on the idle interval; other
+            # frames redraw the previous draw data over the fresh avatar.
+            if self._gui_visible and not self._window_minimized:
+                self._gui_dt += dt
+                if (self._gui_rebuild_frames or frame_start >= self._gui_next_rebuild_ns
+                        or self._imgui.want_text_input):
+                    win_w, win_h = self.window.get_window_size()
+                    fb_w, fb_h = self.window.get_size()
+                    self._imgui.new_frame(win_w, win_h, fb_w, fb_h, self._gui_dt)
+                    draw_overlay(self)
+                    self._imgui.render()
+                    if self._gui_rebuild_frames:
+                        self._gui_rebuild_frames -= 1
+                    self._gui_dt = 0.0
+                    self._gui_next_rebuild_ns = frame_start + _GUI_IDLE_REBUILD_NS
+                else:
+                    self._imgui.render_previous()
 
-            # Present
-            self.window.swap()
+            # Present (the previous frame stays on screen when unchanged)
+            if drawn:
+                self.window.swap()
 
             # Debug volume meter
-            self._log_volume(dt)
-
-            # Frame rate limiting
-            elapsed = time.monotonic() - frame_start
-            sleep_time = self._frame_time_target - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            self._log_volume()
+
+            # Frame rate limiting — block in SDL for the rest of the frame
+            # budget instead of sleeping, so input arriving mid-wait is
+            # dispatched immediately rather than a frame later.
+            deadline = frame_start + self._frame_time_target_ns
+            remaining_ms = (deadline - time.monotonic_ns()) // 1_000_000
+            while remaining_ms > 0 and self.window.running:
+                if SDL_WaitEventTimeout(None, remaining_ms):
+                    self._poll_and_dispatch_events()
+                remaining_ms = (deadline - time.monotonic_ns()) // 1_000_000
 
     def _poll_and_dispatch_events(self) -> None:
         """Poll SDL events, feed to ImGui, handle F1 toggle and quit."""
         assert self.window is not None
-        event = sdl2.SDL_Event()
-        while sdl2.SDL_PollEvent(ctypes.byref(event)) != 0:
-            if event.type == sdl2.SDL_QUIT:
+
+        # Drain the queue first so runs of redundant events (mouse motion
+        # while dragging, repeated expose on resize) collapse into the
+        # latest one, and runs of wheel ticks into one summed scroll,
+        # before anything is dispatched.  Only consecutive
+        # events are merged, so ordering relative to clicks is preserved.
+        # SDL_PollEvent fills one reused scratch struct; only events that are
+        # kept get copied out of it.
+        pending = self._pending_sdl_events
+        pending.clear()
+        pending_key: tuple[int, ...] | None = None
+        scratch = self._sdl_event
+        while SDL_PollEvent(self._sdl_event_ref) != 0:
+            key = _coalesce_key(scratch)
+            if key is not None and key == pending_key:
+                if scratch.type == SDL_MOUSEWHEEL:
+                    # Scroll deltas accumulate; keep one event with the sum
+                    pending[-1].wheel.x += scratch.wheel.x
+                    pending[-1].wheel.y += scratch.wheel.y
+                else:
+                    pending[-1] = SDL_Event.from_buffer_copy(scratch)
+            else:
+                pending.append(SDL_Event.from_buffer_copy(scratch))
+            pending_key = key
+
+        if not pending:
+            return
+
+        for event in pending:
+            if event.type == SDL_QUIT:
                 self.window._running = False
                 continue
 
+            # Exposed/resized/restored windows need a fresh frame
+            if event.type == SDL_WINDOWEVENT:
+                self._last_render_key = None
+                if event.window.event == SDL_WINDOWEVENT_MINIMIZED:
+                    self._window_minimized = True
+                elif event.window.event in (
+                    SDL_WINDOWEVENT_RESTORED, SDL_WINDOWEVENT_MAXIMIZED, SDL_WINDOWEVENT_EXPOSED,
+                ):
+                    self._window_minimized = False
+
             # F1 toggles GUI overlay
-            if (event.type == sdl2.SDL_KEYDOWN
-                    and event.key.keysym.scancode == sdl2.SDL_SCANCODE_F1
+            if (event.type == SDL_KEYDOWN
+                    and event.key.keysym.scancode == SDL_SCANCODE_F1
                     and event.key.repeat == 0):
                 self._gui_visible = not self._gui_visible
+                self._gui_rebuild_frames = _GUI_INPUT_REBUILD_FRAMES
                 logger.info("GUI overlay %s", "shown" if self._gui_visible else "hidden")
                 continue
 
             # Feed to ImGui if visible
             if self._gui_visible:
+                self._gui_rebuild_frames = _GUI_INPUT_REBUILD_FRAMES
                 consumed = self._imgui.process_event(event)
                 if consumed:
                     continue  # ImGui consumed this event, don't pass to app
@@ -495,24 +704,18 @@ class App:
     def _process_events(self) -> None:
         """Drain the event queue into the state machine.
 
-        Coalesces mic events — only the latest mic event per frame matters.
+        Mic events arrive coalesced in their own slot — only the latest
+        mic event per frame matters.
         """
-        _MIC_EVENTS = {EventType.MIC_ACTIVE, EventType.MIC_IDLE, EventType.MIC_INTENSE}
-        latest_mic_event: StateEvent | None = None
-        other_events: list[StateEvent] = []
-
-        while not self._event_queue.empty():
-            try:
-                event = self._event_queue.get_nowait()
-                if event.event_type in _MIC_EVENTS:
-                    latest_mic_event = event
-                else:
-                    other_events.append(event)
-            except queue.Empty:
-                break
-
+        # Only this thread takes from the slot, so it can't empty in between
+        latest_mic_event = self._mic_events.pop() if self._mic_events else None
+        had_other_event = False
         group_activated = False
-        for event in other_events:
+
+        # Everything else is handled inline in arrival order
+        while self._event_queue:
+            event = self._event_queue.popleft()
+            had_other_event = True
             # Handle MIDI toggle_mic special action
             if (event.event_type == EventType.MIDI_TRIGGER
                     and event.target_state == "__toggle_mic__"):
@@ -527,7 +730,7 @@ class App:
                     # and sustained holds release immediately.
                     _MIN_HOLD_S = 0.30  # group stays active for at least 300ms
                     _DEBOUNCE_S = 0.05  # minimum delay to absorb spurious OFF/ON
-                    held = time.monotonic() - self._group_activate_time
+                    held = (time.monotonic_ns() - self._group_activate_ns) * 1e-9
                     remaining = max(_MIN_HOLD_S - held, _DEBOUNCE_S)
                     self._group_revert_pending = True
                     self._group_revert_timer = remaining
@@ -536,8 +739,9 @@ class App:
                     # correct initial state from current state machine state
                     self._group_revert_pending = False
                     self._set_active_group(target)
-                    self._group_activate_time = time.monotonic()
-                    self._group_mic_lock_until = time.monotonic() + 0.15
+                    now = time.monotonic_ns()
+                    self._group_activate_ns = now
+                    self._group_mic_lock_until_ns = now + 150_000_000  # 150ms
                     group_activated = True
                 continue
             self._state_machine.push_event(event)
@@ -549,7 +753,7 @@ class App:
         # Process mic event separately with instant-swap behavior so
         # idle↔speaking transitions are seamless (no transition effect,
         # frame position preserved for body sync).
-        mic_locked = time.monotonic() < self._group_mic_lock_until
+        mic_locked = time.monotonic_ns() < self._group_mic_lock_until_ns
         if latest_mic_event is not None and not group_activated and not mic_locked:
             self._mic_transition = True
             self._state_machine.push_event(latest_mic_event)
@@ -559,44 +763,43 @@ class App:
         # Feed activity signals to the sleep timer.
         # Any non-idle mic event, MIDI event, or hotkey event counts as activity.
         if self._sleep_timer:
-            _ACTIVE_MIC = {EventType.MIC_ACTIVE, EventType.MIC_INTENSE}
             has_activity = (
                 (latest_mic_event is not None and latest_mic_event.event_type in _ACTIVE_MIC)
-                or other_events  # Any MIDI/hotkey/group event
+                or had_other_event  # Any MIDI/hotkey/group event
             )
             if has_activity:
                 self._sleep_timer.activity()
 
     def _update_animation(self, dt: float) -> None:
         """Advance the current (and previous, during crossfade) animation."""
+        dt_ms = dt * 1000.0
         anim = self._current_animation
         if anim is not None and anim.frame_count > 0:
-            self._frame_timer += dt * 1000.0 * self._speed_multiplier
-            frame_dur = anim.frame_duration_ms or 33.33
-            while self._frame_timer >= frame_dur:
-                self._frame_timer -= frame_dur
-                self._current_frame_index += 1
-                if self._current_frame_index >= anim.frame_count:
-                    if self._loop:
-                        self._current_frame_index = 0
-                    else:
-                        self._current_frame_index = anim.frame_count - 1
-                        self._frame_timer = 0.0
-                        break
+            self._frame_timer, self._current_frame_index = _advance_playhead(
+                self._frame_timer + dt_ms * self._speed_multiplier,
+                self._current_frame_index,
+                anim.frame_duration_ms,
+                anim.frame_count,
+                self._loop,
+            )
 
         if self._transition and self._transition.active and self._prev_animation:
             prev = self._prev_animation
             if prev.frame_count > 0:
-                self._prev_frame_timer += dt * 1000.0 * self._prev_speed
-                frame_dur = prev.frame_duration_ms or 33.33
-                while self._prev_frame_timer >= frame_dur:
-                    self._prev_frame_timer -= frame_dur
-                    self._prev_frame_index += 1
-                    if self._prev_frame_index >= prev.frame_count:
-                        self._prev_frame_index = 0
-
-    def _render_frame(self) -> None:
-        """Render the current frame to the screen."""
+                self._prev_frame_timer, self._prev_frame_index = _advance_playhead(
+                    self._prev_frame_timer + dt_ms * self._prev_speed,
+                    self._prev_frame_index,
+                    prev.frame_duration_ms,
+                    prev.frame_count,
+                    True,
+                )
+
+    def _render_frame(self) -> bool:
+        """Render the current frame to the screen.
+
+        Returns False without drawing anything when the output would be
+        identical to the last presented frame, so the swap can be skipped.
+        """
         assert self.renderer is not None
         assert self.window is not None
 
@@ -609,32 +812,78 @@ class App:
             bg = (0.15, 0.15, 0.15, 1.0)
 
         w, h = self.window.get_size()
+        anim = self._current_animation
+
+        # The GUI and crossfades change every frame; otherwise only a new
+        # frame index, animation, mode or window size needs a redraw.
+        if self._gui_visible or (self._transition and self._transition.active):
+            key = None
+        else:
+            key = (self._current_frame_index, mode, w, h)
+            if key == self._last_render_key and anim is self._last_render_anim:
+                return False
+        self._last_render_key = key
+        self._last_render_anim = anim
+
         self.renderer.set_viewport(w, h)
         self.renderer.clear(bg)
 
-        anim = self._current_animation
         if anim is None or anim.frame_count == 0:
-            return
-
-        frame = anim.get_frame(self._current_frame_index)
-        self.renderer.upload_frame(frame, slot="a")
+            return True
 
+        prev = self._prev_animation
         if (self._transition and self._transition.active
-                and self._prev_animation and self._prev_animation.frame_count > 0):
-            prev_frame = self._prev_animation.get_frame(self._prev_frame_index)
-            self.renderer.upload_frame(prev_frame, slot="b")
+                and prev is not None and prev.frame_count > 0):
             blend = self._transition.blend
-            self.renderer.render_crossfade(1.0 - blend, bg)
         else:
-            if mode == OUTPUT_CHROMA:
-                self.renderer.render_chroma(CHROMA_GREEN[:3])
-            else:
-                self.renderer.render_passthrough(bg)
-
+            blend = 1.0
             if self._transition and not self._transition.active:
                 self._prev_animation = None
                 self._transition = None
 
+        # Near either end of a crossfade one side is invisible, so only that
+        # frame is uploaded and drawn with the single-texture shader.
+        if blend > 1.0 - _BLEND_EPS:
+            slot = "a"
+        elif blend < _BLEND_EPS:
+            slot = "b"
+        else:
+            slot = None
+
+        complete = True
+        if slot != "b":
+            complete &= self._upload_anim_frame(anim, self._current_frame_index, "a")
+        if slot != "a":
+            complete &= self._upload_anim_frame(prev, self._prev_frame_index, "b")
+        if not complete:
+            # A streamed frame wasn't decoded yet; draw again next time
+            self._last_render_key = None
+
+        if slot is None:
+            self.renderer.render_crossfade(1.0 - blend, bg)
+        elif mode == OUTPUT_CHROMA:
+            self.renderer.render_chroma(CHROMA_GREEN[:3], slot=slot)
+        else:
+            self.renderer.render_passthrough(bg, slot=slot)
+
+        return True
+
+    def _upload_anim_frame(self, anim: LoadedAnimation, index: int, slot: str) -> bool:
+        """Upload one of *anim*'s frames to a texture slot.
+
+        Returns False if the animation could only give a stand-in (a
+        streamed frame not decoded yet).  That upload isn't tagged, so the
+        real frame replaces it once it is ready.
+        """
+        assert self.renderer is not None
+        frame = anim.get_frame(index)
+        stale = anim.last_frame_stale
+        self.renderer.upload_frame(
+            frame, slot=slot, tag=None if stale else (anim, index),
+            pixel_format=anim.pixel_format, palette=anim.palette,
+        )
+        return not stale
+
     def _write_virtual_cam_frame(self) -> None:
         """Write the current animation frame to the virtual camera."""
         assert self._virtual_cam is not None
@@ -643,18 +892,31 @@ class App:
         if anim is None or anim.frame_count == 0:
             return
 
-        frame = anim.get_frame(self._current_frame_index)
-
         # Use chroma color as background for virtual camera output
-        chroma_hex = self.config.output.chroma_color.lstrip("#")
-        try:
-            r = int(chroma_hex[0:2], 16)
-            g = int(chroma_hex[2:4], 16)
-            b = int(chroma_hex[4:6], 16)
-        except (ValueError, IndexError):
-            r, g, b = 0, 255, 0  # Default green
+        chroma = self.config.output.chroma_color
+        if chroma != self._vcam_bg_hex:
+            self._vcam_bg_hex = chroma
+            self._vcam_bg_rgb = parse_hex_color(chroma)
+            self._vcam_bg_gl = tuple(c / 255.0 for c in self._vcam_bg_rgb)
+
+        index = self._current_frame_index
+        width, height = self._virtual_cam.size
+        if (anim.info.width, anim.info.height) != (width, height):
+            return
 
-        self._virtual_cam.write_frame(frame, bg_color=(r, g, b))
+        # Composite on the GPU and read the result straight into the
+        # camera's buffer; slot A already holds this frame unless a
+        # crossfade is just starting
+        if self.renderer is not None:
+            self._upload_anim_frame(anim, index, "a")
+            if self.renderer.read_composite(
+                width, height, self._vcam_bg_gl, self._virtual_cam.write_rgb,
+            ):
+                return
+
+        self._virtual_cam.write_frame(
+            anim.get_frame_rgba(index), bg_color=self._vcam_bg_rgb,
+        )
 
     def open_virtual_cam(self) -> bool:
         """Open the virtual camera (called from GUI on mode switch)."""
@@ -710,20 +972,24 @@ class App:
             sm.mic_active_state = self.config.mic.active_state
             sm.mic_intense_state = self.config.mic.intense_state
             self._active_group = ""
-            logger.info("State group → default (idle=%s, active=%s, intense=%s)",
-                        sm.mic_idle_state, sm.mic_active_state, sm.mic_intense_state)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("State group → default (idle=%s, active=%s, intense=%s)",
+                            sm.mic_idle_state, sm.mic_active_state, sm.mic_intense_state)
         elif group_name in self._state_groups:
             idle, active, intense = self._state_groups[group_name]
             sm.mic_idle_state = idle
             sm.mic_active_state = active
             sm.mic_intense_state = intense
             self._active_group = group_name
-            logger.info("State group → '%s' (idle=%s, active=%s, intense=%s)",
-                        group_name, idle, active, intense)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("State group → '%s' (idle=%s, active=%s, intense=%s)",
+                            group_name, idle, active, intense)
         else:
             logger.warning("Unknown state group: '%s'", group_name)
             return
 
+        self._pin_mic_states()
+
         # Map the old role to the new group's equivalent state.
         if current_role == "intense" and sm.mic_intense_state:
             target = sm.mic_intense_state
@@ -732,7 +998,8 @@ class App:
         else:
             target = sm.mic_idle_state
 
-        logger.info("Group switch: role=%s → target=%s", current_role, target)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Group switch: role=%s → target=%s", current_role, target)
         if target:
             sm.push_event(StateEvent(EventType.SET_STATE, target_state=target))
 
@@ -747,16 +1014,18 @@ class App:
             self._mic.start()
             logger.info("Mic toggled ON via MIDI")
 
-    def _log_volume(self, dt: float) -> None:
-        """Periodically log mic volume for debugging."""
+    def _log_volume(self) -> None:
+        """Periodically log mic volume for debugging (about twice a second)."""
         if not self._mic or not self._mic.available:
             return
-        self._volume_log_timer += dt
-        if self._volume_log_timer >= 0.5:
-            self._volume_log_timer = 0.0
+        if not logger.isEnabledFor(logging.DEBUG):
+            self._volume_log_frames = 0
+            return
+        self._volume_log_frames += 1
+        if self._volume_log_frames >= self._fps_cap // 2:
+            self._volume_log_frames = 0
             rms = self._mic.current_rms
-            bar_len = int(rms * 50)
-            bar = "#" * bar_len + "-" * (50 - bar_len)
+            bar = _VOLUME_BARS[max(0, min(int(rms * _VOLUME_BAR_WIDTH), _VOLUME_BAR_WIDTH))]
             state_name = self._state_machine.current_state.name if self._state_machine.current_state else "?"
             logger.debug("Vol [%s] %.3f | State: %s", bar, rms, state_name)
 
@@ -812,44 +1081,52 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+_EXAMPLE_PROFILE_UNSET = object()
+_example_profile: AppConfig | None | object = _EXAMPLE_PROFILE_UNSET
+
+
 def _load_example_profile() -> AppConfig | None:
-    """Load the bundled example profile (Alex the Cat).
+    """Load the bundled example profile (Alex the Cat), once per process.
 
     Tries two locations:
     1. Flatpak install: /app/share/nixchirp/examples/
     2. Package data: nixchirp/data/examples/ (dev/pip install)
     """
-    from importlib import resources
+    global _example_profile
+    if _example_profile is _EXAMPLE_PROFILE_UNSET:
+        _example_profile = _find_example_profile()
+    return _example_profile  # type: ignore[return-value]
 
-    # Try Flatpak install path first
-    flatpak_dir = Path("/app/share/nixchirp/examples")
-    if flatpak_dir.exists() and (flatpak_dir / "alex_profile.toml").exists():
-        profile_path = flatpak_dir / "alex_profile.toml"
-        config = load_profile(profile_path)
-        # Resolve GIF paths relative to profile location
-        for state in config.states:
-            if not Path(state.file).is_absolute():
-                state.file = str(flatpak_dir / state.file)
-        logger.info("Loaded bundled example profile: Alex the Cat (Flatpak)")
-        return config
 
-    # Try package data (editable / pip install)
+def _find_example_profile() -> AppConfig | None:
+    """Probe the example profile locations and parse the first one found."""
+    from importlib import resources
+
+    candidates = [(Path("/app/share/nixchirp/examples"), " (Flatpak)")]
     try:
-        examples_dir = resources.files("nixchirp.data.examples")
-        profile_file = examples_dir.joinpath("alex_profile.toml")
         # importlib.resources may return a traversable; get real path
-        profile_path = Path(str(profile_file))
-        if profile_path.exists():
-            config = load_profile(profile_path)
-            examples_real = profile_path.parent
-            for state in config.states:
-                if not Path(state.file).is_absolute():
-                    state.file = str(examples_real / state.file)
-            logger.info("Loaded bundled example profile: Alex the Cat")
-            return config
+        examples_dir = resources.files("nixchirp.data.examples")
+        candidates.append((Path(str(examples_dir)), ""))
     except Exception:
         pass
 
+    for examples_dir, where in candidates:
+        # load_profile() stats the file anyway, so let that be the
+        # existence check rather than probing first
+        try:
+            config = load_profile(examples_dir / "alex_profile.toml")
+        except FileNotFoundError:
+            continue
+        except Exception:
+            logger.exception("Failed to load example profile from %s", examples_dir)
+            continue
+        # Resolve GIF paths relative to profile location
+        for state in config.states:
+            if not Path(state.file).is_absolute():
+                state.file = str(examples_dir / state.file)
+        logger.info("Loaded bundled example profile: Alex the Cat%s", where)
+        return config
+
     return None
 
 
@@ -1,116 +1,219 @@
-"""LRU frame cache for decoded animation frames."""
+"""Memory-bounded frame cache for decoded animation frames."""
 
 from __future__ import annotations
 
 import logging
-from collections import OrderedDict
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import numpy as np
-
+from nixchirp.assets import pool
+from nixchirp.assets.eviction import EvictionPolicy, LRUEvictionPolicy
 from nixchirp.assets.loader import LoadedAnimation, load_animation
-from nixchirp.constants import DEFAULT_CACHE_MAX_MB
+from nixchirp.constants import (
+    DEFAULT_CACHE_FORMAT,
+    DEFAULT_CACHE_MAX_MB,
+    DEFAULT_STREAM_THRESHOLD_MB,
+)
 
 logger = logging.getLogger(__name__)
 
+_MB_SHIFT = 20
+_MB = 1 << _MB_SHIFT
+
+
+def _cache_key(path: str | Path) -> str:
+    """Normalize a path to the string key used by the cache."""
+    return path if isinstance(path, str) else str(path)
+
 
 class FrameCache:
-    """LRU cache for loaded animations, bounded by total memory usage.
+    """Cache for loaded animations, bounded by total memory usage.
 
     Caches entire decoded animations (all frames). When the cache exceeds
-    the memory budget, the least-recently-used animation is evicted.
+    the memory budget, entries chosen by the eviction policy (LRU by
+    default) are evicted.  Pinned paths (e.g. the active state group's
+    states) are never chosen; they can still be removed with evict().
+
+    Animations whose full decode would exceed *stream_threshold_mb* are
+    loaded as StreamingAnimation and only account for their decode ring.
+
+    Recycled frame buffers (see assets.pool) are charged against the same
+    budget: the pool may only hold what the entries leave unused, and is
+    emptied before any entry is evicted.
     """
 
-    def __init__(self, max_mb: int = DEFAULT_CACHE_MAX_MB) -> None:
-        self._max_bytes = max_mb * 1024 * 1024
-        self._cache: OrderedDict[str, LoadedAnimation] = OrderedDict()
-        self._sizes: dict[str, int] = {}  # path -> size in bytes
+    def __init__(
+        self,
+        max_mb: int = DEFAULT_CACHE_MAX_MB,
+        cache_format: str = DEFAULT_CACHE_FORMAT,
+        policy: EvictionPolicy | None = None,
+        stream_threshold_mb: int = DEFAULT_STREAM_THRESHOLD_MB,
+    ) -> None:
+        self._max_bytes = max_mb << _MB_SHIFT
+        self._stream_above_bytes = stream_threshold_mb << _MB_SHIFT
+        self.cache_format = cache_format  # Applies to animations loaded from now on
+        self._entries: dict[str, tuple[LoadedAnimation, int]] = {}  # path -> (animation, bytes)
+        self._policy = policy if policy is not None else LRUEvictionPolicy()
         self._current_bytes = 0
+        self._pinned: set[str] = set()
+        self._sync_pool()
 
     @property
     def current_mb(self) -> float:
-        return self._current_bytes / (1024 * 1024)
+        return self._current_bytes / _MB
 
     @property
     def max_mb(self) -> int:
-        return self._max_bytes // (1024 * 1024)
+        return self._max_bytes >> _MB_SHIFT
+
+    @max_mb.setter
+    def max_mb(self, value: int) -> None:
+        self._max_bytes = value << _MB_SHIFT
+        self._sync_pool()
 
     @property
     def entry_count(self) -> int:
-        return len(self._cache)
+        return len(self._entries)
 
     def get(self, path: str | Path) -> LoadedAnimation | None:
         """Get a cached animation, returning None if not cached.
 
         Marks the entry as recently used.
         """
-        key = str(path)
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            return self._cache[key]
-        return None
+        return self._get(_cache_key(path))
+
+    def _get(self, key: str) -> LoadedAnimation | None:
+        """Look up an already-normalized key, recording the access."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._policy.on_access(key)
+        return entry[0]
 
     def get_or_load(self, path: str | Path) -> LoadedAnimation:
         """Get a cached animation or load it from disk.
 
-        If loading would exceed the memory budget, evicts LRU entries first.
+        If loading would exceed the memory budget, evicts entries first.
         """
-        key = str(path)
+        key = _cache_key(path)
 
-        # Check cache first
-        cached = self.get(key)
-        if cached is not None:
-            return cached
+        # Check cache first; one dict lookup whether it hits or misses
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._policy.on_access(key)
+            return entry[0]
 
         # Load from disk
-        animation = load_animation(path)
-        size = self._compute_size(animation)
+        animation = load_animation(key, self.cache_format, self._stream_above_bytes)
+        self._insert(key, animation)
+        return animation
 
-        # Evict until we have room
-        while self._current_bytes + size > self._max_bytes and self._cache:
-            self._evict_lru()
+    def preload(self, paths: list[str | Path]) -> int:
+        """Load several animations in parallel and insert them into the cache.
+
+        Decoding runs in native code that releases the GIL, so a thread per
+        file gives real parallelism.  Results are inserted on the calling
+        thread with the usual size accounting.  Files that fail to load are
+        logged and skipped.
+
+        Returns the number of animations newly loaded.
+        """
+        keys = list(dict.fromkeys(
+            k for k in map(_cache_key, paths) if k not in self._entries
+        ))
+        if not keys:
+            return 0
+
+        loaded = 0
+        workers = min(len(keys), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preload") as ex:
+            futures = [
+                (key, ex.submit(load_animation, key, self.cache_format, self._stream_above_bytes))
+                for key in keys
+            ]
+            for key, future in futures:
+                try:
+                    animation = future.result()
+                except Exception:
+                    logger.exception("Failed to preload %s", key)
+                    continue
+                self._insert(key, animation)
+                loaded += 1
+        return loaded
+
+    def _insert(self, key: str, animation: LoadedAnimation) -> None:
+        """Add a freshly loaded animation, evicting entries to make room."""
+        # Frames are one array (a ring for streamed animations), so this is
+        # a single attribute read however many frames there are
+        size = animation.frames.nbytes
+
+        # Pooled buffers go first, then entries
+        pool.set_limit(self._max_bytes - self._current_bytes - size)
+
+        # Evict until we have room (or only pinned entries are left)
+        while self._current_bytes + size > self._max_bytes and self._entries:
+            if not self._evict_one():
+                break
 
         # Insert
-        self._cache[key] = animation
-        self._sizes[key] = size
+        self._entries[key] = (animation, size)
         self._current_bytes += size
-
-        logger.info(
-            "Cached %s (%.1f MB). Cache: %.1f / %d MB (%d entries)",
-            Path(path).name,
-            size / (1024 * 1024),
-            self.current_mb,
-            self.max_mb,
-            self.entry_count,
-        )
-        return animation
+        self._policy.on_insert(key)
+        self._sync_pool()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Cached %s (%.1f MB). Cache: %.1f / %d MB (%d entries)",
+                Path(key).name,
+                size / _MB,
+                self.current_mb,
+                self.max_mb,
+                self.entry_count,
+            )
+
+    def pin(self, path: str | Path) -> None:
+        """Exempt a path from policy eviction. It need not be cached yet."""
+        self._pinned.add(_cache_key(path))
+
+    def unpin(self, path: str | Path) -> None:
+        """Make a pinned path evictable again."""
+        self._pinned.discard(_cache_key(path))
 
     def evict(self, path: str | Path) -> None:
         """Explicitly remove an animation from the cache."""
-        key = str(path)
-        if key in self._cache:
-            self._current_bytes -= self._sizes.pop(key, 0)
-            del self._cache[key]
+        key = _cache_key(path)
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry[1]
+            self._policy.on_remove(key)
+            # Not closed here: one still playing keeps its decoder until
+            # the last reference goes (see StreamingAnimation)
+            self._sync_pool()
 
     def clear(self) -> None:
         """Remove all entries from the cache."""
-        self._cache.clear()
-        self._sizes.clear()
+        for animation, _ in self._entries.values():
+            animation.close()
+        self._entries.clear()
+        self._policy.clear()
         self._current_bytes = 0
+        self._sync_pool()
+
+    def _sync_pool(self) -> None:
+        """Let the buffer pool use whatever part of the budget entries don't."""
+        pool.set_limit(self._max_bytes - self._current_bytes)
 
-    def _evict_lru(self) -> None:
-        """Evict the least recently used entry."""
-        if not self._cache:
-            return
-        key, animation = self._cache.popitem(last=False)
-        size = self._sizes.pop(key, 0)
+    def _evict_one(self) -> bool:
+        """Evict the unpinned entry chosen by the policy.
+
+        Returns False if there was nothing evictable.
+        """
+        key = self._policy.select_victim(self._pinned)
+        if key is None:
+            return False
+        _, size = self._entries.pop(key)
+        self._policy.on_remove(key)
         self._current_bytes -= size
-        logger.info("Evicted %s (%.1f MB) from cache", Path(key).name, size / (1024 * 1024))
-
-    @staticmethod
-    def _compute_size(animation: LoadedAnimation) -> int:
-        """Compute approximate memory usage of an animation in bytes."""
-        total = 0
-        for frame in animation.frames:
-            total += frame.nbytes
-        return total
+        logger.info("Evicted %s (%.1f MB) from cache", Path(key).name, size / _MB)
+        return True
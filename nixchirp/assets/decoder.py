@@ -8,6 +8,9 @@ from pathlib import Path
 
 import av
 import numpy as np
+from av.video.reformatter import VideoReformatter
+
+from nixchirp.assets import pool
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +53,14 @@ class AnimationDecoder:
         self._stream: av.video.stream.VideoStream | None = None
         self._info: AnimationInfo | None = None
         self._frame_timestamps: list[FrameInfo] = []
+        # Reused for every RGBA conversion so the swscale context is kept
+        self._reformatter: VideoReformatter | None = None
 
     def open(self) -> AnimationInfo:
         """Open the file and probe its metadata."""
         self._container = av.open(str(self.path))
         self._stream = self._container.streams.video[0]
+        self._reformatter = VideoReformatter()
 
         # Probe frame count and timing
         stream = self._stream
@@ -118,24 +124,64 @@ class AnimationDecoder:
     def info(self) -> AnimationInfo | None:
         return self._info
 
-    def decode_all_frames(self) -> list[np.ndarray]:
-        """Decode all frames into a list of RGBA numpy arrays.
+    def _rgba_view(self, frame: av.VideoFrame) -> np.ndarray:
+        """Convert a decoded frame to RGBA at the probed size, without copying.
+
+        Returns an (H, W, 4) view straight onto the converted frame's plane.
+        FFmpeg may pad each row out to an alignment boundary, in which case
+        the view is not contiguous; its row stride skips the padding.
+        """
+        assert self._reformatter is not None and self._info is not None
+        w, h = self._info.width, self._info.height
+        rgba = self._reformatter.reformat(frame, width=w, height=h, format="rgba")
+        plane = rgba.planes[0]
+        rows = np.frombuffer(plane, dtype=np.uint8).reshape(h, plane.line_size)
+        return rows[:, :w * 4].reshape(h, w, 4)
+
+    def _to_rgba(self, frame: av.VideoFrame) -> np.ndarray:
+        """Convert a decoded frame to a contiguous RGBA array at the probed size.
+
+        Copies only when FFmpeg padded the rows.
+        """
+        return np.ascontiguousarray(self._rgba_view(frame))
+
+    def decode_all_frames(self) -> np.ndarray:
+        """Decode all frames into one contiguous RGBA array.
+
+        The buffer is sized from the probed frame count up front and each
+        frame is converted straight into its row, so there is a single
+        allocation rather than one per frame, taken from the buffer pool
+        when an animation of the same size was freed earlier.
 
         Returns:
-            List of numpy arrays, each with shape (height, width, 4) dtype uint8.
+            Numpy array with shape (frame_count, height, width, 4) dtype uint8.
         """
-        if not self._container:
+        if not self._container or not self._info:
             raise RuntimeError("Decoder not opened. Call open() first.")
 
         self._seek_to_start()
-        frames: list[np.ndarray] = []
+        w, h = self._info.width, self._info.height
+        out = pool.acquire((max(self._info.frame_count, 1), h, w, 4))
+        count = 0
 
         for frame in self._container.decode(video=0):
-            rgba = frame.to_ndarray(format="rgba")
-            frames.append(rgba)
+            if count == out.shape[0]:
+                # Container metadata under-reported the frame count
+                grown = np.empty((count * 2,) + out.shape[1:], dtype=np.uint8)
+                grown[:count] = out
+                pool.release(out)
+                out = grown
+            # One copy, from FFmpeg's (possibly row-padded) plane into place
+            np.copyto(out[count], self._rgba_view(frame))
+            count += 1
 
         self._seek_to_start()
-        return frames
+        if count < out.shape[0]:
+            # Don't keep the unused tail alive through a view
+            trimmed = out[:count].copy()
+            pool.release(out)
+            out = trimmed
+        return out
 
     def decode_frame(self, index: int) -> np.ndarray | None:
         """Decode a specific frame by index.
@@ -149,7 +195,7 @@ class AnimationDecoder:
         self._seek_to_start()
         for i, frame in enumerate(self._container.decode(video=0)):
             if i == index:
-                return frame.to_ndarray(format="rgba")
+                return self._to_rgba(frame)
         return None
 
     def iter_frames(self):
@@ -163,7 +209,41 @@ class AnimationDecoder:
 
         self._seek_to_start()
         for i, frame in enumerate(self._container.decode(video=0)):
-            yield i, frame.to_ndarray(format="rgba")
+            yield i, self._to_rgba(frame)
+
+    def iter_frames_from(self, start: int):
+        """Iterate (index, rgba_array) tuples from frame *start* on.
+
+        Seeks to the last keyframe at or before *start* and decodes forward,
+        converting only the frames from *start* on.  Indices after a seek
+        come from presentation timestamps, which assumes a constant frame
+        rate; if the container can't seek, decoding starts from the top.
+        """
+        if not self._container or not self._info:
+            raise RuntimeError("Decoder not opened. Call open() first.")
+
+        stream = self._stream
+        fps = self._info.fps
+        origin = stream.start_time or 0
+        use_pts = start > 0 and bool(stream.time_base) and fps > 0
+        if use_pts:
+            try:
+                self._container.seek(
+                    origin + int(start / fps / stream.time_base), stream=stream,
+                )
+            except av.error.FFmpegError:
+                use_pts = False
+        if not use_pts:
+            self._seek_to_start()
+
+        i = -1
+        for frame in self._container.decode(video=0):
+            if use_pts and frame.pts is not None:
+                i = round(float((frame.pts - origin) * stream.time_base) * fps)
+            else:
+                i += 1
+            if i >= start:
+                yield i, self._to_rgba(frame)
 
     def close(self) -> None:
         """Release decoder resources."""
@@ -171,6 +251,7 @@ class AnimationDecoder:
             self._container.close()
             self._container = None
         self._stream = None
+        self._reformatter = None
 
     def __enter__(self):
         self.open()
@@ -0,0 +1,113 @@
+"""Eviction policies for the frame cache."""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+
+class EvictionPolicy(ABC):
+    """Tracks cache keys and picks which one to evict next.
+
+    FrameCache reports every insert, hit and removal; select_victim() is
+    asked for a key when the cache needs room.
+    """
+
+    @abstractmethod
+    def on_insert(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def on_access(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def on_remove(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def select_victim(self, exclude: set[str]) -> str | None:
+        """Return the key to evict, skipping *exclude*, or None if none qualify."""
+
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """Evict the least recently used key."""
+
+    def __init__(self) -> None:
+        # Insertion-ordered: first key is least recently used
+        self._order: dict[str, None] = {}
+
+    def on_insert(self, key: str) -> None:
+        self._order.pop(key, None)
+        self._order[key] = None
+
+    def on_access(self, key: str) -> None:
+        self._order.pop(key, None)
+        self._order[key] = None
+
+    def on_remove(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def clear(self) -> None:
+        self._order.clear()
+
+    def select_victim(self, exclude: set[str]) -> str | None:
+        return next((k for k in self._order if k not in exclude), None)
+
+
+class LFUEvictionPolicy(EvictionPolicy):
+    """Evict the least frequently used key; ties go to the oldest insert.
+
+    Suits looping playback where one state (e.g. talking) dominates and
+    should survive occasional visits to rarely used states.
+    """
+
+    def __init__(self) -> None:
+        self._hits: dict[str, int] = {}
+
+    def on_insert(self, key: str) -> None:
+        self._hits.pop(key, None)
+        self._hits[key] = 0
+
+    def on_access(self, key: str) -> None:
+        if key in self._hits:
+            self._hits[key] += 1
+
+    def on_remove(self, key: str) -> None:
+        self._hits.pop(key, None)
+
+    def clear(self) -> None:
+        self._hits.clear()
+
+    def select_victim(self, exclude: set[str]) -> str | None:
+        victim: str | None = None
+        fewest = 0
+        for key, hits in self._hits.items():
+            if key in exclude:
+                continue
+            if victim is None or hits < fewest:
+                victim, fewest = key, hits
+        return victim
+
+
+_POLICIES: dict[str, type[EvictionPolicy]] = {
+    "lru": LRUEvictionPolicy,
+    "lfu": LFUEvictionPolicy,
+}
+
+EVICTION_POLICIES = tuple(_POLICIES)
+
+
+def make_eviction_policy(name: str) -> EvictionPolicy:
+    """Create an eviction policy by config name, falling back to LRU."""
+    cls = _POLICIES.get(name.lower())
+    if cls is None:
+        logger.warning("Unknown cache eviction policy '%s', using LRU", name)
+        cls = LRUEvictionPolicy
+    return cls()
@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import logging
+import threading
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
 
+from nixchirp.assets import pool
 from nixchirp.assets.decoder import AnimationDecoder, AnimationInfo
+from nixchirp.assets.pixels import expand_to_rgba, quantize_frames
+from nixchirp.constants import (
+    CACHE_FORMAT_RGBA8,
+    DEFAULT_CACHE_FORMAT,
+    DEFAULT_STREAM_RING_FRAMES,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,23 +27,295 @@ class LoadedAnimation:
     """A fully loaded animation ready for playback."""
 
     info: AnimationInfo
-    frames: list[np.ndarray]
-    frame_duration_ms: float  # Duration per frame based on FPS
+    frames: np.ndarray  # (N, H, W, 4) uint8, (N, H, W) uint16 if packed, uint8 if PAL8
+    frame_duration_ms: float  # Duration per frame based on FPS (always > 0)
+    pixel_format: str = CACHE_FORMAT_RGBA8
+    palette: np.ndarray | None = None  # (256, 4) RGBA, PAL8 only
 
     @property
     def frame_count(self) -> int:
         return len(self.frames)
 
     def get_frame(self, index: int) -> np.ndarray:
-        """Get a frame by index, wrapping around for looping."""
+        """Get a frame by index, wrapping around for looping.
+
+        Returns a zero-copy view into the packed frame array.
+        """
         return self.frames[index % self.frame_count]
 
+    def get_frame_rgba(self, index: int) -> np.ndarray:
+        """Get a frame by index as (H, W, 4) uint8 RGBA, unpacking if needed."""
+        return expand_to_rgba(self.get_frame(index), self.pixel_format, self.palette)
+
+    @property
+    def last_frame_stale(self) -> bool:
+        """True if the last get_frame() returned a stand-in for the requested frame.
+
+        A stand-in shouldn't be cached as that frame; asking again later
+        returns the real one.
+        """
+        return False
+
+    def close(self) -> None:
+        """Release any resources held beyond the frame data."""
+
+
+class _FrameStream:
+    """Decode-ahead ring behind a StreamingAnimation.
+
+    Kept apart from the animation so the decode thread doesn't keep the
+    animation alive: the stream is closed once the animation is collected.
+    """
+
+    # Longest the constructor waits for the first frame to be decoded
+    _FIRST_FRAME_TIMEOUT_S = 0.25
+
+    def __init__(self, decoder: AnimationDecoder, info: AnimationInfo, ring_size: int) -> None:
+        ring = max(2, min(ring_size, info.frame_count))
+        self.frames = np.zeros((ring, info.height, info.width, 4), dtype=np.uint8)
+        self._name = info.path.name
+        self._decoder = decoder
+        self._ring = ring
+        self.count = info.frame_count
+
+        # Stream positions increase forever; position p holds frame
+        # (p - _origin) % count in ring slot p % ring.  [_start, _end)
+        # is decoded.
+        self._cond = threading.Condition()
+        self._start = 0
+        self._end = 0
+        self._origin = 0
+        self._restart_at: int | None = None
+        self._closed = False
+
+        # Position last returned from the ring (its slot stays protected
+        # while it is _start), and the copy shown while the decoder is behind
+        self._shown: int | None = None
+        self._held = np.zeros(self.frames.shape[1:], dtype=np.uint8)
+        self._stale = False
+
+        self._thread = threading.Thread(
+            target=self._decode_loop, daemon=True, name=f"stream-{info.path.name}",
+        )
+        self._thread.start()
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._end > 0 or self._closed, self._FIRST_FRAME_TIMEOUT_S,
+            )
+            if self._end > 0:
+                # Stand in with a real frame, even before anything is shown
+                np.copyto(self._held, self.frames[0])
+
+    def get_frame(self, index: int) -> np.ndarray:
+        """Get a frame by index without waiting for the decoder.
+
+        If the frame isn't decoded yet, the last frame returned is returned
+        again and stale is set.  The returned view stays valid
+        until the next get_frame() call.
+        """
+        with self._cond:
+            count = self.count
+            # First position at or after the read head that holds this frame
+            start_frame = (self._start - self._origin) % count
+            pos = self._start + (index % count - start_frame) % count
+            restart = pos - self._start >= self._ring
+            ready = not restart and self._end > pos
+
+            if not ready and self._shown is not None:
+                # Keep the current picture before its slot can be reused
+                np.copyto(self._held, self.frames[self._shown % self._ring])
+                self._shown = None
+
+            if restart:
+                # Too far ahead to decode into the ring; seek there
+                self._start = self._end = pos
+                self._restart_at = pos
+            elif pos > self._start:
+                self._start = pos  # Frees the slots before pos
+            self._cond.notify_all()
+
+            self._stale = not ready
+            if not ready:
+                logger.debug("Streaming decode behind for %s", self._name)
+                return self._held
+            self._shown = pos
+            return self.frames[pos % self._ring]
+
+    @property
+    def stale(self) -> bool:
+        """True if the last get_frame() returned the held stand-in."""
+        return self._stale
+
+    def close(self) -> None:
+        """Stop the decode thread; it closes the decoder on its way out.
+
+        Safe to call more than once.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+
+    def _put(self, pos: int, rgba: np.ndarray) -> bool:
+        """Store a decoded frame at *pos* once the ring has room for it.
+
+        Positions the read head has already passed are dropped.  Returns
+        False if the stream was closed or restarted meanwhile.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._closed or self._restart_at is not None
+                or pos < self._start + self._ring
+            )
+            if self._closed or self._restart_at is not None:
+                return False
+            if pos < self._start:
+                return True
+        self.frames[pos % self._ring] = rgba
+        with self._cond:
+            if self._restart_at is None and pos >= self._start:
+                self._end = pos + 1
+                self._cond.notify_all()
+        return True
 
-def load_animation(path: str | Path) -> LoadedAnimation:
+    def _decode_loop(self) -> None:
+        """Worker thread: decode sequentially into the ring, wrapping at the end."""
+        pos = 0
+        frames = None
+        last_index: int | None = None  # Last frame index seen this pass
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self._closed or self._restart_at is not None
+                        or pos < self._start + self._ring
+                    )
+                    if self._closed:
+                        return
+                    if self._restart_at is not None:
+                        pos = self._restart_at
+                        self._restart_at = None
+                        frames = None
+                    count = self.count
+                    expected = (pos - self._origin) % count
+
+                if frames is None:
+                    frames = self._decoder.iter_frames_from(expected)
+                    last_index = None
+
+                item = next(frames, None)
+                if item is None:
+                    frames = None
+                    if last_index is None and expected == 0:
+                        raise ValueError("stream has no frames")
+                    if last_index is not None and last_index + 1 < count:
+                        # Fewer frames than the container reported: clamp,
+                        # and number from frame 0 again at this position
+                        logger.info(
+                            "%s has %d frames, not %d",
+                            self._name, last_index + 1, count,
+                        )
+                        with self._cond:
+                            self.count = last_index + 1
+                            self._origin = pos
+                            if self._restart_at is None:
+                                self._start = self._end = pos
+                    else:
+                        # End of stream (or a seek past it): wrap to the next loop
+                        pos += (-expected) % count
+                    continue
+
+                index, rgba = item
+                last_index = index
+                if index >= count:
+                    # More frames than reported; wrap to the next loop
+                    pos += (-expected) % count
+                    frames = None
+                    continue
+                if index < expected:
+                    continue
+
+                # A gap in the timestamps holds this frame over the missing ones
+                for _ in range(index - expected + 1):
+                    if not self._put(pos, rgba):
+                        break  # Closed or restarted; handled at the top
+                    pos += 1
+        except Exception:
+            logger.exception("Streaming decode failed for %s", self._name)
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+        finally:
+            self._decoder.close()
+
+
+class StreamingAnimation(LoadedAnimation):
+    """An animation decoded on demand into a small ring of frames.
+
+    A worker thread keeps the decoder open and decodes ahead of playback
+    into ``frames``, a (ring_size, H, W, 4) uint8 ring, blocking when the
+    ring is full.  Sequential playback (including whole-frame skips) reads
+    straight from the ring; a jump outside it makes the decoder seek to
+    the nearest keyframe before the requested frame.  get_frame() never
+    waits: until the decoder catches up it returns the last frame it
+    returned.  Frames are always RGBA8.
+
+    The frame count starts from the container's metadata and is lowered
+    if the stream turns out to end sooner.  The decoder stays open until
+    close() or until the animation is no longer referenced, so evicting
+    it from the cache doesn't stop one that is still playing.
+    """
+
+    def __init__(
+        self,
+        decoder: AnimationDecoder,
+        info: AnimationInfo,
+        frame_duration_ms: float,
+        ring_size: int = DEFAULT_STREAM_RING_FRAMES,
+    ) -> None:
+        stream = _FrameStream(decoder, info, ring_size)
+        super().__init__(info=info, frames=stream.frames, frame_duration_ms=frame_duration_ms)
+        self._stream = stream
+        self._finalizer = weakref.finalize(self, stream.close)
+        self._finalizer.atexit = False
+
+    @property
+    def frame_count(self) -> int:
+        return self._stream.count
+
+    def get_frame(self, index: int) -> np.ndarray:
+        """Get a frame by index without waiting for the decoder.
+
+        If the frame isn't decoded yet, the last frame returned is returned
+        again and last_frame_stale is set.  The returned view stays valid
+        until the next get_frame() call.
+        """
+        return self._stream.get_frame(index)
+
+    def get_frame_rgba(self, index: int) -> np.ndarray:
+        return self._stream.get_frame(index)
+
+    @property
+    def last_frame_stale(self) -> bool:
+        return self._stream.stale
+
+    def close(self) -> None:
+        """Stop decoding now rather than when the animation is collected."""
+        self._finalizer()
+
+
+def load_animation(
+    path: str | Path,
+    cache_format: str = DEFAULT_CACHE_FORMAT,
+    stream_above_bytes: int = 0,
+) -> LoadedAnimation:
     """Load an animation file, decoding all frames into memory.
 
     Args:
         path: Path to a GIF, APNG, WebM, or MP4 file.
+        cache_format: Pixel format to store frames in (see assets.pixels).
+        stream_above_bytes: If non-zero, animations whose fully decoded size
+            would exceed this are returned as a StreamingAnimation instead.
 
     Returns:
         LoadedAnimation with all frames decoded as RGBA arrays.
@@ -42,23 +323,44 @@ def load_animation(path: str | Path) -> LoadedAnimation:
     path = Path(path)
     logger.info("Loading animation: %s", path)
 
-    with AnimationDecoder(path) as decoder:
-        info = decoder.info
-        assert info is not None
+    decoder = AnimationDecoder(path)
+    info = decoder.open()
+    frame_duration_ms = 1000.0 / info.fps if info.fps > 0 else 33.33
+
+    full_bytes = info.frame_count * info.width * info.height * 4
+    if stream_above_bytes and full_bytes > stream_above_bytes and info.frame_count > 1:
+        logger.info(
+            "Streaming %d frames (%dx%d, %.0f MB decoded) from %s",
+            info.frame_count, info.width, info.height, full_bytes / (1024 * 1024), path.name,
+        )
+        return StreamingAnimation(decoder, info, frame_duration_ms)
+
+    try:
         frames = decoder.decode_all_frames()
+    finally:
+        decoder.close()
 
-    if not frames:
+    if frames.shape[0] == 0:
         raise ValueError(f"No frames decoded from {path}")
 
-    frame_duration_ms = 1000.0 / info.fps if info.fps > 0 else 33.33
+    rgba = frames
+    frames, pixel_format, palette = quantize_frames(rgba, cache_format)
+    if frames is not rgba:
+        pool.release(rgba)  # Only needed as the packing source
 
     logger.info(
         "Loaded %d frames (%dx%d) at %.1f FPS from %s",
         len(frames), info.width, info.height, info.fps, path.name,
     )
 
-    return LoadedAnimation(
+    animation = LoadedAnimation(
         info=info,
         frames=frames,
         frame_duration_ms=frame_duration_ms,
+        pixel_format=pixel_format,
+        palette=palette,
     )
+    # Recycle the frame buffer once the animation is really gone (evicted
+    # and no longer playing), not merely dropped from the cache.
+    weakref.finalize(animation, pool.release, frames).atexit = False
+    return animation
@@ -0,0 +1,146 @@
+"""Packed 16-bit and palettized pixel formats for cached animation frames."""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+
+from nixchirp.assets import pool
+from nixchirp.constants import (
+    CACHE_FORMAT_PAL8,
+    CACHE_FORMAT_RGB565,
+    CACHE_FORMAT_RGBA4444,
+    CACHE_FORMAT_RGBA8,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMATS = (
+    CACHE_FORMAT_RGBA8, CACHE_FORMAT_RGB565, CACHE_FORMAT_RGBA4444, CACHE_FORMAT_PAL8,
+)
+
+
+def _pack_rgb565(src: np.ndarray, dst: np.ndarray) -> None:
+    """Pack one (H, W, 4) uint8 frame into (H, W) uint16 RGB565."""
+    r = src[:, :, 0].astype(np.uint16)
+    g = src[:, :, 1].astype(np.uint16)
+    b = src[:, :, 2].astype(np.uint16)
+    np.right_shift(r, 3, out=r)
+    np.left_shift(r, 11, out=dst)
+    np.right_shift(g, 2, out=g)
+    np.left_shift(g, 5, out=g)
+    dst |= g
+    np.right_shift(b, 3, out=b)
+    dst |= b
+
+
+def _pack_rgba4444(src: np.ndarray, dst: np.ndarray) -> None:
+    """Pack one (H, W, 4) uint8 frame into (H, W) uint16 RGBA4444."""
+    dst[...] = 0
+    for channel, shift in ((0, 12), (1, 8), (2, 4), (3, 0)):
+        c = src[:, :, channel].astype(np.uint16)
+        np.right_shift(c, 4, out=c)
+        if shift:
+            np.left_shift(c, shift, out=c)
+        dst |= c
+
+
+def palettize_frames(frames: np.ndarray) -> tuple[np.ndarray, np.ndarray] | None:
+    """Losslessly index (N, H, W, 4) RGBA frames against a shared palette.
+
+    Returns (indices, palette) — (N, H, W) uint8 and (256, 4) uint8 RGBA —
+    or None as soon as the animation turns out to use more than 256 colors.
+    """
+    # One uint32 per pixel so whole RGBA values compare at once
+    packed = frames.view(np.uint32)[..., 0]
+    colors = np.empty(0, dtype=np.uint32)
+    for i in range(packed.shape[0]):
+        colors = np.union1d(colors, np.unique(packed[i]))
+        if colors.size > 256:
+            return None
+
+    indices = pool.acquire(packed.shape)
+    for i in range(packed.shape[0]):
+        indices[i] = np.searchsorted(colors, packed[i])
+
+    palette = np.zeros((256, 4), dtype=np.uint8)
+    palette[:colors.size] = colors.view(np.uint8).reshape(-1, 4)
+    return indices, palette
+
+
+def quantize_frames(
+    frames: np.ndarray, cache_format: str,
+) -> tuple[np.ndarray, str, np.ndarray | None]:
+    """Convert packed (N, H, W, 4) RGBA frames to the requested cache format.
+
+    RGB565 has no alpha channel, so animations with any transparency stay
+    in RGBA8 rather than losing their alpha.  Likewise PAL8 is only used
+    when the animation has at most 256 distinct colors.
+
+    Returns:
+        (frames, pixel_format, palette) — the converted array, the format
+        it is in, and the (256, 4) palette for PAL8 (else None).
+    """
+    if cache_format == CACHE_FORMAT_RGBA8:
+        return frames, CACHE_FORMAT_RGBA8, None
+
+    if cache_format == CACHE_FORMAT_PAL8:
+        result = palettize_frames(frames)
+        if result is None:
+            logger.info("Animation has more than 256 colors — keeping RGBA8 instead of PAL8")
+            return frames, CACHE_FORMAT_RGBA8, None
+        return result[0], CACHE_FORMAT_PAL8, result[1]
+
+    if cache_format == CACHE_FORMAT_RGB565:
+        if not (frames[..., 3] == 255).all():
+            logger.info("Animation has transparency — keeping RGBA8 instead of RGB565")
+            return frames, CACHE_FORMAT_RGBA8, None
+        pack = _pack_rgb565
+    elif cache_format == CACHE_FORMAT_RGBA4444:
+        pack = _pack_rgba4444
+    else:
+        logger.warning("Unknown cache format '%s', using %s", cache_format, CACHE_FORMAT_RGBA8)
+        return frames, CACHE_FORMAT_RGBA8, None
+
+    # Convert frame by frame to keep temporaries at single-frame size
+    packed = pool.acquire(frames.shape[:3], np.uint16)
+    for i in range(frames.shape[0]):
+        pack(frames[i], packed[i])
+    return packed, cache_format, None
+
+
+def expand_to_rgba(
+    frame: np.ndarray,
+    pixel_format: str,
+    palette: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Expand a single packed frame back to (H, W, 4) uint8 RGBA.
+
+    *palette* is required for PAL8.  If *out* is given (and the format
+    isn't already RGBA8) the result is written into it.
+    """
+    if pixel_format == CACHE_FORMAT_RGBA8:
+        return frame
+    if pixel_format == CACHE_FORMAT_PAL8:
+        assert palette is not None
+        return np.take(palette, frame, axis=0, out=out)
+
+    if out is None:
+        out = np.empty(frame.shape + (4,), dtype=np.uint8)
+    if pixel_format == CACHE_FORMAT_RGB565:
+        r = (frame >> 11) & 0x1F
+        g = (frame >> 5) & 0x3F
+        b = frame & 0x1F
+        out[:, :, 0] = (r << 3) | (r >> 2)
+        out[:, :, 1] = (g << 2) | (g >> 4)
+        out[:, :, 2] = (b << 3) | (b >> 2)
+        out[:, :, 3] = 255
+    elif pixel_format == CACHE_FORMAT_RGBA4444:
+        for channel, shift in ((0, 12), (1, 8), (2, 4), (3, 0)):
+            c = (frame >> shift) & 0xF
+            out[:, :, channel] = (c << 4) | c
+    else:
+        raise ValueError(f"Unknown pixel format: {pixel_format}")
+    return out
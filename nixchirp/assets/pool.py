@@ -0,0 +1,79 @@
+"""Free-list of frame buffers reused across animation loads."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Buffers kept per (shape, dtype).  Whole animations are large, so only a
+# couple are worth holding onto — enough to cover a group toggle.
+_MAX_PER_KEY = 2
+
+_pool: dict[tuple[tuple[int, ...], np.dtype], list[np.ndarray]] = defaultdict(list)
+# Total bytes pooled, and the most that may be.  Nothing is pooled until a
+# FrameCache hands over the part of its budget its entries aren't using.
+_held_bytes = 0
+_max_bytes = 0
+_lock = threading.Lock()  # Preload decodes on worker threads
+
+
+def acquire(shape: tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+    """Return an uninitialized array, reusing a pooled buffer if one fits."""
+    global _held_bytes
+    dtype = np.dtype(dtype)
+    with _lock:
+        free = _pool.get((shape, dtype))
+        if free:
+            buf = free.pop()
+            _held_bytes -= buf.nbytes
+            return buf
+    return np.empty(shape, dtype=dtype)
+
+
+def release(buf: np.ndarray) -> None:
+    """Hand a buffer back to the pool. The caller must not use it afterwards.
+
+    Views and non-contiguous arrays are ignored, since their memory
+    belongs to another array, as is anything that would exceed the limit.
+    """
+    global _held_bytes
+    if buf.base is not None or not buf.flags.c_contiguous:
+        return
+    with _lock:
+        if _held_bytes + buf.nbytes > _max_bytes:
+            return
+        free = _pool[(buf.shape, buf.dtype)]
+        if len(free) < _MAX_PER_KEY:
+            free.append(buf)
+            _held_bytes += buf.nbytes
+
+
+def held_bytes() -> int:
+    """Total size of the pooled buffers."""
+    return _held_bytes
+
+
+def set_limit(max_bytes: int) -> None:
+    """Cap the pooled bytes, dropping buffers until they fit."""
+    global _held_bytes, _max_bytes
+    with _lock:
+        _max_bytes = max(0, max_bytes)
+        for key in list(_pool):
+            free = _pool[key]
+            while free and _held_bytes > _max_bytes:
+                _held_bytes -= free.pop().nbytes
+            if not free:
+                del _pool[key]
+
+
+def clear() -> None:
+    """Drop all pooled buffers."""
+    global _held_bytes
+    with _lock:
+        _pool.clear()
+        _held_bytes = 0
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
@@ -19,12 +20,15 @@ else:
     import tomli as tomllib
 
 from nixchirp.constants import (
+    DEFAULT_CACHE_FORMAT,
     DEFAULT_CACHE_MAX_MB,
+    DEFAULT_CACHE_POLICY,
     DEFAULT_FPS_CAP,
     DEFAULT_MIC_CLOSE_THRESHOLD,
     DEFAULT_MIC_HOLD_TIME_MS,
     DEFAULT_MIC_OPEN_THRESHOLD,
     DEFAULT_SLEEP_TIMEOUT_SECONDS,
+    DEFAULT_STREAM_THRESHOLD_MB,
     DEFAULT_WINDOW_HEIGHT,
     DEFAULT_WINDOW_WIDTH,
     OUTPUT_WINDOWED,
@@ -119,6 +123,43 @@ class GeneralConfig:
     sleep_state: str = ""  # state to transition to when asleep ("" = disabled)
     fps_cap: int = DEFAULT_FPS_CAP
     cache_max_mb: int = DEFAULT_CACHE_MAX_MB
+    cache_format: str = DEFAULT_CACHE_FORMAT  # rgba8, rgb565, rgba4444, or pal8
+    cache_policy: str = DEFAULT_CACHE_POLICY  # lru or lfu
+    stream_threshold_mb: int = DEFAULT_STREAM_THRESHOLD_MB  # 0 = always decode fully
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values; anything else a hand-edited profile holds is kept as is."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _make_loader(cls, **default_overrides):
+    """Build a function that constructs the dataclass *cls* from a TOML table.
+
+    Field defaults are collected once here, so each call is a dict copy
+    and update instead of one .get() per field.  Unknown keys are ignored.
+    """
+    defaults = {}
+    for f in fields(cls):
+        assert f.default is not MISSING, f"{cls.__name__}.{f.name} has no default"
+        defaults[f.name] = f.default
+    defaults.update(default_overrides)
+
+    def load(data: dict[str, Any]):
+        kwargs = defaults.copy()
+        kwargs.update({k: data[k] for k in data.keys() & defaults.keys()})
+        return cls(**kwargs)
+
+    return load
+
+
+_load_general = _make_loader(GeneralConfig)
+_load_output = _make_loader(OutputConfig)
+_load_mic = _make_loader(MicConfig)
+_load_transitions = _make_loader(TransitionConfig)
+_load_state_group = _make_loader(StateGroupConfig)
+_load_midi_mapping = _make_loader(MidiMappingConfig, action="set_state")
+_load_hotkey = _make_loader(HotkeyConfig)
 
 
 @dataclass
@@ -146,83 +187,47 @@ class AppConfig:
     def _from_dict(cls, data: dict[str, Any], config_path: Path | None = None) -> AppConfig:
         """Build config from a parsed TOML dict."""
         general_data = data.get("general", {})
-        general = GeneralConfig(
-            profile_name=general_data.get("profile_name", "Default"),
-            sleep_timeout_seconds=general_data.get(
-                "sleep_timeout_seconds",
-                general_data.get("idle_timeout_seconds", DEFAULT_SLEEP_TIMEOUT_SECONDS),
-            ),
-            sleep_state=general_data.get("sleep_state", ""),
-            fps_cap=general_data.get("fps_cap", DEFAULT_FPS_CAP),
-            cache_max_mb=general_data.get("cache_max_mb", DEFAULT_CACHE_MAX_MB),
-        )
-
-        output_data = data.get("output", {})
-        res = output_data.get("resolution", [DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT])
-        output = OutputConfig(
-            mode=output_data.get("mode", OUTPUT_WINDOWED),
-            chroma_color=output_data.get("chroma_color", "#00FF00"),
-            resolution=(res[0], res[1]),
-            virtual_cam_device=output_data.get("virtual_cam_device", "/dev/video10"),
-        )
-
-        mic_data = data.get("mic", {})
-        mic = MicConfig(
-            device=mic_data.get("device", "default"),
-            open_threshold=mic_data.get("open_threshold", DEFAULT_MIC_OPEN_THRESHOLD),
-            close_threshold=mic_data.get("close_threshold", DEFAULT_MIC_CLOSE_THRESHOLD),
-            hold_time_ms=mic_data.get("hold_time_ms", DEFAULT_MIC_HOLD_TIME_MS),
-            idle_state=mic_data.get("idle_state", ""),
-            active_state=mic_data.get("active_state", ""),
-            intense_state=mic_data.get("intense_state", ""),
-            intense_threshold=mic_data.get("intense_threshold", 0.4),
-        )
-
-        trans_data = data.get("transitions", {})
-        transitions = TransitionConfig(
-            default_type=trans_data.get("default_type", "cut"),
-            default_duration_ms=trans_data.get("default_duration_ms", 80),
-        )
-
+        general = _load_general(general_data)
+        if "sleep_timeout_seconds" not in general_data and "idle_timeout_seconds" in general_data:
+            # Pre-rename profiles
+            general.sleep_timeout_seconds = general_data["idle_timeout_seconds"]
+
+        output = _load_output(data.get("output", {}))
+        res = output.resolution
+        output.resolution = (res[0], res[1])
+
+        mic = _load_mic(data.get("mic", {}))
+        mic.idle_state = _intern(mic.idle_state)
+        mic.active_state = _intern(mic.active_state)
+        mic.intense_state = _intern(mic.intense_state)
+        transitions = _load_transitions(data.get("transitions", {}))
+
+        # State, group and file names are lookup keys for the whole run, so
+        # intern them: states sharing a file or name then share one string
+        # object and dict lookups can match on identity.
         states = []
         for s in data.get("states", []):
             states.append(StateConfig(
-                name=s["name"],
-                file=s["file"],
+                name=_intern(s["name"]),
+                file=_intern(s["file"]),
                 loop=s.get("loop", True),
                 speed=s.get("speed", 1.0),
-                group=s.get("group", ""),
+                group=_intern(s.get("group", "")),
             ))
 
-        state_groups = []
-        for sg in data.get("state_groups", []):
-            state_groups.append(StateGroupConfig(
-                name=sg.get("name", ""),
-                idle_state=sg.get("idle_state", ""),
-                active_state=sg.get("active_state", ""),
-                intense_state=sg.get("intense_state", ""),
-            ))
+        state_groups = [_load_state_group(sg) for sg in data.get("state_groups", [])]
+        for sg in state_groups:
+            sg.name = _intern(sg.name)
+            sg.idle_state = _intern(sg.idle_state)
+            sg.active_state = _intern(sg.active_state)
+            sg.intense_state = _intern(sg.intense_state)
 
-        midi_mappings = []
-        midi_data = data.get("midi", {})
-        for m in midi_data.get("mappings", []):
-            midi_mappings.append(MidiMappingConfig(
-                device=m.get("device", ""),
-                event_type=m.get("event_type", "note_on"),
-                channel=m.get("channel", 0),
-                note=m.get("note", 0),
-                action=m.get("action", "set_state"),
-                target=m.get("target", ""),
-                mode=m.get("mode", "momentary"),
-            ))
-
-        hotkeys = []
-        for h in data.get("hotkeys", []):
-            hotkeys.append(HotkeyConfig(
-                keys=h.get("keys", ""),
-                action=h.get("action", "set_group"),
-                target=h.get("target", ""),
-            ))
+        midi_mappings = [
+            _load_midi_mapping(m) for m in data.get("midi", {}).get("mappings", [])
+        ]
+        hotkeys = [_load_hotkey(h) for h in data.get("hotkeys", [])]
+        for mapping in (*midi_mappings, *hotkeys):
+            mapping.target = _intern(mapping.target)
 
         return cls(
             general=general,
@@ -251,6 +256,9 @@ class AppConfig:
                 "sleep_state": self.general.sleep_state,
                 "fps_cap": self.general.fps_cap,
                 "cache_max_mb": self.general.cache_max_mb,
+                "cache_format": self.general.cache_format,
+                "cache_policy": self.general.cache_policy,
+                "stream_threshold_mb": self.general.stream_threshold_mb,
             },
             "output": {
                 "mode": self.output.mode,
@@ -315,11 +323,30 @@ class AppConfig:
         }
 
 
+def parse_hex_color(
+    value: str, default: tuple[int, int, int] = (0, 255, 0),
+) -> tuple[int, int, int]:
+    """Parse a ``#RRGGBB`` color string into an (r, g, b) tuple of 0-255 ints.
+
+    Returns *default* if the string is malformed.
+    """
+    hex_color = value.lstrip("#")
+    if len(hex_color) < 6:
+        return default
+    try:
+        packed = int(hex_color[:6], 16)
+    except ValueError:
+        return default
+    return (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF
+
+
+@functools.cache
 def get_config_dir() -> Path:
     """Return the XDG config directory for NixChirp.
 
     Uses $XDG_CONFIG_HOME/nixchirp if set, otherwise ~/.config/nixchirp.
     Creates the directory (and profiles/ subdirectory) if they don't exist.
+    Resolved once per process.
     """
     xdg = os.environ.get("XDG_CONFIG_HOME")
     if xdg:
@@ -327,10 +354,25 @@ def get_config_dir() -> Path:
     else:
         base = Path.home() / ".config" / "nixchirp"
     profiles_dir = base / "profiles"
-    profiles_dir.mkdir(parents=True, exist_ok=True)
+    if not profiles_dir.is_dir():
+        profiles_dir.mkdir(parents=True, exist_ok=True)
     return base
 
 
+@functools.cache
+def get_cache_dir() -> Path:
+    """Return the XDG cache directory for NixChirp.
+
+    Uses $XDG_CACHE_HOME/nixchirp if set, otherwise ~/.cache/nixchirp.
+    Not created here; writers create the subdirectories they need.
+    """
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    if xdg:
+        return Path(xdg) / "nixchirp"
+    return Path.home() / ".cache" / "nixchirp"
+
+
+@functools.cache
 def get_profiles_dir() -> Path:
     """Return the default profiles directory."""
     return get_config_dir() / "profiles"
@@ -344,9 +386,24 @@ def list_profiles() -> list[Path]:
     return sorted(profiles_dir.glob("*.toml"))
 
 
+@functools.lru_cache(maxsize=16)
+def _parse_profile(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a profile's TOML, memoized on path and modification time.
+
+    Treat the result as read-only; it is shared between callers.
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def load_profile(path: Path) -> AppConfig:
-    """Load a profile from a TOML file."""
-    return AppConfig.from_toml(path)
+    """Load a profile from a TOML file.
+
+    The parsed TOML is reused while the file is unchanged; each call
+    still builds a fresh AppConfig, so callers may modify it freely.
+    """
+    data = _parse_profile(str(path), path.stat().st_mtime_ns)
+    return AppConfig._from_dict(data, config_path=path)
 
 
 def get_default_config() -> AppConfig:
@@ -12,6 +12,14 @@ CHROMA_GREEN = (0.0, 1.0, 0.0, 1.0)       # #00FF00
 
 # Frame cache
 DEFAULT_CACHE_MAX_MB = 512
+CACHE_FORMAT_RGBA8 = "rgba8"        # 32-bit, lossless
+CACHE_FORMAT_RGB565 = "rgb565"      # 16-bit, opaque animations only
+CACHE_FORMAT_RGBA4444 = "rgba4444"  # 16-bit, 4 bits per channel
+CACHE_FORMAT_PAL8 = "pal8"          # 8-bit indices, animations with <= 256 colors
+DEFAULT_CACHE_FORMAT = CACHE_FORMAT_RGBA8
+DEFAULT_CACHE_POLICY = "lru"  # lru or lfu
+DEFAULT_STREAM_THRESHOLD_MB = 256  # Stream animations larger than this when decoded (0 = never)
+DEFAULT_STREAM_RING_FRAMES = 16  # Frames decoded ahead for a streamed animation
 
 # Animation
 DEFAULT_SPEED_MULTIPLIER = 1.0
@@ -0,0 +1,16 @@
+"""Shared ImGui text colors for the settings panels.
+
+Built once at import so panels don't construct an ImVec4 per widget per frame.
+"""
+
+from __future__ import annotations
+
+from imgui_bundle import imgui
+
+RED = imgui.ImVec4(1.0, 0.4, 0.4, 1.0)          # Errors, unavailable
+GREEN = imgui.ImVec4(0.4, 1.0, 0.4, 1.0)        # Active, OK
+AMBER = imgui.ImVec4(1.0, 0.8, 0.3, 1.0)        # Warnings
+GRAY = imgui.ImVec4(0.6, 0.6, 0.6, 1.0)         # Hints, disabled
+CYAN = imgui.ImVec4(0.4, 0.8, 1.0, 1.0)         # Active group, headings
+LIGHT_BLUE = imgui.ImVec4(0.7, 0.9, 1.0, 1.0)   # Bound shortcuts
+YELLOW = imgui.ImVec4(1.0, 1.0, 0.0, 1.0)       # MIDI learn prompt
@@ -3,11 +3,58 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from imgui_bundle import imgui
 
-_EXTENSIONS = {".gif", ".apng", ".png", ".webm"}
+from nixchirp.gui import colors
+
+# A tuple so scans can test names with str.endswith()
+_EXTENSIONS = (".gif", ".apng", ".png", ".webm")
+
+_WINDOW_SIZE = imgui.ImVec2(550, 450)
+_LIST_SIZE = imgui.ImVec2(0, -30)  # Full width, leaving room for Cancel
+_COND_FIRST_USE = imgui.Cond_.first_use_ever.value
+
+# (mtime_ns, rows to show as (label, is_dir, path)); rows None if unreadable
+_Listing = tuple[int, "list[tuple[str, bool, str]] | None"]
+
+# Directory scans run here so a slow mount never stalls the GUI thread
+_scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="filebrowser")
+
+
+def _scan_dir(path: Path, cached: _Listing | None) -> _Listing:
+    """Worker: list *path*, reusing *cached* if the directory is unchanged."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    if cached is not None and cached[0] == mtime_ns:
+        return cached
+    dirs: list[tuple[str, str]] = []
+    files: list[tuple[str, str]] = []
+    try:
+        # DirEntry.is_dir() uses the type from the directory read
+        # itself, so only symlinks cost an extra stat
+        with os.scandir(path) as it:
+            for e in it:
+                name = e.name
+                if name.startswith("."):
+                    continue
+                if e.is_dir():
+                    dirs.append((name, e.path))
+                elif name.lower().endswith(_EXTENSIONS):
+                    files.append((name, e.path))
+    except OSError:
+        return mtime_ns, None
+
+    # Filtered, sorted and labelled once here; draw() just walks the rows
+    dirs.sort(key=lambda t: t[0].lower())
+    files.sort(key=lambda t: t[0].lower())
+    rows = [(f"[{name}]", True, p) for name, p in dirs]
+    rows.extend((name, False, p) for name, p in files)
+    return mtime_ns, rows
 
 
 class FileBrowser:
@@ -15,10 +62,17 @@ class FileBrowser:
 
     def __init__(self) -> None:
         self._open = False
-        self._current_dir = Path.home()
+        self._current_dir: Path
+        self._current_dir_str: str
+        self._current_parent: Path | None
+        self._set_dir(Path.home())
         self._result: str | None = None
         self._done = False
         self._target_idx: int = -1
+        self._listing_cache: dict[Path, _Listing] = {}
+        self._listing_dir: Path | None = None
+        self._listing: list[tuple[str, bool, str]] | None = None
+        self._scan: tuple[Path, Future[_Listing]] | None = None  # In-flight scan
 
     @property
     def is_open(self) -> bool:
@@ -36,9 +90,16 @@ class FileBrowser:
             if p.is_file():
                 p = p.parent
             if p.is_dir():
-                self._current_dir = p
+                self._set_dir(p)
                 return
-        self._current_dir = Path.home()
+        self._set_dir(Path.home())
+
+    def _set_dir(self, path: Path) -> None:
+        """Switch directory, precomputing what draw() shows for it."""
+        self._current_dir = path
+        self._current_dir_str = str(path)
+        parent = path.parent
+        self._current_parent = parent if parent != path else None
 
     def poll(self) -> tuple[int, str | None] | None:
         """Return (target_idx, path) if done, None if still open."""
@@ -49,53 +110,94 @@ class FileBrowser:
             return result
         return None
 
+    def _get_listing(self) -> list[tuple[str, bool, str]] | None:
+        """Return the current directory's sorted entries, or None if not available.
+
+        Scanning happens on a worker thread, once per visit.  A previously
+        seen directory shows its cached listing straight away while the
+        worker checks its mtime; nothing touches the filesystem again
+        until the user navigates or presses Refresh.
+        """
+        if self._listing_dir != self._current_dir:
+            path = self._current_dir
+            cached = self._listing_cache.get(path)
+            if self._scan is not None:
+                self._scan[1].cancel()  # No-op if it already started
+            self._scan = (path, _scan_executor.submit(_scan_dir, path, cached))
+            self._listing_dir = path
+            self._listing = cached[1] if cached is not None else None
+
+        if self._scan is not None and self._scan[1].done():
+            path, future = self._scan
+            self._scan = None
+            if not future.cancelled():
+                result = future.result()
+                self._listing_cache[path] = result
+                if path == self._listing_dir:
+                    self._listing = result[1]
+
+        return self._listing
+
+    def _refresh(self) -> None:
+        """Drop the cached listing for the current directory."""
+        self._listing_cache.pop(self._current_dir, None)
+        self._listing_dir = None
+
     def draw(self) -> None:
         """Render the file browser window. Call every frame."""
         if not self._open:
             return
 
-        imgui.set_next_window_size(imgui.ImVec2(550, 450), imgui.Cond_.first_use_ever.value)
-        _, opened = imgui.begin("Select Avatar File##filebrowser", True)
+        imgui.set_next_window_size(_WINDOW_SIZE, _COND_FIRST_USE)
+        expanded, opened = imgui.begin("Select Avatar File##filebrowser", True)
         if not opened:
             self._done = True
             imgui.end()
             return
+        if not expanded:
+            # Collapsed or fully clipped: nothing to lay out
+            imgui.end()
+            return
 
         # Current directory path (editable)
-        changed, new_path = imgui.input_text("##dir", str(self._current_dir))
+        changed, new_path = imgui.input_text("##dir", self._current_dir_str)
         if changed:
             p = Path(new_path)
             if p.is_dir():
-                self._current_dir = p
+                self._set_dir(p)
+        imgui.same_line()
+        if imgui.button("Refresh"):
+            self._refresh()
 
         imgui.separator()
 
         # File list
-        imgui.begin_child("##filelist", imgui.ImVec2(0, -30))
-        try:
-            entries = sorted(
-                self._current_dir.iterdir(),
-                key=lambda e: (not e.is_dir(), e.name.lower()),
-            )
-        except PermissionError:
+        imgui.begin_child("##filelist", _LIST_SIZE)
+        entries = self._get_listing()
+        if entries is None:
             entries = []
-            imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), "Permission denied")
+            if self._scan is not None:
+                imgui.text("Loading...")
+            else:
+                imgui.text_colored(colors.RED, "Cannot read directory")
 
         # Parent directory
-        if self._current_dir.parent != self._current_dir:
+        if self._current_parent is not None:
             if imgui.selectable("..##parent", False)[0]:
-                self._current_dir = self._current_dir.parent
-
-        for entry in entries:
-            if entry.name.startswith("."):
-                continue
-            if entry.is_dir():
-                if imgui.selectable(f"[{entry.name}]", False)[0]:
-                    self._current_dir = entry
-            elif entry.suffix.lower() in _EXTENSIONS:
-                if imgui.selectable(entry.name, False)[0]:
-                    self._result = str(entry)
-                    self._done = True
+                self._set_dir(self._current_parent)
+
+        # Only lay out the rows that are actually scrolled into view
+        clipper = imgui.ListClipper()
+        clipper.begin(len(entries))
+        while clipper.step():
+            for i in range(clipper.display_start, clipper.display_end):
+                label, is_dir, entry_path = entries[i]
+                if imgui.selectable(label, False)[0]:
+                    if is_dir:
+                        self._set_dir(Path(entry_path))
+                    else:
+                        self._result = entry_path
+                        self._done = True
 
         imgui.end_child()
 
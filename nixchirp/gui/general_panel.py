@@ -3,27 +3,53 @@
 from __future__ import annotations
 
 import logging
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from imgui_bundle import imgui
 
+from nixchirp import __version__
+from nixchirp.assets.pixels import CACHE_FORMATS
 from nixchirp.config import get_profiles_dir, list_profiles
+from nixchirp.gui import colors
+from nixchirp.gui.widgets import combo_value
 
 if TYPE_CHECKING:
     from nixchirp.app import App
 
 logger = logging.getLogger(__name__)
 
+_VERSION_LABEL = f"NixChirp v{__version__}"
+_CACHE_FORMAT_IDX = {v: i for i, v in enumerate(CACHE_FORMATS)}
+
 # Mutable state for the "Save As" text input
 _save_as_path: str = ""
 _status_message: str = ""
 _status_timer: float = 0.0
 
+# list_profiles() hits the filesystem, so rescan at most this often
+_PROFILES_REFRESH_S = 2.0
+_profiles_cache: list[str] | None = None  # Formatted labels, one per profile
+_profiles_cache_time: float = 0.0
+
+# Labels that rarely change, reformatted only when their inputs do
+_cache_label_key: tuple[int, int, int] | None = None
+_sleep_combo_key: tuple[str, ...] | None = None  # State names the tables below were built from
+_sleep_values: tuple[str, ...] = ("",)
+_sleep_labels: tuple[str, ...] = ("(disabled)",)
+_sleep_index: dict[str, int] = {}
+_cache_label: str = ""
+_loaded_from_path: Path | None = None
+_loaded_from_label: str = ""
 
-def draw_general_panel(app: App) -> None:
+
+def draw_general_panel(app: App, state_names: tuple[str, ...]) -> None:
     """Draw the general settings and profile management panel."""
     global _save_as_path, _status_message, _status_timer
+    global _profiles_cache, _profiles_cache_time
+    global _cache_label_key, _cache_label, _loaded_from_path, _loaded_from_label
+    global _sleep_combo_key, _sleep_values, _sleep_labels, _sleep_index
     config = app.config
 
     # Profile name
@@ -43,16 +69,17 @@ def draw_general_panel(app: App) -> None:
         if app._sleep_timer:
             app._sleep_timer.timeout = float(val)
     if config.general.sleep_timeout_seconds == 0:
-        imgui.text_colored(imgui.ImVec4(0.6, 0.6, 0.6, 1.0), "Sleep disabled")
+        imgui.text_colored(colors.GRAY, "Sleep disabled")
 
     # Sleep state
-    state_names = app._state_machine.state_names
-    target_names = ["(disabled)"] + state_names
-    current = config.general.sleep_state
-    t_idx = target_names.index(current) if current in target_names else 0
-    changed, new_idx = imgui.combo("Sleep state", t_idx, target_names)
-    if changed:
-        config.general.sleep_state = target_names[new_idx] if new_idx > 0 else ""
+    if state_names != _sleep_combo_key:
+        _sleep_combo_key = state_names
+        _sleep_values = ("", *state_names)
+        _sleep_labels = ("(disabled)", *state_names)
+        _sleep_index = {name: i for i, name in enumerate(_sleep_values)}
+    name = combo_value("Sleep state", config.general.sleep_state, _sleep_values, _sleep_labels, _sleep_index)
+    if name is not None:
+        config.general.sleep_state = name
 
     imgui.spacing()
     imgui.separator()
@@ -60,9 +87,19 @@ def draw_general_panel(app: App) -> None:
     imgui.spacing()
 
     # Cache size
-    cache_mb = int(app.cache.current_mb)
-    cache_max = app.cache.max_mb
-    imgui.text(f"Frame cache: {cache_mb} / {cache_max} MB ({app.cache.entry_count} animations)")
+    key = (int(app.cache.current_mb), app.cache.max_mb, app.cache.entry_count)
+    if key != _cache_label_key:
+        _cache_label_key = key
+        _cache_label = f"Frame cache: {key[0]} / {key[1]} MB ({key[2]} animations)"
+    imgui.text(_cache_label)
+
+    # Cache pixel format (applies to animations loaded after the change)
+    current = config.general.cache_format
+    f_idx = _CACHE_FORMAT_IDX.get(current, 0)
+    changed, new_idx = imgui.combo("Cache format", f_idx, CACHE_FORMATS)
+    if changed:
+        config.general.cache_format = CACHE_FORMATS[new_idx]
+        app.cache.cache_format = config.general.cache_format
 
     imgui.spacing()
     imgui.separator()
@@ -71,7 +108,10 @@ def draw_general_panel(app: App) -> None:
 
     # Save to current path
     if config.config_path:
-        imgui.text(f"Loaded from: {config.config_path}")
+        if config.config_path != _loaded_from_path:
+            _loaded_from_path = config.config_path
+            _loaded_from_label = f"Loaded from: {config.config_path}"
+        imgui.text(_loaded_from_label)
         if imgui.button("Save"):
             try:
                 config.to_toml(config.config_path)
@@ -102,36 +142,42 @@ def draw_general_panel(app: App) -> None:
                 config.config_path = path
                 _status_message = f"Saved to {path.name}"
                 _status_timer = 3.0
+                _profiles_cache = None  # May have added a profile
                 logger.info("Config saved to %s", path)
             except Exception as e:
                 _status_message = f"Save failed: {e}"
                 _status_timer = 5.0
                 logger.error("Failed to save config: %s", e)
 
-    # Show saved profiles
-    profiles = list_profiles()
-    if profiles:
-        imgui.spacing()
-        imgui.text("Saved profiles:")
-        for p in profiles:
-            imgui.bullet_text(f"{p.stem}  ({p})")
-        imgui.text_colored(
-            imgui.ImVec4(0.6, 0.6, 0.6, 1.0),
-            "Launch with: nixchirp --profile <path>",
-        )
+    # Saved profiles: only listed (and the directory only rescanned) while
+    # the header is open
+    imgui.spacing()
+    if imgui.collapsing_header("Saved profiles"):
+        now = time.monotonic()
+        if _profiles_cache is None or now - _profiles_cache_time > _PROFILES_REFRESH_S:
+            _profiles_cache = [f"{p.stem}  ({p})" for p in list_profiles()]
+            _profiles_cache_time = now
+        if _profiles_cache:
+            for label in _profiles_cache:
+                imgui.bullet_text(label)
+            imgui.text_colored(
+                colors.GRAY,
+                "Launch with: nixchirp --profile <path>",
+            )
+        else:
+            imgui.text("No saved profiles")
 
     # Status message
     if _status_timer > 0:
         imgui.spacing()
-        imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), _status_message)
+        imgui.text_colored(colors.GREEN, _status_message)
 
     imgui.spacing()
     imgui.separator()
 
     # About
     if imgui.collapsing_header("About"):
-        from nixchirp import __version__
-        imgui.text(f"NixChirp v{__version__}")
+        imgui.text(_VERSION_LABEL)
         imgui.text("Lightweight Linux-first VTuber PNGTubing app")
         imgui.spacing()
         imgui.text("Press F1 to toggle this panel")
@@ -7,87 +7,99 @@ from typing import TYPE_CHECKING
 
 from imgui_bundle import imgui
 
+from nixchirp.config import HotkeyConfig
+from nixchirp.gui import colors
+from nixchirp.input.hotkeys import HotkeyMapping
+
 if TYPE_CHECKING:
     from nixchirp.app import App
 
 logger = logging.getLogger(__name__)
 
+# Combo values and their labels
+_ACTIONS = ("set_group", "set_state")
+_ACTION_LABELS = ("Set Group", "Set State")
+_ACTION_IDX = {v: i for i, v in enumerate(_ACTIONS)}
+
 
-def draw_hotkeys_panel(app: App) -> None:
+def draw_hotkeys_panel(
+    app: App, state_names: tuple[str, ...], group_names: tuple[str, ...],
+) -> None:
     """Draw the hotkeys configuration panel."""
     hotkey_input = app._hotkeys
     config = app.config
 
     # --- Portal status ---
     if hotkey_input is None:
-        imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), "Hotkey system not initialized")
+        imgui.text_colored(colors.RED, "Hotkey system not initialized")
         return
 
     if not hotkey_input.available:
-        imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), "dbus-fast not installed")
+        imgui.text_colored(colors.RED, "dbus-fast not installed")
         imgui.text("Install: pip install dbus-fast")
         return
 
     status = hotkey_input.status
     if status == "Active":
-        imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), "Global shortcuts active")
+        imgui.text_colored(colors.GREEN, "Global shortcuts active")
     elif status == "Connected":
-        imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), "Portal connected")
+        imgui.text_colored(colors.GREEN, "Portal connected")
     elif status == "Portal not available":
-        imgui.text_colored(imgui.ImVec4(1.0, 0.8, 0.3, 1.0), "GlobalShortcuts portal not available")
+        imgui.text_colored(colors.AMBER, "GlobalShortcuts portal not available")
         imgui.text("Your desktop may not support this feature.")
         imgui.text("Requires KDE Plasma 5.27+ or GNOME 44+.")
     elif "denied" in status.lower() or "failed" in status.lower():
-        imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), status)
+        imgui.text_colored(colors.RED, status)
     else:
-        imgui.text_colored(imgui.ImVec4(1.0, 0.8, 0.3, 1.0), status)
+        imgui.text_colored(colors.AMBER, status)
 
     imgui.spacing()
     imgui.separator()
     imgui.text("Hotkey Mappings")
     imgui.spacing()
 
-    state_names = app._state_machine.state_names
-    group_names = list(app._state_groups.keys())
-    actions = ["set_group", "set_state"]
-    action_labels = ["Set Group", "Set State"]
+    # Combo options, built once per frame and shared by every row
+    group_options = ("(none)", *group_names)
+    state_options = ("(none)", *state_names)
+    group_index = {name: i for i, name in enumerate(group_options)}
+    state_index = {name: i for i, name in enumerate(state_options)}
 
     # Mapping table
     remove_idx = -1
     any_changed = False
     for i, hk in enumerate(config.hotkeys):
-        imgui.push_id(f"hk_{i}")
+        imgui.push_id(i)
 
         # Show bound trigger (read-only, set by portal)
         if i < len(hotkey_input.mappings) and hotkey_input.mappings[i].trigger:
             trigger = hotkey_input.mappings[i].trigger
-            imgui.text_colored(imgui.ImVec4(0.7, 0.9, 1.0, 1.0), f"Bound: {trigger}")
+            imgui.text_colored(colors.LIGHT_BLUE, f"Bound: {trigger}")
         else:
-            imgui.text_colored(imgui.ImVec4(0.6, 0.6, 0.6, 1.0), "Not bound yet")
+            imgui.text_colored(colors.GRAY, "Not bound yet")
 
         # Action
-        act_idx = actions.index(hk.action) if hk.action in actions else 0
-        changed, new_idx = imgui.combo("Action", act_idx, action_labels)
+        act_idx = _ACTION_IDX.get(hk.action, 0)
+        changed, new_idx = imgui.combo("Action", act_idx, _ACTION_LABELS)
         if changed:
-            hk.action = actions[new_idx]
+            hk.action = _ACTIONS[new_idx]
             any_changed = True
 
         # Target (depends on action)
         if hk.action == "set_group":
-            target_names = ["(none)"] + group_names
-            t_idx = target_names.index(hk.target) if hk.target in target_names else 0
+            target_names = group_options
+            t_idx = group_index.get(hk.target, 0)
             changed, new_idx = imgui.combo("Target Group", t_idx, target_names)
             if changed:
                 hk.target = target_names[new_idx] if new_idx > 0 else ""
                 any_changed = True
             if not group_names:
                 imgui.text_colored(
-                    imgui.ImVec4(1.0, 0.8, 0.3, 1.0),
-                    "Define groups in the Mic tab first",
+                    colors.AMBER,
+                    "Define groups in the States tab first",
                 )
         elif hk.action == "set_state":
-            target_names = ["(none)"] + state_names
-            t_idx = target_names.index(hk.target) if hk.target in target_names else 0
+            target_names = state_options
+            t_idx = state_index.get(hk.target, 0)
             changed, new_idx = imgui.combo("Target State", t_idx, target_names)
             if changed:
                 hk.target = target_names[new_idx] if new_idx > 0 else ""
@@ -106,7 +118,6 @@ def draw_hotkeys_panel(app: App) -> None:
 
     imgui.spacing()
     if imgui.button("+ Add Hotkey"):
-        from nixchirp.config import HotkeyConfig
         config.hotkeys.append(HotkeyConfig())
         any_changed = True
 
@@ -118,12 +129,17 @@ def draw_hotkeys_panel(app: App) -> None:
     imgui.spacing()
     can_bind = hotkey_input.session_active and len(config.hotkeys) > 0
     if can_bind:
-        if imgui.button("Bind Shortcuts"):
-            hotkey_input.bind_shortcuts()
+        if hotkey_input.needs_bind:
+            if imgui.button("Bind Shortcuts"):
+                hotkey_input.bind_shortcuts()
+                imgui.text("System dialog should appear...")
+        elif imgui.button("Rebind Shortcuts"):
+            # Unchanged mappings: only re-open the dialog to pick new keys
+            hotkey_input.bind_shortcuts(force=True)
             imgui.text("System dialog should appear...")
     elif not hotkey_input.session_active:
         imgui.text_colored(
-            imgui.ImVec4(0.6, 0.6, 0.6, 1.0),
+            colors.GRAY,
             "Waiting for portal session...",
         )
 
@@ -132,7 +148,6 @@ def _sync_mappings_to_hotkeys(app: App) -> None:
     """Sync config hotkey mappings to the HotkeyInput's runtime mapping list."""
     if not app._hotkeys:
         return
-    from nixchirp.input.hotkeys import HotkeyMapping
     app._hotkeys.mappings = [
         HotkeyMapping(
             action=h.action,
@@ -68,6 +68,22 @@ for i in range(10):
     ik = getattr(imgui.Key, f"_{i}")  # imgui uses _0, _1, etc.
     _SCANCODE_TO_IMGUI_KEY[sc] = ik.value
 
+# Scancodes are small dense ints, so key events index a flat table instead
+# of hashing into the dict.  Entries are prebuilt imgui.Key objects so no
+# enum is constructed per event; None marks unmapped scancodes.
+_SCANCODE_LUT: list[imgui.Key | None] = [None] * sdl2.SDL_NUM_SCANCODES
+for _sc, _key in _SCANCODE_TO_IMGUI_KEY.items():
+    _SCANCODE_LUT[_sc] = imgui.Key(_key)
+
+
+# (ImGui modifier key, SDL modifier mask) pairs, resolved once
+_MOD_KEYS = (
+    (imgui.Key.mod_ctrl, sdl2.KMOD_CTRL),
+    (imgui.Key.mod_shift, sdl2.KMOD_SHIFT),
+    (imgui.Key.mod_alt, sdl2.KMOD_ALT),
+    (imgui.Key.mod_super, sdl2.KMOD_GUI),
+)
+
 
 class ImGuiSDL2:
     """Manages Dear ImGui context with SDL2 input and OpenGL3 rendering."""
@@ -75,6 +91,7 @@ class ImGuiSDL2:
     def __init__(self) -> None:
         self._ctx: imgui.ImGuiContext | None = None
         self._time: float = 0.0
+        self._last_mod_mask: int = -1  # Forces the first key event to send modifiers
 
     def init(self) -> None:
         """Create ImGui context and initialize the OpenGL3 renderer."""
@@ -139,16 +156,16 @@ class ImGuiSDL2:
             scancode = event.key.keysym.scancode
             is_down = event.type == sdl2.SDL_KEYDOWN
 
-            # Update modifier keys
+            # Update modifier keys, only when the mask actually changed
             mod = event.key.keysym.mod
-            io.add_key_event(imgui.Key.mod_ctrl, bool(mod & sdl2.KMOD_CTRL))
-            io.add_key_event(imgui.Key.mod_shift, bool(mod & sdl2.KMOD_SHIFT))
-            io.add_key_event(imgui.Key.mod_alt, bool(mod & sdl2.KMOD_ALT))
-            io.add_key_event(imgui.Key.mod_super, bool(mod & sdl2.KMOD_GUI))
+            if mod != self._last_mod_mask:
+                self._last_mod_mask = mod
+                for key, mask in _MOD_KEYS:
+                    io.add_key_event(key, bool(mod & mask))
 
-            imgui_key = _SCANCODE_TO_IMGUI_KEY.get(scancode)
+            imgui_key = _SCANCODE_LUT[scancode] if scancode < sdl2.SDL_NUM_SCANCODES else None
             if imgui_key is not None:
-                io.add_key_event(imgui.Key(imgui_key), is_down)
+                io.add_key_event(imgui_key, is_down)
 
             return io.want_capture_keyboard
 
@@ -162,6 +179,7 @@ class ImGuiSDL2:
                 io.add_focus_event(True)
             elif event.window.event == sdl2.SDL_WINDOWEVENT_FOCUS_LOST:
                 io.add_focus_event(False)
+                self._last_mod_mask = -1  # ImGui drops key state on focus loss
 
         return False
 
@@ -170,6 +188,13 @@ class ImGuiSDL2:
         imgui.render()
         imgui.backends.opengl3_render_draw_data(imgui.get_draw_data())
 
+    def render_previous(self) -> None:
+        """Re-submit the last frame's draw data without rebuilding any widgets.
+
+        The draw data stays valid until the next new_frame().
+        """
+        imgui.backends.opengl3_render_draw_data(imgui.get_draw_data())
+
     def shutdown(self) -> None:
         """Clean up ImGui resources."""
         imgui.backends.opengl3_shutdown()
@@ -184,3 +209,7 @@ class ImGuiSDL2:
     @property
     def want_capture_keyboard(self) -> bool:
         return imgui.get_io().want_capture_keyboard
+
+    @property
+    def want_text_input(self) -> bool:
+        return imgui.get_io().want_text_input
@@ -6,19 +6,28 @@ from typing import TYPE_CHECKING
 
 from imgui_bundle import imgui
 
+from nixchirp.gui import colors
+
 if TYPE_CHECKING:
     from nixchirp.app import App
 
+_METER_SIZE = imgui.ImVec2(-1, 0)  # Full width, default height
+
+# Volume meter label, reformatted only when the shown value changes
+_rms_label_key: int = -1
+_rms_label: str = ""
+
 
 def draw_mic_panel(app: App) -> None:
     """Draw the microphone configuration panel."""
+    global _rms_label_key, _rms_label
     mic = app._mic
     config = app.config
     sm = app._state_machine
 
     # Mic availability
     if not mic or not mic.available:
-        imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), "Microphone unavailable")
+        imgui.text_colored(colors.RED, "Microphone unavailable")
         imgui.text("Install 'sounddevice' and ensure PortAudio is available.")
         return
 
@@ -31,15 +40,19 @@ def draw_mic_panel(app: App) -> None:
 
     # Real-time volume meter
     rms = mic.current_rms
+    rms_key = round(rms * 1000)
+    if rms_key != _rms_label_key:
+        _rms_label_key = rms_key
+        _rms_label = f"{rms:.3f}"
     imgui.text("Volume:")
     imgui.same_line()
-    imgui.progress_bar(min(rms * 5.0, 1.0), imgui.ImVec2(-1, 0), f"{rms:.3f}")
+    imgui.progress_bar(min(rms * 5.0, 1.0), _METER_SIZE, _rms_label)
 
     # Status
     imgui.text("Status:")
     imgui.same_line()
     if mic.is_active:
-        imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), "Speaking")
+        imgui.text_colored(colors.GREEN, "Speaking")
     else:
         imgui.text("Silent")
 
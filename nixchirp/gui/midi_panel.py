@@ -3,51 +3,85 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from imgui_bundle import imgui
 
-from nixchirp.config import AppConfig
+from nixchirp.config import AppConfig, MidiMappingConfig
+from nixchirp.gui import colors
+from nixchirp.gui.row_clipper import RowClipper
+from nixchirp.gui.widgets import combo_value
+from nixchirp.input.midi import INDEXED_MAPPING_FIELDS, MidiInput, MidiMapping
 
 if TYPE_CHECKING:
     from nixchirp.app import App
 
 logger = logging.getLogger(__name__)
 
+# Combo values and their labels
+_EVENT_TYPES = ("note_on", "note_off", "cc", "program_change")
+_EVENT_LABELS = ("Note On", "Note Off", "CC", "Program Change")
+_EVENT_TYPE_IDX = {v: i for i, v in enumerate(_EVENT_TYPES)}
+_ACTIONS = ("set_group", "set_state", "toggle_mic")
+_ACTION_LABELS = ("Set Group", "Set State", "Toggle Mic")
+_ACTION_IDX = {v: i for i, v in enumerate(_ACTIONS)}
+_MODES = ("momentary", "toggle")
+_MODE_LABELS = ("Momentary (while held)", "Toggle (stays active)")
+_MODE_IDX = {v: i for i, v in enumerate(_MODES)}
+# MidiEventType member name -> config event_type
+_EVENT_TYPE_NAME_MAP = {
+    "NOTE_ON": "note_on",
+    "NOTE_OFF": "note_off",
+    "CONTROL_CHANGE": "cc",
+    "PROGRAM_CHANGE": "program_change",
+}
+
 # Learn mode state
 _learn_target_idx: int = -1
-_learn_status: str = ""
+_learned: tuple[str, int, int] | None = None  # (type name, channel, note), set by callback
+_learn_status: str = ""  # Formatted from _learned on the UI thread
+_learn_status_src: tuple[str, int, int] | None = None
 _learn_config: AppConfig | None = None  # Reference stored during learn
 _learn_needs_sync: bool = False  # Set by callback, consumed by draw
 
+# list_ports() queries the ALSA sequencer, so rescan at most this often
+_PORTS_REFRESH_S = 1.0
+_port_labels: list[str] = []
+_ports_scan_time: float | None = None  # None forces a rescan
+_connected_label_count = -1
+_connected_label = ""
+
+# Skips drawing mapping rows that are scrolled out of view
+_row_clipper = RowClipper()
+
 
 def _on_midi_learn(event: object) -> None:
     """Module-level learn callback — uses _learn_target_idx to route."""
-    global _learn_target_idx, _learn_status, _learn_config, _learn_needs_sync
+    global _learn_target_idx, _learned, _learn_config, _learn_needs_sync
     if _learn_config is None or _learn_target_idx < 0:
         return
     if _learn_target_idx >= len(_learn_config.midi_mappings):
         _learn_target_idx = -1
         return
     m = _learn_config.midi_mappings[_learn_target_idx]
-    type_map = {
-        "NOTE_ON": "note_on",
-        "NOTE_OFF": "note_off",
-        "CONTROL_CHANGE": "cc",
-        "PROGRAM_CHANGE": "program_change",
-    }
-    m.event_type = type_map.get(event.event_type.name, "note_on")
+    type_name = event.event_type.name
+    m.event_type = _EVENT_TYPE_NAME_MAP.get(type_name, "note_on")
     m.channel = event.channel
     m.note = event.note
     m.device = event.port_name
-    _learn_status = f"Learned: {event.event_type.name} ch={event.channel} note={event.note}"
+    _learned = (type_name, event.channel, event.note)
     _learn_target_idx = -1
     _learn_needs_sync = True
 
 
-def draw_midi_panel(app: App) -> None:
+def draw_midi_panel(
+    app: App, state_names: tuple[str, ...], group_names: tuple[str, ...],
+) -> None:
     """Draw the MIDI configuration panel."""
-    global _learn_target_idx, _learn_status, _learn_config, _learn_needs_sync
+    global _learn_target_idx, _learned, _learn_status, _learn_status_src
+    global _learn_config, _learn_needs_sync
+    global _connected_label_count, _connected_label, _ports_scan_time
 
     midi = app._midi
     config = app.config
@@ -58,19 +92,23 @@ def draw_midi_panel(app: App) -> None:
         _sync_mappings_to_midi(app)
 
     if not midi or not midi.available:
-        imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), "MIDI unavailable")
+        imgui.text_colored(colors.RED, "MIDI unavailable")
         imgui.text("Install 'alsa-midi' and ensure ALSA sequencer is accessible.")
         return
 
     # Connection status
     connected = midi.connected_ports
     if connected:
-        imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), f"Connected to {len(connected)} port(s)")
+        if len(connected) != _connected_label_count:
+            _connected_label_count = len(connected)
+            _connected_label = f"Connected to {_connected_label_count} port(s)"
+        imgui.text_colored(colors.GREEN, _connected_label)
     else:
         imgui.text("No MIDI ports connected")
 
     if imgui.button("Refresh Ports"):
         midi._connect_all_ports()
+        _ports_scan_time = None
 
     imgui.separator()
     imgui.spacing()
@@ -85,10 +123,10 @@ def draw_midi_panel(app: App) -> None:
         imgui.spacing()
         # Available ports
         imgui.text("Available ports:")
-        ports = midi.list_ports()
+        ports = _available_port_labels(midi)
         if ports:
-            for p in ports:
-                imgui.bullet_text(f"[{p['client_id']}:{p['port_id']}] {p['client_name']}:{p['name']}")
+            for label in ports:
+                imgui.bullet_text(label)
         else:
             imgui.text("None found")
 
@@ -99,12 +137,15 @@ def draw_midi_panel(app: App) -> None:
 
     # Learn mode status
     if midi.learn_mode:
-        imgui.text_colored(imgui.ImVec4(1.0, 1.0, 0.0, 1.0), "LEARN MODE: Press a MIDI button/key...")
+        imgui.text_colored(colors.YELLOW, "LEARN MODE: Press a MIDI button/key...")
         if imgui.button("Cancel Learn"):
             midi.cancel_learn()
             _learn_target_idx = -1
-    elif _learn_status:
-        imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), _learn_status)
+    elif _learned is not None:
+        if _learned is not _learn_status_src:
+            _learn_status_src = _learned
+            _learn_status = "Learned: %s ch=%d note=%d" % _learned
+        imgui.text_colored(colors.GREEN, _learn_status)
 
     imgui.spacing()
 
@@ -113,90 +154,91 @@ def draw_midi_panel(app: App) -> None:
     if active_group:
         imgui.text("Active group:")
         imgui.same_line()
-        imgui.text_colored(imgui.ImVec4(0.4, 0.8, 1.0, 1.0), active_group)
+        imgui.text_colored(colors.CYAN, active_group)
     else:
         imgui.text("Active group: default")
 
     imgui.spacing()
 
-    state_names = app._state_machine.state_names
-    group_names = list(app._state_groups.keys())
-    event_types = ["note_on", "note_off", "cc", "program_change"]
-    event_labels = ["Note On", "Note Off", "CC", "Program Change"]
-    actions = ["set_group", "set_state", "toggle_mic"]
-    action_labels = ["Set Group", "Set State", "Toggle Mic"]
-
-    # Mapping table
+    # Combo values and labels, built once per frame and shared by every row
+    group_values = ("", *group_names)
+    group_labels = ("(default)", *group_names)
+    state_values = ("", *state_names)
+    state_labels = ("(none)", *state_names)
+    group_index = {name: i for i, name in enumerate(group_values)}
+    state_index = {name: i for i, name in enumerate(state_values)}
+
+    # Field edits are collected per row and mirrored in place onto the
+    # runtime mapping at the same index (single attribute stores, safe
+    # against the MIDI thread).  The runtime list is only rebuilt when
+    # mappings are added or removed, or if it has somehow fallen out of
+    # step with the config.
+    runtime = midi.mappings
+    needs_resync = len(runtime) != len(config.midi_mappings)
     remove_idx = -1
-    any_changed = False
     for i, mc in enumerate(config.midi_mappings):
-        imgui.push_id(f"midi_{i}")
+        if not _row_clipper.begin_row(i):
+            continue
+        imgui.push_id(i)
+        edits: dict[str, object] = {}
 
         # Event type
-        et_idx = event_types.index(mc.event_type) if mc.event_type in event_types else 0
-        changed, new_idx = imgui.combo("Event", et_idx, event_labels)
-        if changed:
-            mc.event_type = event_types[new_idx]
-            any_changed = True
+        value = combo_value("Event", mc.event_type, _EVENT_TYPES, _EVENT_LABELS, _EVENT_TYPE_IDX)
+        if value is not None:
+            edits["event_type"] = value
 
         # Channel
         changed, new_ch = imgui.slider_int("Channel", mc.channel, 0, 15)
         if changed:
-            mc.channel = new_ch
-            any_changed = True
+            edits["channel"] = new_ch
 
         # Note/CC number
         changed, new_note = imgui.input_int("Note/CC", mc.note, 1, 12)
         if changed:
-            mc.note = max(0, min(127, new_note))
-            any_changed = True
+            edits["note"] = max(0, min(127, new_note))
 
         # Action
-        act_idx = actions.index(mc.action) if mc.action in actions else 0
-        changed, new_idx = imgui.combo("Action", act_idx, action_labels)
-        if changed:
-            mc.action = actions[new_idx]
-            any_changed = True
+        value = combo_value("Action", mc.action, _ACTIONS, _ACTION_LABELS, _ACTION_IDX)
+        if value is not None:
+            edits["action"] = value
 
         # Target (depends on action)
         if mc.action == "set_group":
-            target_names = ["(default)"] + group_names
-            t_idx = target_names.index(mc.target) if mc.target in target_names else 0
-            changed, new_idx = imgui.combo("Target Group", t_idx, target_names)
-            if changed:
-                mc.target = target_names[new_idx] if new_idx > 0 else ""
-                any_changed = True
+            value = combo_value("Target Group", mc.target, group_values, group_labels, group_index)
+            if value is not None:
+                edits["target"] = value
             if not group_names:
-                imgui.text_colored(imgui.ImVec4(1.0, 0.8, 0.3, 1.0),
-                                   "Define groups in the Mic tab first")
+                imgui.text_colored(colors.AMBER,
+                                   "Define groups in the States tab first")
 
             # Mode: momentary vs toggle
-            modes = ["momentary", "toggle"]
-            mode_labels = ["Momentary (while held)", "Toggle (stays active)"]
-            mode_idx = modes.index(mc.mode) if mc.mode in modes else 0
-            changed, new_idx = imgui.combo("Mode", mode_idx, mode_labels)
-            if changed:
-                mc.mode = modes[new_idx]
-                any_changed = True
+            value = combo_value("Mode", mc.mode, _MODES, _MODE_LABELS, _MODE_IDX)
+            if value is not None:
+                edits["mode"] = value
         elif mc.action == "set_state":
-            target_names = ["(none)"] + state_names
-            t_idx = target_names.index(mc.target) if mc.target in target_names else 0
-            changed, new_idx = imgui.combo("Target State", t_idx, target_names)
-            if changed:
-                mc.target = target_names[new_idx] if new_idx > 0 else ""
-                any_changed = True
+            value = combo_value("Target State", mc.target, state_values, state_labels, state_index)
+            if value is not None:
+                edits["target"] = value
 
         # Device filter
         changed, new_dev = imgui.input_text("Device", mc.device)
         if changed:
-            mc.device = new_dev
-            any_changed = True
+            edits["device"] = new_dev
+
+        if edits:
+            rt = None if needs_resync else runtime[i]
+            for name, value in edits.items():
+                setattr(mc, name, value)
+                if rt is not None:
+                    setattr(rt, name, value)
+            if rt is not None and not INDEXED_MAPPING_FIELDS.isdisjoint(edits):
+                midi.reindex_mappings()
 
         # Learn button for this mapping
         if not midi.learn_mode:
             if imgui.button("Learn"):
                 _learn_target_idx = i
-                _learn_status = ""
+                _learned = None
                 _learn_config = config
                 midi.start_learn(_on_midi_learn)
 
@@ -206,26 +248,39 @@ def draw_midi_panel(app: App) -> None:
 
         imgui.separator()
         imgui.pop_id()
+        _row_clipper.end_row(i)
 
     if remove_idx >= 0:
         config.midi_mappings.pop(remove_idx)
-        any_changed = True
+        _row_clipper.invalidate(remove_idx)
+        needs_resync = True
 
     imgui.spacing()
     if imgui.button("+ Add Mapping"):
-        from nixchirp.config import MidiMappingConfig
         config.midi_mappings.append(MidiMappingConfig())
-        any_changed = True
+        needs_resync = True
 
-    if any_changed:
+    if needs_resync:
         _sync_mappings_to_midi(app)
 
 
+def _available_port_labels(midi: MidiInput) -> list[str]:
+    """Return labels for the available MIDI ports, rescanning when stale."""
+    global _port_labels, _ports_scan_time
+    now = time.monotonic()
+    if _ports_scan_time is None or now - _ports_scan_time > _PORTS_REFRESH_S:
+        _ports_scan_time = now
+        _port_labels = [
+            f"[{p['client_id']}:{p['port_id']}] {p['client_name']}:{p['name']}"
+            for p in midi.list_ports()
+        ]
+    return _port_labels
+
+
 def _sync_mappings_to_midi(app: App) -> None:
     """Sync config MIDI mappings to the MidiInput's runtime mapping list."""
     if not app._midi:
         return
-    from nixchirp.input.midi import MidiMapping
     app._midi.mappings = [
         MidiMapping(
             device=m.device,
@@ -2,45 +2,64 @@
 
 from __future__ import annotations
 
-import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from imgui_bundle import imgui
 
+from nixchirp.config import parse_hex_color
 from nixchirp.constants import (
     OUTPUT_CHROMA,
     OUTPUT_TRANSPARENT,
     OUTPUT_VIRTUAL_CAM,
     OUTPUT_WINDOWED,
 )
+from nixchirp.gui import colors
+from nixchirp.gui.widgets import combo_value
 from nixchirp.render.virtual_cam import (
     find_v4l2loopback_devices,
     is_v4l2loopback_loaded,
     load_v4l2loopback,
 )
+from nixchirp.state.transitions import parse_transition_type
 
 if TYPE_CHECKING:
     from nixchirp.app import App
 
-_OUTPUT_MODES = [OUTPUT_WINDOWED, OUTPUT_CHROMA, OUTPUT_TRANSPARENT, OUTPUT_VIRTUAL_CAM]
-_OUTPUT_LABELS = ["Windowed", "Chroma Key", "Transparent", "Virtual Camera"]
+_OUTPUT_MODES = (OUTPUT_WINDOWED, OUTPUT_CHROMA, OUTPUT_TRANSPARENT, OUTPUT_VIRTUAL_CAM)
+_OUTPUT_LABELS = ("Windowed", "Chroma Key", "Transparent", "Virtual Camera")
+_OUTPUT_MODE_IDX = {v: i for i, v in enumerate(_OUTPUT_MODES)}
+_TRANS_TYPES = ("cut", "crossfade")
+_TRANS_LABELS = ("Cut", "Crossfade")
+_TRANS_TYPE_IDX = {v: i for i, v in enumerate(_TRANS_TYPES)}
 
-# Module-level state for async pkexec operation
+# Module-level state for async pkexec operation; one long-lived worker
+# runs it, so repeated clicks don't each start a thread
+_modprobe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="modprobe")
 _modprobe_busy = False
 _modprobe_result: str = ""
 
+# v4l2loopback state walks /sys and /dev, so rescan at most this often
+_VCAM_REFRESH_S = 1.0
+_vcam_scan_time: float | None = None  # None forces a rescan
+_vcam_loaded = False
+_vcam_devs: tuple[str, ...] = ()  # Same object until the device set changes
+_vcam_dev_index: dict[str, int] = {}
+
+# Chroma color as last parsed: (hex string, [r, g, b] floats for color_edit3)
+_chroma_cache: tuple[str, list[float]] | None = None
+
 
 def draw_output_panel(app: App) -> None:
     """Draw the output/render settings panel."""
-    global _modprobe_busy, _modprobe_result
+    global _chroma_cache
     config = app.config
 
     # Output mode
     old_mode = config.output.mode
-    current_idx = _OUTPUT_MODES.index(old_mode) if old_mode in _OUTPUT_MODES else 0
-    changed, new_idx = imgui.combo("Output Mode", current_idx, _OUTPUT_LABELS)
-    if changed:
-        new_mode = _OUTPUT_MODES[new_idx]
+    new_mode = combo_value("Output Mode", old_mode, _OUTPUT_MODES, _OUTPUT_LABELS, _OUTPUT_MODE_IDX)
+    if new_mode is not None:
         config.output.mode = new_mode
         _handle_mode_switch(app, old_mode, new_mode)
 
@@ -49,19 +68,14 @@ def draw_output_panel(app: App) -> None:
     # Chroma key color (relevant for chroma mode AND virtual cam background)
     if config.output.mode in (OUTPUT_CHROMA, OUTPUT_VIRTUAL_CAM):
         label = "Chroma Color" if config.output.mode == OUTPUT_CHROMA else "Virtual Cam BG"
-        hex_color = config.output.chroma_color.lstrip("#")
-        try:
-            r = int(hex_color[0:2], 16) / 255.0
-            g = int(hex_color[2:4], 16) / 255.0
-            b = int(hex_color[4:6], 16) / 255.0
-        except (ValueError, IndexError):
-            r, g, b = 0.0, 1.0, 0.0
-        changed, color = imgui.color_edit3(label, [r, g, b])
+        hex_color = config.output.chroma_color
+        if _chroma_cache is None or _chroma_cache[0] != hex_color:
+            r, g, b = parse_hex_color(hex_color)
+            _chroma_cache = (hex_color, [r / 255.0, g / 255.0, b / 255.0])
+        changed, color = imgui.color_edit3(label, _chroma_cache[1])
         if changed:
-            hr = int(color[0] * 255)
-            hg = int(color[1] * 255)
-            hb = int(color[2] * 255)
-            config.output.chroma_color = f"#{hr:02X}{hg:02X}{hb:02X}"
+            packed = (int(color[0] * 255) << 16) | (int(color[1] * 255) << 8) | int(color[2] * 255)
+            config.output.chroma_color = f"#{packed:06X}"
 
     # Resolution
     imgui.spacing()
@@ -84,8 +98,10 @@ def draw_output_panel(app: App) -> None:
     changed, new_fps = imgui.slider_int("FPS Cap", config.general.fps_cap, 10, 120)
     if changed:
         config.general.fps_cap = new_fps
-        app._fps_cap = new_fps
-        app._frame_time_target = 1.0 / new_fps
+    # Retime the main loop once, when the drag ends
+    if imgui.is_item_deactivated_after_edit():
+        app._fps_cap = config.general.fps_cap
+        app._frame_time_target_ns = 1_000_000_000 // app._fps_cap
 
     # Transition settings
     imgui.spacing()
@@ -93,18 +109,18 @@ def draw_output_panel(app: App) -> None:
     imgui.text("Transitions")
     imgui.spacing()
 
-    trans_types = ["cut", "crossfade"]
-    current_trans_idx = trans_types.index(config.transitions.default_type) if config.transitions.default_type in trans_types else 0
-    changed, new_idx = imgui.combo("Default Type", current_trans_idx, ["Cut", "Crossfade"])
-    if changed:
-        config.transitions.default_type = trans_types[new_idx]
-        from nixchirp.state.transitions import parse_transition_type
-        app._default_transition_type = parse_transition_type(trans_types[new_idx])
+    trans_type = combo_value(
+        "Default Type", config.transitions.default_type, _TRANS_TYPES, _TRANS_LABELS, _TRANS_TYPE_IDX,
+    )
+    if trans_type is not None:
+        config.transitions.default_type = trans_type
+        app._default_transition_type = parse_transition_type(trans_type)
 
     changed, new_dur = imgui.slider_int("Duration (ms)", config.transitions.default_duration_ms, 0, 500)
     if changed:
         config.transitions.default_duration_ms = new_dur
-        app._default_transition_duration = new_dur
+    if imgui.is_item_deactivated_after_edit():
+        app._default_transition_duration = config.transitions.default_duration_ms
 
     # --- Virtual Camera section ---
     if config.output.mode == OUTPUT_VIRTUAL_CAM:
@@ -113,14 +129,14 @@ def draw_output_panel(app: App) -> None:
         imgui.text("Virtual Camera")
         imgui.spacing()
 
-        module_loaded = is_v4l2loopback_loaded()
+        module_loaded, loopback_devs, dev_index = _scan_vcam()
         vcam = app._virtual_cam
         vcam_active = vcam is not None and vcam.is_open
 
         if not module_loaded:
             # Module not loaded — offer to load it
             imgui.text_colored(
-                imgui.ImVec4(1.0, 0.8, 0.3, 1.0),
+                colors.AMBER,
                 "v4l2loopback kernel module not loaded",
             )
             imgui.spacing()
@@ -129,38 +145,35 @@ def draw_output_panel(app: App) -> None:
                 imgui.text("Loading module...")
             else:
                 if imgui.button("Load v4l2loopback"):
-                    _modprobe_busy = True
-                    _modprobe_result = ""
-                    threading.Thread(target=_run_modprobe_and_connect,
-                                     args=(app,), daemon=True).start()
+                    _start_modprobe(app)
 
             if _modprobe_result:
                 if _modprobe_result == "Module loaded":
-                    imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), _modprobe_result)
+                    imgui.text_colored(colors.GREEN, _modprobe_result)
                 else:
-                    imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), _modprobe_result)
+                    imgui.text_colored(colors.RED, _modprobe_result)
 
         elif module_loaded and not vcam_active:
             # Module loaded but virtual cam not active
-            loopback_devs = find_v4l2loopback_devices(output_only=False)
-
             if loopback_devs:
                 # Auto-fill device
-                if config.output.virtual_cam_device not in loopback_devs:
+                if config.output.virtual_cam_device not in dev_index:
                     config.output.virtual_cam_device = loopback_devs[0]
 
-                dev_idx = (
-                    loopback_devs.index(config.output.virtual_cam_device)
-                    if config.output.virtual_cam_device in loopback_devs
-                    else 0
+                device = combo_value(
+                    "Device", config.output.virtual_cam_device, loopback_devs, loopback_devs, dev_index,
                 )
-                changed, new_idx = imgui.combo("Device", dev_idx, loopback_devs)
-                if changed:
-                    config.output.virtual_cam_device = loopback_devs[new_idx]
+                if device is not None:
+                    config.output.virtual_cam_device = device
+            else:
+                imgui.text_colored(colors.AMBER, "No loopback devices found")
+            imgui.same_line()
+            if imgui.small_button("Rescan"):
+                _invalidate_vcam_scan()
 
             # Show error from last attempt
             if vcam is not None and vcam.status not in ("Not started", "Closed"):
-                imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), vcam.status)
+                imgui.text_colored(colors.RED, vcam.status)
 
             imgui.spacing()
 
@@ -176,34 +189,54 @@ def draw_output_panel(app: App) -> None:
 
                 # Reload button (fixes exclusive_caps and other config issues)
                 if imgui.button("Reload Module"):
-                    _modprobe_busy = True
-                    _modprobe_result = ""
                     app.close_virtual_cam()
-                    threading.Thread(target=_run_modprobe_and_connect,
-                                     args=(app,), daemon=True).start()
+                    _start_modprobe(app)
 
             if _modprobe_result:
                 if _modprobe_result == "Module loaded":
-                    imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), _modprobe_result)
+                    imgui.text_colored(colors.GREEN, _modprobe_result)
                 else:
-                    imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), _modprobe_result)
+                    imgui.text_colored(colors.RED, _modprobe_result)
 
         else:
             # Active — show device and status
-            imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0),
+            imgui.text_colored(colors.GREEN,
                                f"Active: {app._virtual_cam._device}")
 
             if imgui.button("Disconnect"):
                 app.close_virtual_cam()
 
 
+def _scan_vcam() -> tuple[bool, tuple[str, ...], dict[str, int]]:
+    """Return (module loaded, loopback devices, device -> index), rescanning when stale."""
+    global _vcam_scan_time, _vcam_loaded, _vcam_devs, _vcam_dev_index
+    now = time.monotonic()
+    if _vcam_scan_time is None or now - _vcam_scan_time > _VCAM_REFRESH_S:
+        _vcam_scan_time = now
+        _vcam_loaded = is_v4l2loopback_loaded()
+        devs = tuple(find_v4l2loopback_devices(output_only=False)) if _vcam_loaded else ()
+        if devs != _vcam_devs:
+            _vcam_devs = devs
+            _vcam_dev_index = {d: i for i, d in enumerate(devs)}
+    return _vcam_loaded, _vcam_devs, _vcam_dev_index
+
+
+def _invalidate_vcam_scan() -> None:
+    """Force the next _scan_vcam() to rescan."""
+    global _vcam_scan_time
+    _vcam_scan_time = None
+
+
 def _handle_mode_switch(app: App, old_mode: str, new_mode: str) -> None:
     """Handle runtime output mode switching."""
     if old_mode == OUTPUT_VIRTUAL_CAM and new_mode != OUTPUT_VIRTUAL_CAM:
         app.close_virtual_cam()
 
     if new_mode == OUTPUT_VIRTUAL_CAM and old_mode != OUTPUT_VIRTUAL_CAM:
-        if is_v4l2loopback_loaded():
+        # Reuse the cached scan; the writer-side check below is only
+        # worth running when some loopback device exists at all
+        loaded, all_devs, _ = _scan_vcam()
+        if loaded and all_devs:
             # Auto-open if devices are available
             devs = find_v4l2loopback_devices()
             if devs:
@@ -212,34 +245,34 @@ def _handle_mode_switch(app: App, old_mode: str, new_mode: str) -> None:
                 app.open_virtual_cam()
 
 
-def _run_modprobe() -> None:
-    """Run pkexec modprobe in a background thread."""
+def _start_modprobe(app: App) -> None:
+    """Reload v4l2loopback and reconnect on the modprobe worker."""
     global _modprobe_busy, _modprobe_result
-    try:
-        ok, msg = load_v4l2loopback()
-        _modprobe_result = msg
-    except Exception as e:
-        _modprobe_result = str(e)
-    finally:
-        _modprobe_busy = False
+    _modprobe_busy = True
+    _modprobe_result = ""
+    _modprobe_executor.submit(_run_modprobe_and_connect, app).add_done_callback(_modprobe_done)
 
 
-def _run_modprobe_and_connect(app: App) -> None:
-    """Reload v4l2loopback and auto-connect in a background thread."""
+def _modprobe_done(future: Future) -> None:
+    """Worker done-callback: record any error and clear the busy flag."""
     global _modprobe_busy, _modprobe_result
-    try:
-        ok, msg = load_v4l2loopback()
-        _modprobe_result = msg
-        if ok:
-            # Give the kernel a moment to create the new devices
-            import time
-            time.sleep(0.5)
-            # Auto-detect and connect
-            devs = find_v4l2loopback_devices()
-            if devs:
-                app.config.output.virtual_cam_device = devs[0]
-                app.open_virtual_cam()
-    except Exception as e:
-        _modprobe_result = str(e)
-    finally:
-        _modprobe_busy = False
+    exc = future.exception()
+    if exc is not None:
+        _modprobe_result = str(exc)
+    _invalidate_vcam_scan()
+    _modprobe_busy = False
+
+
+def _run_modprobe_and_connect(app: App) -> None:
+    """Reload v4l2loopback and auto-connect (runs on the modprobe worker)."""
+    global _modprobe_result
+    ok, msg = load_v4l2loopback()
+    _modprobe_result = msg
+    if ok:
+        # Give the kernel a moment to create the new devices
+        time.sleep(0.5)
+        # Auto-detect and connect
+        devs = find_v4l2loopback_devices()
+        if devs:
+            app.config.output.virtual_cam_device = devs[0]
+            app.open_virtual_cam()
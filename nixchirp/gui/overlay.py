@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING
 
 from imgui_bundle import imgui
 
-from nixchirp.gui.general_panel import draw_general_panel, update_general_timer
+from nixchirp.gui import colors
+from nixchirp.gui.general_panel import draw_general_panel
 from nixchirp.gui.hotkeys_panel import draw_hotkeys_panel
 from nixchirp.gui.mic_panel import draw_mic_panel
 from nixchirp.gui.midi_panel import draw_midi_panel
@@ -16,35 +17,36 @@ from nixchirp.gui.states_panel import draw_states_panel
 if TYPE_CHECKING:
     from nixchirp.app import App
 
+_PANEL_POS = imgui.ImVec2(10, 10)
+_COND_FIRST_USE = imgui.Cond_.first_use_ever.value
+_WINDOW_FLAGS = imgui.WindowFlags_.no_collapse.value
 
-def draw_overlay(app: App, dt: float) -> None:
+# (tab label, panel draw function, per-frame values it takes by keyword)
+_TABS = (
+    ("States", draw_states_panel, ("state_names",)),
+    ("Mic", draw_mic_panel, ()),
+    ("MIDI", draw_midi_panel, ("state_names", "group_names")),
+    ("Hotkeys", draw_hotkeys_panel, ("state_names", "group_names")),
+    ("Output", draw_output_panel, ()),
+    ("General", draw_general_panel, ("state_names",)),
+)
+
+
+def draw_overlay(app: App) -> None:
     """Draw the full configuration overlay.
 
     Args:
         app: The main App instance.
-        dt: Time delta since last frame.
     """
-    update_general_timer(dt)
-
     # Set up a window that covers part of the screen
     viewport = imgui.get_main_viewport()
     panel_width = min(420, viewport.size.x * 0.9)
     panel_height = min(viewport.size.y * 0.85, 800)
 
-    imgui.set_next_window_pos(
-        imgui.ImVec2(10, 10),
-        imgui.Cond_.first_use_ever.value,
-    )
-    imgui.set_next_window_size(
-        imgui.ImVec2(panel_width, panel_height),
-        imgui.Cond_.first_use_ever.value,
-    )
+    imgui.set_next_window_pos(_PANEL_POS, _COND_FIRST_USE)
+    imgui.set_next_window_size(imgui.ImVec2(panel_width, panel_height), _COND_FIRST_USE)
 
-    flags = (
-        imgui.WindowFlags_.no_collapse.value
-    )
-
-    expanded, opened = imgui.begin("NixChirp Settings", True, flags)
+    expanded, opened = imgui.begin("NixChirp Settings", True, _WINDOW_FLAGS)
 
     if not opened:
         # User closed the window — hide the overlay
@@ -56,7 +58,7 @@ def draw_overlay(app: App, dt: float) -> None:
         # First-run welcome message
         if not app.config.states:
             imgui.spacing()
-            imgui.text_colored(imgui.ImVec4(0.4, 0.8, 1.0, 1.0), "Welcome to NixChirp!")
+            imgui.text_colored(colors.CYAN, "Welcome to NixChirp!")
             imgui.text("Add avatar states in the States tab to get started.")
             imgui.text("Then assign idle/speaking states below them.")
             imgui.spacing()
@@ -64,29 +66,15 @@ def draw_overlay(app: App, dt: float) -> None:
             imgui.spacing()
 
         if imgui.begin_tab_bar("SettingsTabs"):
-            if imgui.begin_tab_item("States")[0]:
-                draw_states_panel(app)
-                imgui.end_tab_item()
-
-            if imgui.begin_tab_item("Mic")[0]:
-                draw_mic_panel(app)
-                imgui.end_tab_item()
-
-            if imgui.begin_tab_item("MIDI")[0]:
-                draw_midi_panel(app)
-                imgui.end_tab_item()
-
-            if imgui.begin_tab_item("Hotkeys")[0]:
-                draw_hotkeys_panel(app)
-                imgui.end_tab_item()
-
-            if imgui.begin_tab_item("Output")[0]:
-                draw_output_panel(app)
-                imgui.end_tab_item()
-
-            if imgui.begin_tab_item("General")[0]:
-                draw_general_panel(app)
-                imgui.end_tab_item()
+            # Shared by several panels; walk the state machine once per frame
+            shared = {
+                "state_names": tuple(app._state_machine.state_names),
+                "group_names": tuple(app._state_groups),
+            }
+            for label, draw_panel, arg_names in _TABS:
+                if imgui.begin_tab_item(label)[0]:
+                    draw_panel(app, **{name: shared[name] for name in arg_names})
+                    imgui.end_tab_item()
 
             imgui.end_tab_bar()
 
@@ -0,0 +1,46 @@
+"""Skip ImGui submission for list rows that are scrolled out of view."""
+
+from __future__ import annotations
+
+from imgui_bundle import imgui
+
+
+class RowClipper:
+    """Clipper for lists whose rows vary in height.
+
+    imgui.ListClipper needs one fixed row height, but panel rows grow when
+    their header is expanded or their action adds widgets.  This measures
+    each row as it is drawn and, on later frames, replaces rows that are
+    off screen with a dummy of the remembered height.  Rows not yet
+    measured are always drawn.
+    """
+
+    def __init__(self) -> None:
+        self._heights: list[float] = []
+        self._row_y = 0.0
+
+    def begin_row(self, index: int) -> bool:
+        """Return True if the row should be drawn.
+
+        If False, the row's space has already been reserved; the caller
+        must skip the row and not call end_row().
+        """
+        if index >= len(self._heights):
+            self._heights.extend([0.0] * (index + 1 - len(self._heights)))
+        height = self._heights[index]
+        if height > 0.0 and not imgui.is_rect_visible(imgui.ImVec2(1.0, height)):
+            # dummy() adds item spacing below itself, which the measured
+            # height already includes
+            spacing = imgui.get_style().item_spacing.y
+            imgui.dummy(imgui.ImVec2(0.0, max(0.0, height - spacing)))
+            return False
+        self._row_y = imgui.get_cursor_pos_y()
+        return True
+
+    def end_row(self, index: int) -> None:
+        """Record the height of a row drawn after begin_row() returned True."""
+        self._heights[index] = imgui.get_cursor_pos_y() - self._row_y
+
+    def invalidate(self, start: int = 0) -> None:
+        """Forget heights from *start* on, e.g. after rows are removed."""
+        del self._heights[start:]
@@ -7,7 +7,13 @@ from typing import TYPE_CHECKING
 
 from imgui_bundle import imgui
 
+from nixchirp.config import StateConfig, StateGroupConfig
+from nixchirp.gui import colors
 from nixchirp.gui.file_browser import FileBrowser
+from nixchirp.gui.row_clipper import RowClipper
+from nixchirp.gui.widgets import combo_value
+from nixchirp.state.machine import EventType, StateEvent
+from nixchirp.state.state import State
 
 if TYPE_CHECKING:
     from nixchirp.app import App
@@ -17,12 +23,30 @@ logger = logging.getLogger(__name__)
 # --- Editing state ---
 # Decoupled name buffer: only exists while a Name field is being edited.
 # Keeps sc.name (and thus the collapsing header) stable during typing.
+# Keyed by id() of the StateConfig, so removing an earlier row can't hand
+# a buffer to the wrong state.
 _name_buffers: dict[int, str] = {}
 _name_originals: dict[int, str] = {}
 
 # Shared file browser instance
 _file_browser = FileBrowser()
 
+_COL_TEXT = imgui.Col_.text.value
+
+# State-name fields shared by MicConfig and StateGroupConfig
+_MIC_STATE_FIELDS = ("idle_state", "active_state", "intense_state")
+
+# Skip drawing state and group rows that are scrolled out of view
+_row_clipper = RowClipper()
+_group_row_clipper = RowClipper()
+
+# State combo values ("" = none), labels and value -> index, rebuilt only
+# when the names change
+_state_combo_key: tuple[str, ...] | None = None
+_state_values: tuple[str, ...] = ("",)
+_state_labels: tuple[str, ...] = ("(none)",)
+_state_index: dict[str, int] = {}
+
 
 def _commit_rename(app: App, idx: int, old_name: str, new_name: str) -> None:
     """Commit a state rename: update state machine dict and all references."""
@@ -32,36 +56,48 @@ def _commit_rename(app: App, idx: int, old_name: str, new_name: str) -> None:
     config = app.config
     sc = config.states[idx]
     sc.name = new_name
-    state = sm.get_state(old_name)
-    if not state:
+    if sm.rename_state(old_name, new_name) is None:
         return
-    state.name = new_name
-    sm._states.pop(old_name, None)
-    sm._states[new_name] = state
-    # Update mic references
-    if config.mic.idle_state == old_name:
-        config.mic.idle_state = new_name
-        sm.mic_idle_state = new_name
-    if config.mic.active_state == old_name:
-        config.mic.active_state = new_name
-        sm.mic_active_state = new_name
-    if config.mic.intense_state == old_name:
-        config.mic.intense_state = new_name
-        sm.mic_intense_state = new_name
-    # Update sleep state reference
-    if config.general.sleep_state == old_name:
-        config.general.sleep_state = new_name
-    # Update state group references
+    # Update mic and sleep references (mic ones are mirrored on the machine)
+    for obj, attr, sm_attr in (
+        (config.mic, "idle_state", "mic_idle_state"),
+        (config.mic, "active_state", "mic_active_state"),
+        (config.mic, "intense_state", "mic_intense_state"),
+        (config.general, "sleep_state", None),
+    ):
+        if getattr(obj, attr) == old_name:
+            setattr(obj, attr, new_name)
+            if sm_attr:
+                setattr(sm, sm_attr, new_name)
+    # Update state group references, and the runtime tuple of any group
+    # that referred to the old name
     for sg in config.state_groups:
-        if sg.idle_state == old_name:
-            sg.idle_state = new_name
-        if sg.active_state == old_name:
-            sg.active_state = new_name
-        if sg.intense_state == old_name:
-            sg.intense_state = new_name
+        hit = False
+        for attr in _MIC_STATE_FIELDS:
+            if getattr(sg, attr) == old_name:
+                setattr(sg, attr, new_name)
+                hit = True
+        if hit and sg.name in app._state_groups:
+            app._state_groups[sg.name] = (sg.idle_state, sg.active_state, sg.intense_state)
+    app._pin_mic_states()
+
+
+def _update_state_combo(state_names: tuple[str, ...]) -> None:
+    """Rebuild the state combo tables if the state names have changed."""
+    global _state_combo_key, _state_values, _state_labels, _state_index
+    if state_names != _state_combo_key:
+        _state_combo_key = state_names
+        _state_values = ("", *state_names)
+        _state_labels = ("(none)", *state_names)
+        _state_index = {name: i for i, name in enumerate(_state_values)}
+
+
+def _state_combo(label: str, current: str) -> str | None:
+    """Draw a state picker; returns the new state name ("" for none) or None."""
+    return combo_value(label, current, _state_values, _state_labels, _state_index)
 
 
-def draw_states_panel(app: App) -> None:
+def draw_states_panel(app: App, state_names: tuple[str, ...]) -> None:
     """Draw the states configuration panel."""
     sm = app._state_machine
     config = app.config
@@ -70,54 +106,70 @@ def draw_states_panel(app: App) -> None:
     imgui.text("Active state:")
     imgui.same_line()
     if current:
-        imgui.text_colored(imgui.ImVec4(0.4, 1.0, 0.4, 1.0), current.name)
+        imgui.text_colored(colors.GREEN, current.name)
     else:
-        imgui.text_colored(imgui.ImVec4(1.0, 0.4, 0.4, 1.0), "None")
+        imgui.text_colored(colors.RED, "None")
 
     imgui.separator()
     imgui.text("Configured States:")
     imgui.spacing()
 
+    # Rows push integer IDs (no string per row); each list gets its own
+    # scope so state and group rows with the same index don't collide.
     remove_idx = -1
+    names_changed = False  # Renamed, added or removed a state this frame
+    active_name = current.name if current else None
+    active_idx = next((i for i, sc in enumerate(config.states) if sc.name == active_name), -1)
+    imgui.push_id("states")
     for i, sc in enumerate(config.states):
-        imgui.push_id(f"state_{i}")
+        if not _row_clipper.begin_row(i):
+            continue
+        imgui.push_id(i)
 
         # Highlight active state
-        is_active = current and current.name == sc.name
+        is_active = i == active_idx
         if is_active:
-            imgui.push_style_color(imgui.Col_.text.value, imgui.ImVec4(0.4, 1.0, 0.4, 1.0))
+            imgui.push_style_color(_COL_TEXT, colors.GREEN)
 
-        expanded = imgui.collapsing_header(f"{sc.name}##hdr")
+        # The row's push_id(i) already makes the header ID unique
+        expanded = imgui.collapsing_header(sc.name)
 
         if is_active:
             imgui.pop_style_color()
 
         if expanded:
+            # Runtime state for this row; one lookup shared by every field.
+            # A rename below keeps the same State object.
+            state = sm.get_state(sc.name)
+
             # Name — fully decoupled buffer: sc.name stays unchanged during editing
-            buf = _name_buffers.get(i, sc.name)
+            key = id(sc)
+            buf = _name_buffers.get(key, sc.name)
             changed, new_buf = imgui.input_text("Name", buf)
             if imgui.is_item_activated():
-                _name_buffers[i] = sc.name
-                _name_originals[i] = sc.name
+                _name_buffers[key] = sc.name
+                _name_originals[key] = sc.name
             if changed:
-                _name_buffers[i] = new_buf
+                _name_buffers[key] = new_buf
             if imgui.is_item_deactivated_after_edit():
-                old_name = _name_originals.pop(i, sc.name)
-                final_name = _name_buffers.pop(i, new_buf)
+                old_name = _name_originals.pop(key, sc.name)
+                final_name = _name_buffers.pop(key, new_buf)
                 _commit_rename(app, i, old_name, final_name)
+                names_changed = True
             elif imgui.is_item_deactivated():
                 # Cancelled — discard buffer
-                _name_buffers.pop(i, None)
-                _name_originals.pop(i, None)
+                _name_buffers.pop(key, None)
+                _name_originals.pop(key, None)
 
             # File path with Browse button
             imgui.set_next_item_width(imgui.get_content_region_avail().x - 80)
             changed, new_file = imgui.input_text("##file", sc.file)
-            if changed:
+            # input_text also reports edits that leave the text as it was
+            if changed and new_file != sc.file:
                 sc.file = new_file
-                state = sm.get_state(sc.name)
                 if state:
                     state.file = new_file
+                    app._pin_mic_states()
             imgui.same_line()
             if imgui.button("Browse..."):
                 _file_browser.open(i, sc.file)
@@ -126,7 +178,6 @@ def draw_states_panel(app: App) -> None:
             changed, new_loop = imgui.checkbox("Loop", sc.loop)
             if changed:
                 sc.loop = new_loop
-                state = sm.get_state(sc.name)
                 if state:
                     state.loop = new_loop
 
@@ -134,14 +185,13 @@ def draw_states_panel(app: App) -> None:
             changed, new_speed = imgui.slider_float("Speed", sc.speed, 0.1, 5.0, "%.1fx")
             if changed:
                 sc.speed = new_speed
-                state = sm.get_state(sc.name)
-                if state:
-                    state.speed = new_speed
+            # Apply to the running state once the drag ends
+            if state and imgui.is_item_deactivated_after_edit():
+                state.speed = sc.speed
 
             # Activate button
             if not is_active:
                 if imgui.button("Activate"):
-                    from nixchirp.state.machine import EventType, StateEvent
                     sm.push_event(StateEvent(EventType.SET_STATE, target_state=sc.name))
 
             # Remove button
@@ -150,13 +200,18 @@ def draw_states_panel(app: App) -> None:
                 remove_idx = i
 
         imgui.pop_id()
+        _row_clipper.end_row(i)
+    imgui.pop_id()
 
     # Process removal
     if remove_idx >= 0:
         removed = config.states.pop(remove_idx)
+        names_changed = True
+        _row_clipper.invalidate(remove_idx)
         sm._states.pop(removed.name, None)
-        _name_buffers.pop(remove_idx, None)
-        _name_originals.pop(remove_idx, None)
+        app._pin_mic_states()
+        _name_buffers.pop(id(removed), None)
+        _name_originals.pop(id(removed), None)
         # If the removed state was the current state, clear it
         if current and current.name == removed.name:
             if config.states:
@@ -174,12 +229,11 @@ def draw_states_panel(app: App) -> None:
 
     # Add new state
     if imgui.button("+ Add State"):
-        from nixchirp.config import StateConfig
-        from nixchirp.state.state import State
         new_name = f"state_{len(config.states)}"
         sc = StateConfig(name=new_name, file="")
         config.states.append(sc)
         sm.add_state(State(name=new_name, file=""))
+        names_changed = True
 
     # --- File browser (rendered outside collapsing headers) ---
     _file_browser.draw()
@@ -192,6 +246,7 @@ def draw_states_panel(app: App) -> None:
             state = sm.get_state(sc.name)
             if state:
                 state.file = path
+                app._pin_mic_states()
 
     # ===== Default Group & State Groups =====
     imgui.spacing()
@@ -199,37 +254,32 @@ def draw_states_panel(app: App) -> None:
     imgui.text("Default Group (fallback states)")
     imgui.spacing()
 
-    state_names = ["(none)"] + sm.state_names
+    if names_changed:
+        # The overlay's snapshot predates this frame's edits; refresh it so
+        # the combos below already match the state list
+        state_names = tuple(sm.state_names)
+    _update_state_combo(state_names)
 
     # Idle state (mouth closed)
-    current_idle_idx = 0
-    if config.mic.idle_state in state_names:
-        current_idle_idx = state_names.index(config.mic.idle_state)
-    changed, new_idx = imgui.combo("Idle state", current_idle_idx, state_names)
-    if changed:
-        name = state_names[new_idx] if new_idx > 0 else ""
+    name = _state_combo("Idle state", config.mic.idle_state)
+    if name is not None:
         config.mic.idle_state = name
         sm.mic_idle_state = name
+        app._pin_mic_states()
 
     # Active state (mouth open)
-    current_active_idx = 0
-    if config.mic.active_state in state_names:
-        current_active_idx = state_names.index(config.mic.active_state)
-    changed, new_idx = imgui.combo("Active state", current_active_idx, state_names)
-    if changed:
-        name = state_names[new_idx] if new_idx > 0 else ""
+    name = _state_combo("Active state", config.mic.active_state)
+    if name is not None:
         config.mic.active_state = name
         sm.mic_active_state = name
+        app._pin_mic_states()
 
     # Intense state
-    current_intense_idx = 0
-    if config.mic.intense_state in state_names:
-        current_intense_idx = state_names.index(config.mic.intense_state)
-    changed, new_idx = imgui.combo("Intense state", current_intense_idx, state_names)
-    if changed:
-        name = state_names[new_idx] if new_idx > 0 else ""
+    name = _state_combo("Intense state", config.mic.intense_state)
+    if name is not None:
         config.mic.intense_state = name
         sm.mic_intense_state = name
+        app._pin_mic_states()
 
     imgui.spacing()
     imgui.separator()
@@ -247,15 +297,18 @@ def draw_states_panel(app: App) -> None:
         if active:
             imgui.text("Active group:")
             imgui.same_line()
-            imgui.text_colored(imgui.ImVec4(0.4, 0.8, 1.0, 1.0), active)
+            imgui.text_colored(colors.CYAN, active)
         else:
             imgui.text("Active group: default")
 
         imgui.spacing()
 
         remove_group_idx = -1
+        imgui.push_id("groups")
         for gi, sg in enumerate(config.state_groups):
-            imgui.push_id(f"sg_{gi}")
+            if not _group_row_clipper.begin_row(gi):
+                continue
+            imgui.push_id(gi)
 
             # Group name
             changed, new_name = imgui.input_text("Name", sg.name)
@@ -267,47 +320,37 @@ def draw_states_panel(app: App) -> None:
                 if new_name:
                     app._state_groups[new_name] = (sg.idle_state, sg.active_state, sg.intense_state)
 
-            # Idle state for this group
-            g_idle_idx = 0
-            if sg.idle_state in state_names:
-                g_idle_idx = state_names.index(sg.idle_state)
-            changed, new_idx = imgui.combo("Idle", g_idle_idx, state_names)
-            if changed:
-                sg.idle_state = state_names[new_idx] if new_idx > 0 else ""
-                if sg.name in app._state_groups:
-                    app._state_groups[sg.name] = (sg.idle_state, sg.active_state, sg.intense_state)
-
-            # Active state for this group
-            g_active_idx = 0
-            if sg.active_state in state_names:
-                g_active_idx = state_names.index(sg.active_state)
-            changed, new_idx = imgui.combo("Active", g_active_idx, state_names)
-            if changed:
-                sg.active_state = state_names[new_idx] if new_idx > 0 else ""
-                if sg.name in app._state_groups:
-                    app._state_groups[sg.name] = (sg.idle_state, sg.active_state, sg.intense_state)
-
-            # Intense state for this group
-            g_intense_idx = 0
-            if sg.intense_state in state_names:
-                g_intense_idx = state_names.index(sg.intense_state)
-            changed, new_idx = imgui.combo("Intense", g_intense_idx, state_names)
-            if changed:
-                sg.intense_state = state_names[new_idx] if new_idx > 0 else ""
-                if sg.name in app._state_groups:
-                    app._state_groups[sg.name] = (sg.idle_state, sg.active_state, sg.intense_state)
+            # Mic states for this group; the runtime tuple is rebuilt once
+            # if any of them changed
+            changed = False
+            name = _state_combo("Idle", sg.idle_state)
+            if name is not None:
+                sg.idle_state = name
+                changed = True
+            name = _state_combo("Active", sg.active_state)
+            if name is not None:
+                sg.active_state = name
+                changed = True
+            name = _state_combo("Intense", sg.intense_state)
+            if name is not None:
+                sg.intense_state = name
+                changed = True
+            if changed and sg.name in app._state_groups:
+                app._state_groups[sg.name] = (sg.idle_state, sg.active_state, sg.intense_state)
 
             if imgui.button("Remove Group"):
                 remove_group_idx = gi
 
             imgui.separator()
             imgui.pop_id()
+            _group_row_clipper.end_row(gi)
+        imgui.pop_id()
 
         if remove_group_idx >= 0:
             removed = config.state_groups.pop(remove_group_idx)
+            _group_row_clipper.invalidate(remove_group_idx)
             if removed.name in app._state_groups:
                 del app._state_groups[removed.name]
 
         if imgui.button("+ Add Group"):
-            from nixchirp.config import StateGroupConfig
             config.state_groups.append(StateGroupConfig())
@@ -0,0 +1,23 @@
+"""Small widget helpers shared by the GUI panels."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+from imgui_bundle import imgui
+
+
+def combo_value(
+    label: str,
+    current: str,
+    values: Sequence[str],
+    labels: Sequence[str],
+    index: Mapping[str, int],
+) -> str | None:
+    """Draw a combo over *values*, shown as *labels*.
+
+    *index* maps each value to its position; an unknown *current* shows the
+    first entry.  Returns the newly selected value, or None if unchanged.
+    """
+    changed, new_idx = imgui.combo(label, index.get(current, 0), labels)
+    return values[new_idx] if changed else None
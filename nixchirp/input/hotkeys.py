@@ -11,8 +11,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import queue
 import threading
+from collections import deque
 from dataclasses import dataclass
 from typing import Callable
 
@@ -35,8 +35,14 @@ _PORTAL_PATH = "/org/freedesktop/portal/desktop"
 _PORTAL_IFACE = "org.freedesktop.portal.GlobalShortcuts"
 _REQUEST_IFACE = "org.freedesktop.portal.Request"
 
+# Mapping action -> event pushed when its shortcut is pressed
+_ACTION_EVENTS = {
+    "set_group": EventType.GROUP_CHANGE,
+    "set_state": EventType.HOTKEY_TRIGGER,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class HotkeyMapping:
     """Maps a shortcut to an action."""
 
@@ -46,6 +52,11 @@ class HotkeyMapping:
     trigger: str = ""         # Bound trigger description (read-only, set by portal)
 
 
+def _mappings_key(mappings: list[HotkeyMapping]) -> tuple[tuple[str, str], ...]:
+    """What a bind depends on: each mapping's (action, target), in order."""
+    return tuple((m.action, m.target) for m in mappings)
+
+
 class HotkeyInput:
     """Global hotkey capture via XDG Desktop Portal GlobalShortcuts.
 
@@ -55,15 +66,26 @@ class HotkeyInput:
 
     def __init__(
         self,
-        event_queue: queue.Queue[StateEvent] | None,
+        event_queue: deque[StateEvent] | None,
         mappings: list[HotkeyMapping] | None = None,
     ) -> None:
         self._event_queue = event_queue
         self._mappings: list[HotkeyMapping] = mappings or []
+        # shortcut_id -> mapping for the portal signal handlers.  Replaced
+        # (never mutated) so the D-Bus thread always sees a whole dict.
+        self._mapping_by_id: dict[str, HotkeyMapping] = {}
+        self._index_mappings()
+        # (action, target) of each mapping at the last successful bind, and
+        # the (shortcut_id, trigger) the portal gave them
+        self._bound_key: tuple[tuple[str, str], ...] | None = None
+        self._bound_ids: list[tuple[str, str]] = []
 
         self._loop: asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None = None
         self._bus: MessageBus | None = None  # type: ignore[assignment]
+        self._portal_iface = None  # GlobalShortcuts proxy interface, introspected once
+        # Portal request object path -> future awaiting its Response signal
+        self._pending_responses: dict[str, asyncio.Future] = {}
         self._session_path: str = ""
         self._running = False
         self._shutdown_event: asyncio.Event | None = None
@@ -95,7 +117,22 @@ class HotkeyInput:
 
     @mappings.setter
     def mappings(self, value: list[HotkeyMapping]) -> None:
+        if self._bound_key is not None and _mappings_key(value) == self._bound_key:
+            # Same shortcuts as last bound: keep their portal bindings
+            for m, (shortcut_id, trigger) in zip(value, self._bound_ids):
+                m.shortcut_id = shortcut_id
+                m.trigger = trigger
         self._mappings = value
+        self._index_mappings()
+
+    @property
+    def needs_bind(self) -> bool:
+        """True if the mappings differ from what was last bound with the portal."""
+        return _mappings_key(self._mappings) != self._bound_key
+
+    def _index_mappings(self) -> None:
+        """Rebuild the shortcut_id lookup from the current mappings."""
+        self._mapping_by_id = {m.shortcut_id: m for m in self._mappings if m.shortcut_id}
 
     @property
     def session_active(self) -> bool:
@@ -136,6 +173,7 @@ class HotkeyInput:
 
         try:
             self._bus = await MessageBus().connect()
+            self._bus.add_message_handler(self._dispatch_response)
             logger.info("D-Bus session connected")
         except Exception:
             logger.warning("Cannot connect to session D-Bus", exc_info=True)
@@ -148,6 +186,7 @@ class HotkeyInput:
             introspection = await self._bus.introspect(_PORTAL_BUS, _PORTAL_PATH)
             proxy = self._bus.get_proxy_object(_PORTAL_BUS, _PORTAL_PATH, introspection)
             iface = proxy.get_interface(_PORTAL_IFACE)
+            self._portal_iface = iface
             self._portal_available = True
             logger.info("GlobalShortcuts portal found")
         except Exception as e:
@@ -220,8 +259,8 @@ class HotkeyInput:
         """Call a portal method and wait for its Response signal.
 
         Portal methods return a request object path.  The actual result
-        arrives as a Response signal on that path.  We use a raw message
-        handler (not introspection) because the request object doesn't
+        arrives as a Response signal on that path.  A raw message handler
+        (not introspection) picks it up, because the request object doesn't
         exist until AFTER the method call.
         """
         assert self._bus is not None
@@ -243,23 +282,10 @@ class HotkeyInput:
 
         request_path = f"/org/freedesktop/portal/desktop/request/{sender}/{token}"
 
-        # Subscribe via raw message handler BEFORE making the call.
-        # This avoids the race: the request object doesn't exist yet,
-        # so we can't introspect it.  The handler matches by path.
-        def _response_handler(msg: Message) -> bool:
-            if (msg.message_type == MessageType.SIGNAL
-                    and msg.path == request_path
-                    and msg.member == "Response"
-                    and msg.interface == _REQUEST_IFACE):
-                body = msg.body  # [uint32 response, dict results]
-                if len(body) >= 2 and not response_future.done():
-                    self._loop.call_soon_threadsafe(
-                        response_future.set_result, (body[0], body[1])
-                    )
-                return True  # Remove handler after first match
-            return False
-
-        self._bus.add_message_handler(_response_handler)
+        # Register BEFORE making the call to avoid the race: the request
+        # object doesn't exist yet, so we can't introspect it.  The shared
+        # dispatcher matches the Response signal by path.
+        self._pending_responses[request_path] = response_future
 
         # Make the actual call
         try:
@@ -268,11 +294,8 @@ class HotkeyInput:
             logger.debug("Portal %s call returned: %s", method_name, result)
         except Exception:
             logger.warning("Portal %s call failed", method_name, exc_info=True)
-            # Remove our handler since we won't get a response
-            try:
-                self._bus.remove_message_handler(_response_handler)
-            except Exception:
-                pass
+            # We won't get a response
+            self._pending_responses.pop(request_path, None)
             return None
 
         # Wait for response with timeout
@@ -280,17 +303,40 @@ class HotkeyInput:
             return await asyncio.wait_for(response_future, timeout=30.0)
         except asyncio.TimeoutError:
             logger.warning("Portal %s response timed out (30s)", method_name)
-            try:
-                self._bus.remove_message_handler(_response_handler)
-            except Exception:
-                pass
+            self._pending_responses.pop(request_path, None)
             return None
 
-    async def _bind_shortcuts_async(self, iface=None) -> None:
-        """Bind current mappings as portal shortcuts."""
+    def _dispatch_response(self, msg: Message) -> bool:
+        """Bus message handler: resolve the pending call a Response belongs to.
+
+        Installed once per connection; runs on the event loop thread.
+        """
+        if (msg.message_type != MessageType.SIGNAL
+                or msg.member != "Response"
+                or msg.interface != _REQUEST_IFACE):
+            return False
+        response_future = self._pending_responses.pop(msg.path, None)
+        if response_future is None:
+            return False
+        body = msg.body  # [uint32 response, dict results]
+        if len(body) >= 2 and not response_future.done():
+            response_future.set_result((body[0], body[1]))
+        return True
+
+    async def _bind_shortcuts_async(self, iface=None, force: bool = False) -> None:
+        """Bind current mappings as portal shortcuts.
+
+        Skipped (no portal round-trip or dialog) when the mappings are
+        unchanged since the last successful bind, unless *force* is set.
+        """
         if not self._session_path or not self._bus:
             return
+        if not force and not self.needs_bind:
+            logger.debug("Shortcuts unchanged, skipping rebind")
+            return
 
+        if iface is None:
+            iface = self._portal_iface
         if iface is None:
             try:
                 introspection = await self._bus.introspect(_PORTAL_BUS, _PORTAL_PATH)
@@ -299,6 +345,7 @@ class HotkeyInput:
             except Exception:
                 logger.warning("Failed to get portal interface for rebind")
                 return
+            self._portal_iface = iface
 
         # Build shortcuts array: list of (id, properties_dict)
         shortcuts = []
@@ -311,6 +358,7 @@ class HotkeyInput:
                 "description": Variant("s", desc),
             }
             shortcuts.append((shortcut_id, props))
+        self._index_mappings()
 
         if not shortcuts:
             logger.info("No shortcuts to bind")
@@ -337,17 +385,19 @@ class HotkeyInput:
             if response_code != 0:
                 logger.warning("BindShortcuts denied (code %d)", response_code)
                 self._status = "Binding denied"
+                self._bound_key = None
                 return
 
             # Update trigger descriptions from response
             bound = response_data.get("shortcuts", Variant("a(sa{sv})", [])).value
             for shortcut_id, props in bound:
                 trigger = props.get("trigger_description", Variant("s", "")).value
-                for m in self._mappings:
-                    if m.shortcut_id == shortcut_id:
-                        m.trigger = trigger
-                        break
+                m = self._mapping_by_id.get(shortcut_id)
+                if m is not None:
+                    m.trigger = trigger
 
+            self._bound_key = _mappings_key(self._mappings)
+            self._bound_ids = [(m.shortcut_id, m.trigger) for m in self._mappings]
             logger.info("Portal shortcuts bound: %d shortcuts", len(shortcuts))
             self._status = "Active"
 
@@ -355,15 +405,17 @@ class HotkeyInput:
             logger.warning("Failed to bind shortcuts", exc_info=True)
             self._status = "Binding error"
 
-    def bind_shortcuts(self) -> None:
+    def bind_shortcuts(self, force: bool = False) -> None:
         """Trigger shortcut binding (shows system dialog).
 
+        Does nothing if the mappings are unchanged since the last bind,
+        unless *force* is set (e.g. to pick different keys).
         Call from the main thread — schedules the bind on the async loop.
         """
         if not self._loop or not self._running:
             return
         asyncio.run_coroutine_threadsafe(
-            self._bind_shortcuts_async(), self._loop
+            self._bind_shortcuts_async(force=force), self._loop
         )
 
     def _on_activated(self, session_handle: str, shortcut_id: str, timestamp: int, options: dict) -> None:
@@ -371,29 +423,15 @@ class HotkeyInput:
         if session_handle != self._session_path:
             return
 
-        for mapping in self._mappings:
-            if mapping.shortcut_id != shortcut_id:
-                continue
-
-            if mapping.action == "set_group" and mapping.target:
-                self._event_queue.put_nowait(
-                    StateEvent(
-                        EventType.GROUP_CHANGE,
-                        target_state=mapping.target,
-                    )
-                )
-                logger.debug("Portal shortcut %s → set_group '%s'",
-                             shortcut_id, mapping.target)
-            elif mapping.action == "set_state" and mapping.target:
-                self._event_queue.put_nowait(
-                    StateEvent(
-                        EventType.HOTKEY_TRIGGER,
-                        target_state=mapping.target,
-                    )
-                )
-                logger.debug("Portal shortcut %s → set_state '%s'",
-                             shortcut_id, mapping.target)
-            break
+        mapping = self._mapping_by_id.get(shortcut_id)
+        if mapping is None or not mapping.target:
+            return
+        event_type = _ACTION_EVENTS.get(mapping.action)
+        if event_type is not None:
+            # deque.append is atomic; the main loop drains it without a lock
+            self._event_queue.append(StateEvent(event_type, target_state=mapping.target))
+            logger.debug("Portal shortcut %s → %s '%s'",
+                         shortcut_id, mapping.action, mapping.target)
 
     def _on_deactivated(self, session_handle: str, shortcut_id: str, timestamp: int, options: dict) -> None:
         """Portal signal: a global shortcut was released."""
@@ -401,17 +439,13 @@ class HotkeyInput:
             return
 
         # For momentary group changes, release reverts to default
-        for mapping in self._mappings:
-            if mapping.shortcut_id != shortcut_id:
-                continue
-
-            if mapping.action == "set_group":
-                self._event_queue.put_nowait(
-                    StateEvent(EventType.GROUP_CHANGE, target_state="")
-                )
-                logger.debug("Portal shortcut %s released → revert group",
-                             shortcut_id)
-            break
+        mapping = self._mapping_by_id.get(shortcut_id)
+        if mapping is not None and mapping.action == "set_group":
+            self._event_queue.append(
+                StateEvent(EventType.GROUP_CHANGE, target_state="")
+            )
+            logger.debug("Portal shortcut %s released → revert group",
+                         shortcut_id)
 
     def stop(self) -> None:
         """Stop the portal session gracefully."""
@@ -424,6 +458,9 @@ class HotkeyInput:
             self._thread = None
         self._loop = None
         self._bus = None
+        self._portal_iface = None
+        self._pending_responses.clear()
+        self._bound_key = None
         self._session_path = ""
         self._portal_available = False
         self._shutdown_event = None
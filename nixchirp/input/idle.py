@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from enum import Enum, auto
 
 logger = logging.getLogger(__name__)
@@ -20,16 +21,20 @@ class SleepTimer:
 
     Not a background thread — call :meth:`update` each frame from the main
     loop.  Call :meth:`activity` whenever any input source is active (mic
-    speaking, MIDI event, hotkey press).
+    speaking, MIDI event, hotkey press).  Inactivity is measured against
+    the monotonic clock, so per-frame deltas don't accumulate drift.
 
     Args:
         timeout_seconds: Seconds of inactivity before sleeping.
                          0 or negative disables the timer.
     """
 
+    __slots__ = ("_timeout", "_last_activity", "_wake_requested", "_sleeping", "_enabled")
+
     def __init__(self, timeout_seconds: float = 30.0) -> None:
         self._timeout = max(0.0, float(timeout_seconds))
-        self._elapsed: float = 0.0
+        self._last_activity = time.monotonic()
+        self._wake_requested = False  # activity() seen while asleep
         self._sleeping = False
         self._enabled = self._timeout > 0
 
@@ -43,22 +48,30 @@ class SleepTimer:
 
     @timeout.setter
     def timeout(self, value: float) -> None:
+        was_enabled = self._enabled
         self._timeout = max(0.0, float(value))
         self._enabled = self._timeout > 0
+        if self._enabled and not was_enabled:
+            # Inactivity only counts while enabled; start afresh
+            self._last_activity = time.monotonic()
         if not self._enabled and self._sleeping:
             # Disabling while asleep → wake up
             self._sleeping = False
-            self._elapsed = 0.0
+            self._wake_requested = False
+            self._last_activity = time.monotonic()
 
     def activity(self) -> None:
         """Signal that input activity occurred — resets the inactivity timer."""
-        self._elapsed = 0.0
+        self._last_activity = time.monotonic()
+        if self._sleeping:
+            self._wake_requested = True
 
     def update(self, dt: float) -> SleepEvent | None:
         """Tick the timer.  Returns an event if the sleep state changed.
 
         Args:
-            dt: Time delta in seconds since last frame.
+            dt: Time delta in seconds since last frame.  Unused; kept for
+                callers that tick every timer with the frame delta.
 
         Returns:
             ``SleepEvent.FELL_ASLEEP`` when transitioning to sleep,
@@ -69,16 +82,16 @@ class SleepTimer:
             return None
 
         if self._sleeping:
-            # Already asleep — check if activity() was called (elapsed was reset)
-            if self._elapsed == 0.0:
+            # Already asleep — wake if activity() was called since
+            if self._wake_requested:
+                self._wake_requested = False
                 self._sleeping = False
                 logger.info("Sleep timer: woke up")
                 return SleepEvent.WOKE_UP
             return None
 
-        # Awake — accumulate inactivity
-        self._elapsed += dt
-        if self._elapsed >= self._timeout:
+        # Awake — check how long since the last activity
+        if time.monotonic() - self._last_activity >= self._timeout:
             self._sleeping = True
             logger.info("Sleep timer: fell asleep after %.0fs", self._timeout)
             return SleepEvent.FELL_ASLEEP
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import logging
-import queue
 import threading
+from collections import deque
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -26,18 +26,63 @@ except (ImportError, OSError):
     logger.warning("sounddevice not available — mic input disabled")
 
 
+def _vad_step(
+    rms: float,
+    chunk_s: float,
+    open_threshold: float,
+    intense_threshold: float,
+    hold_time_s: float,
+    was_active: bool,
+    was_intense: bool,
+    hold_timer: float,
+) -> tuple[bool, bool, float, EventType | None]:
+    """Advance the voice activity hysteresis by one chunk.
+
+    Returns (is_active, is_intense, hold_timer, event), where event is the
+    transition to emit, or None.
+    """
+    if rms >= open_threshold:
+        is_active = True
+        is_intense = rms >= intense_threshold
+        hold_timer = hold_time_s
+    else:
+        # Below open threshold — stay active until the hold timer runs out
+        is_active = was_active
+        is_intense = False
+        if was_active:
+            hold_timer -= chunk_s
+            if hold_timer <= 0:
+                is_active = False
+                hold_timer = 0.0
+
+    if is_intense and not was_intense:
+        event = EventType.MIC_INTENSE
+    elif is_active and not was_active:
+        event = EventType.MIC_ACTIVE
+    elif was_active and not is_active:
+        event = EventType.MIC_IDLE
+    elif is_active and was_intense and not is_intense:
+        # Dropped from intense to normal active
+        event = EventType.MIC_ACTIVE
+    else:
+        event = None
+    return is_active, is_intense, hold_timer, event
+
+
 class MicInput:
     """Captures audio from microphone and detects voice activity.
 
     Produces MIC_ACTIVE / MIC_IDLE / MIC_INTENSE events based on
     configurable thresholds with hysteresis.
 
-    Runs audio capture on a background thread via sounddevice's callback API.
+    Reads audio on a background thread with sounddevice's blocking API:
+    PortAudio buffers samples on the C side, so no Python code runs on the
+    real-time audio callback thread and GIL stalls can't cause dropouts.
     """
 
     def __init__(
         self,
-        event_queue: queue.Queue[StateEvent],
+        event_queue: deque[StateEvent],
         device: str | int | None = None,
         open_threshold: float = 0.08,
         close_threshold: float = 0.05,
@@ -61,8 +106,9 @@ class MicInput:
         self._hold_timer: float = 0.0
         self._current_rms: float = 0.0
         self._stream: sd.InputStream | None = None if _HAS_SOUNDDEVICE else None
+        self._thread: threading.Thread | None = None
+        self._capturing = False
         self._enabled = True
-        self._lock = threading.Lock()
 
     @property
     def available(self) -> bool:
@@ -78,6 +124,7 @@ class MicInput:
 
     @property
     def current_rms(self) -> float:
+        """Latest chunk's RMS; an eventually-consistent snapshot."""
         return self._current_rms
 
     @property
@@ -86,6 +133,7 @@ class MicInput:
 
     @property
     def is_active(self) -> bool:
+        """Whether voice is detected; an eventually-consistent snapshot."""
         return self._is_active
 
     def start(self) -> None:
@@ -94,6 +142,9 @@ class MicInput:
             logger.warning("Cannot start mic — sounddevice not available")
             return
 
+        if self._thread is not None:
+            return
+
         try:
             self._stream = sd.InputStream(
                 device=self._device,
@@ -101,9 +152,11 @@ class MicInput:
                 samplerate=self._sample_rate,
                 blocksize=self._chunk_size,
                 dtype="float32",
-                callback=self._audio_callback,
             )
             self._stream.start()
+            self._capturing = True
+            self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._thread.start()
             logger.info(
                 "Mic started (device=%s, rate=%d, chunk=%d)",
                 self._device or "default",
@@ -115,6 +168,11 @@ class MicInput:
 
     def stop(self) -> None:
         """Stop capturing audio."""
+        self._capturing = False
+        if self._thread:
+            # read() returns after at most one chunk, so this is quick
+            self._thread.join(timeout=1.0)
+            self._thread = None
         if self._stream:
             try:
                 self._stream.stop()
@@ -124,60 +182,47 @@ class MicInput:
             self._stream = None
             logger.info("Mic stopped")
 
-    def _audio_callback(
-        self,
-        indata: np.ndarray,
-        frames: int,
-        time_info: object,
-        status: object,
-    ) -> None:
-        """Called by sounddevice on the audio thread for each chunk."""
+    def _capture_loop(self) -> None:
+        """Background thread: read chunks from the stream and run detection."""
+        stream = self._stream
+        while self._capturing and stream is not None:
+            try:
+                indata, _overflowed = stream.read(self._chunk_size)
+            except Exception:
+                if self._capturing:
+                    logger.debug("Mic read error", exc_info=True)
+                break
+            self._process_block(indata, len(indata))
+        self._capturing = False
+
+    def _process_block(self, indata: np.ndarray, frames: int) -> None:
+        """Run voice activity detection on one chunk of samples."""
         if not self._enabled:
             return
 
-        rms = compute_rms(indata)
+        # The stream is opened mono; a 1-D view skips the channel average
+        rms = compute_rms(indata[:, 0])
         self._current_rms = rms
 
-        with self._lock:
-            was_active = self._is_active
-            was_intense = self._is_intense
-
-            if rms >= self._open_threshold:
-                self._is_active = True
-                self._hold_timer = self._hold_time_s
-
-                if rms >= self._intense_threshold:
-                    self._is_intense = True
-                else:
-                    self._is_intense = False
-            else:
-                # Below open threshold — check hold timer
-                self._is_intense = False
-                if self._is_active:
-                    chunk_duration = frames / self._sample_rate
-                    self._hold_timer -= chunk_duration
-                    if self._hold_timer <= 0:
-                        self._is_active = False
-                        self._hold_timer = 0.0
-
-            # Emit events on transitions
-            if self._is_intense and not was_intense:
-                self._event_queue.put_nowait(
-                    StateEvent(EventType.MIC_INTENSE, value=rms)
-                )
-            elif self._is_active and not was_active:
-                self._event_queue.put_nowait(
-                    StateEvent(EventType.MIC_ACTIVE, value=rms)
-                )
-            elif not self._is_active and was_active:
-                self._event_queue.put_nowait(
-                    StateEvent(EventType.MIC_IDLE, value=rms)
-                )
-            elif self._is_active and was_intense and not self._is_intense:
-                # Dropped from intense to normal active
-                self._event_queue.put_nowait(
-                    StateEvent(EventType.MIC_ACTIVE, value=rms)
-                )
+        # Quiet and already idle: the step below would change nothing
+        if rms < self._open_threshold and not self._is_active:
+            return
+
+        # Only the capture thread writes detection state, so no lock is
+        # needed; other threads read single attributes as snapshots
+        self._is_active, self._is_intense, self._hold_timer, event = _vad_step(
+            rms,
+            frames / self._sample_rate,
+            self._open_threshold,
+            self._intense_threshold,
+            self._hold_time_s,
+            self._is_active,
+            self._is_intense,
+            self._hold_timer,
+        )
+
+        if event is not None:
+            self._event_queue.append(StateEvent(event, value=rms))
 
     @staticmethod
     def list_devices() -> list[dict]:
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import logging
-import queue
 import threading
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING
@@ -33,7 +33,7 @@ class MidiEventType(Enum):
     PROGRAM_CHANGE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class MidiEvent:
     """A parsed MIDI event."""
     event_type: MidiEventType
@@ -43,7 +43,28 @@ class MidiEvent:
     port_name: str = ""     # Source port name
 
 
-@dataclass
+# Config event type name -> MidiEventType
+_TYPE_MAP = {
+    "note_on": MidiEventType.NOTE_ON,
+    "note_off": MidiEventType.NOTE_OFF,
+    "cc": MidiEventType.CONTROL_CHANGE,
+    "program_change": MidiEventType.PROGRAM_CHANGE,
+}
+
+# Mapping fields that decide which events a mapping can match
+INDEXED_MAPPING_FIELDS = frozenset(("event_type", "channel", "note", "mode"))
+
+
+def _event_key(
+    event_type: MidiEventType | None, channel: int, note: int,
+) -> tuple[MidiEventType | None, int, int]:
+    """Key events and mappings are indexed by; program changes ignore the note."""
+    if event_type is MidiEventType.PROGRAM_CHANGE:
+        note = 0
+    return event_type, channel, note
+
+
+@dataclass(slots=True)
 class MidiMapping:
     """Maps a MIDI event pattern to an action."""
     device: str = ""                # Device/port name ("" = any device)
@@ -61,14 +82,7 @@ class MidiMapping:
             return False
 
         # Event type
-        type_map = {
-            "note_on": MidiEventType.NOTE_ON,
-            "note_off": MidiEventType.NOTE_OFF,
-            "cc": MidiEventType.CONTROL_CHANGE,
-            "program_change": MidiEventType.PROGRAM_CHANGE,
-        }
-        expected_type = type_map.get(self.event_type)
-        if expected_type != event.event_type:
+        if _TYPE_MAP.get(self.event_type) != event.event_type:
             return False
 
         # Channel
@@ -97,6 +111,34 @@ class MidiMapping:
         return True
 
 
+def _parse_note_on(event) -> MidiEvent:
+    if event.velocity == 0:
+        # Note On with velocity 0 is treated as Note Off
+        return MidiEvent(MidiEventType.NOTE_OFF, event.channel, event.note, 0)
+    return MidiEvent(MidiEventType.NOTE_ON, event.channel, event.note, event.velocity)
+
+
+def _parse_note_off(event) -> MidiEvent:
+    return MidiEvent(MidiEventType.NOTE_OFF, event.channel, event.note, event.velocity)
+
+
+def _parse_control_change(event) -> MidiEvent:
+    return MidiEvent(MidiEventType.CONTROL_CHANGE, event.channel, event.param, event.value)
+
+
+def _parse_program_change(event) -> MidiEvent:
+    return MidiEvent(MidiEventType.PROGRAM_CHANGE, event.channel, event.value, 0)
+
+
+# alsa_midi event class -> parser; looked up by exact type, one dict hit per event
+_PARSE_HANDLERS = {
+    alsa_midi.NoteOnEvent: _parse_note_on,
+    alsa_midi.NoteOffEvent: _parse_note_off,
+    alsa_midi.ControlChangeEvent: _parse_control_change,
+    alsa_midi.ProgramChangeEvent: _parse_program_change,
+} if _HAS_ALSA_MIDI else {}
+
+
 class MidiInput:
     """ALSA MIDI input — listens for events and routes them via mappings.
 
@@ -107,11 +149,14 @@ class MidiInput:
 
     def __init__(
         self,
-        event_queue: queue.Queue[StateEvent],
+        event_queue: deque[StateEvent],
         mappings: list[MidiMapping] | None = None,
     ) -> None:
         self._event_queue = event_queue
         self._mappings: list[MidiMapping] = mappings or []
+        # (event type, channel, note) -> mappings that may match or release on it
+        self._index: dict[tuple, list[MidiMapping]] = {}
+        self._index_mappings()
         self._client: alsa_midi.SequencerClient | None = None
         self._port: alsa_midi.Port | None = None
         self._running = False
@@ -133,6 +178,30 @@ class MidiInput:
     @mappings.setter
     def mappings(self, value: list[MidiMapping]) -> None:
         self._mappings = value
+        self._index_mappings()
+
+    def reindex_mappings(self) -> None:
+        """Rebuild the lookup index after editing mappings in place.
+
+        Needed when any of INDEXED_MAPPING_FIELDS changed.
+        """
+        self._index_mappings()
+
+    def _index_mappings(self) -> None:
+        """Bucket mappings by the events they can respond to.
+
+        Each mapping is listed under its trigger key and, if momentary, the
+        note-off key that releases it, keeping the mapping order.  The new
+        dict is swapped in whole, so the MIDI thread never sees it half built.
+        """
+        index: dict[tuple, list[MidiMapping]] = {}
+        for mapping in self._mappings:
+            keys = {_event_key(_TYPE_MAP.get(mapping.event_type), mapping.channel, mapping.note)}
+            if mapping.mode == "momentary":
+                keys.add(_event_key(MidiEventType.NOTE_OFF, mapping.channel, mapping.note))
+            for key in keys:
+                index.setdefault(key, []).append(mapping)
+        self._index = index
 
     @property
     def learn_mode(self) -> bool:
@@ -172,6 +241,7 @@ class MidiInput:
         """Stop the MIDI listener."""
         self._running = False
         if self._thread:
+            self._wake_listener()
             self._thread.join(timeout=2.0)
             self._thread = None
         if self._client:
@@ -243,12 +313,31 @@ class MidiInput:
         self._learn_mode = False
         self._learn_callback = None
 
+    def _wake_listener(self) -> None:
+        """Unblock the listener's event_input() by sending our port an event.
+
+        Active sensing carries no data and isn't parsed, so the loop just
+        wakes, sees _running is False and exits.
+        """
+        if not self._client or not self._port:
+            return
+        try:
+            self._client.event_output(
+                alsa_midi.ActiveSensingEvent(),
+                port=self._port,
+                dest=alsa_midi.Address(self._client.client_id, self._port.port_id),
+            )
+            self._client.drain_output()
+        except Exception:
+            logger.debug("Could not wake MIDI listener", exc_info=True)
+
     def _listen_loop(self) -> None:
-        """Background thread: poll ALSA sequencer for events."""
+        """Background thread: wait on the ALSA sequencer for events."""
         while self._running:
             try:
-                event = self._client.event_input(timeout=0.1)
-                if event is None:
+                # Blocks until an event arrives; stop() sends one to wake us
+                event = self._client.event_input()
+                if event is None or not self._running:
                     continue
                 midi_event = self._parse_event(event)
                 if midi_event is None:
@@ -274,50 +363,16 @@ class MidiInput:
 
     def _parse_event(self, event) -> MidiEvent | None:
         """Parse an alsa_midi event into our MidiEvent."""
-        if isinstance(event, alsa_midi.NoteOnEvent):
-            if event.velocity == 0:
-                # Note On with velocity 0 is treated as Note Off
-                return MidiEvent(
-                    event_type=MidiEventType.NOTE_OFF,
-                    channel=event.channel,
-                    note=event.note,
-                    velocity=0,
-                )
-            return MidiEvent(
-                event_type=MidiEventType.NOTE_ON,
-                channel=event.channel,
-                note=event.note,
-                velocity=event.velocity,
-            )
-        elif isinstance(event, alsa_midi.NoteOffEvent):
-            return MidiEvent(
-                event_type=MidiEventType.NOTE_OFF,
-                channel=event.channel,
-                note=event.note,
-                velocity=event.velocity,
-            )
-        elif isinstance(event, alsa_midi.ControlChangeEvent):
-            return MidiEvent(
-                event_type=MidiEventType.CONTROL_CHANGE,
-                channel=event.channel,
-                note=event.param,
-                velocity=event.value,
-            )
-        elif isinstance(event, alsa_midi.ProgramChangeEvent):
-            return MidiEvent(
-                event_type=MidiEventType.PROGRAM_CHANGE,
-                channel=event.channel,
-                note=event.value,
-                velocity=0,
-            )
-        return None
+        handler = _PARSE_HANDLERS.get(type(event))
+        return handler(event) if handler is not None else None
 
     def _route_event(self, event: MidiEvent) -> None:
         """Match a MIDI event against mappings and push state events."""
-        for mapping in self._mappings:
+        key = _event_key(event.event_type, event.channel, event.note)
+        for mapping in self._index.get(key, ()):
             # Check for momentary release (note_off reverts to default group)
             if mapping.matches_release(event) and mapping.action == "set_group":
-                self._event_queue.put_nowait(
+                self._event_queue.append(
                     StateEvent(EventType.GROUP_CHANGE, target_state="")
                 )
                 logger.debug("MIDI → set_group release → default")
@@ -325,7 +380,7 @@ class MidiInput:
 
             if mapping.matches(event):
                 if mapping.action == "set_group":
-                    self._event_queue.put_nowait(
+                    self._event_queue.append(
                         StateEvent(
                             EventType.GROUP_CHANGE,
                             target_state=mapping.target,
@@ -335,7 +390,7 @@ class MidiInput:
                     logger.debug("MIDI → set_group '%s' (%s, vel=%d)",
                                  mapping.target, mapping.mode, event.velocity)
                 elif mapping.action == "set_state" and mapping.target:
-                    self._event_queue.put_nowait(
+                    self._event_queue.append(
                         StateEvent(
                             EventType.MIDI_TRIGGER,
                             target_state=mapping.target,
@@ -345,7 +400,7 @@ class MidiInput:
                     logger.debug("MIDI → set_state '%s' (vel=%d)",
                                  mapping.target, event.velocity)
                 elif mapping.action == "toggle_mic":
-                    self._event_queue.put_nowait(
+                    self._event_queue.append(
                         StateEvent(EventType.MIDI_TRIGGER, target_state="__toggle_mic__")
                     )
 
@@ -3,21 +3,42 @@
 from __future__ import annotations
 
 import ctypes
+import logging
+from typing import Callable
 
 import numpy as np
 from OpenGL.GL import (
     GL_ARRAY_BUFFER,
     GL_BLEND,
     GL_CLAMP_TO_EDGE,
-    GL_ELEMENT_ARRAY_BUFFER,
+    GL_COLOR_ATTACHMENT0,
+    GL_EXTENSIONS,
     GL_FALSE,
     GL_FLOAT,
+    GL_FRAMEBUFFER,
+    GL_FRAMEBUFFER_COMPLETE,
     GL_LINEAR,
+    GL_MAJOR_VERSION,
+    GL_MAP_INVALIDATE_BUFFER_BIT,
+    GL_MAP_READ_BIT,
+    GL_MAP_WRITE_BIT,
+    GL_MINOR_VERSION,
+    GL_NUM_EXTENSIONS,
     GL_ONE_MINUS_SRC_ALPHA,
+    GL_PACK_ALIGNMENT,
+    GL_PIXEL_PACK_BUFFER,
+    GL_PIXEL_UNPACK_BUFFER,
+    GL_RENDERBUFFER,
+    GL_RGB,
+    GL_RGB565,
+    GL_RGB8,
     GL_RGBA,
+    GL_RGBA4,
     GL_RGBA8,
     GL_SRC_ALPHA,
     GL_STATIC_DRAW,
+    GL_STREAM_DRAW,
+    GL_STREAM_READ,
     GL_TEXTURE0,
     GL_TEXTURE1,
     GL_TEXTURE_2D,
@@ -25,55 +46,133 @@ from OpenGL.GL import (
     GL_TEXTURE_MIN_FILTER,
     GL_TEXTURE_WRAP_S,
     GL_TEXTURE_WRAP_T,
-    GL_TRIANGLES,
+    GL_TRIANGLE_STRIP,
+    GL_UNPACK_ALIGNMENT,
     GL_UNSIGNED_BYTE,
-    GL_UNSIGNED_INT,
+    GL_UNSIGNED_SHORT_4_4_4_4,
+    GL_UNSIGNED_SHORT_5_6_5,
     glActiveTexture,
     glBindBuffer,
+    glBindFramebuffer,
+    glBindRenderbuffer,
     glBindTexture,
     glBindVertexArray,
     glBlendFunc,
     glBufferData,
+    glCheckFramebufferStatus,
     glClear,
     glClearColor,
     glDeleteBuffers,
+    glDeleteFramebuffers,
+    glDeleteRenderbuffers,
     glDeleteTextures,
     glDeleteVertexArrays,
-    glDisable,
-    glDrawElements,
+    glDrawArrays,
     glEnable,
     glEnableVertexAttribArray,
+    glFramebufferRenderbuffer,
     glGenBuffers,
+    glGenFramebuffers,
+    glGenRenderbuffers,
     glGenTextures,
     glGenVertexArrays,
+    glGetIntegerv,
+    glGetStringi,
     glGetUniformLocation,
+    glMapBufferRange,
+    glPixelStorei,
+    glReadPixels,
+    glRenderbufferStorage,
     glTexImage2D,
     glTexParameteri,
     glTexSubImage2D,
+    glTextureSubImage2D,
     glUniform1f,
     glUniform1i,
     glUniform3f,
     glUniform4f,
+    glUnmapBuffer,
     glUseProgram,
     glVertexAttribPointer,
     glViewport,
 )
 from OpenGL.GL import GL_COLOR_BUFFER_BIT
 
-from nixchirp.render.shaders import load_shader_program
+from nixchirp.assets.pixels import expand_to_rgba
+from nixchirp.constants import (
+    CACHE_FORMAT_PAL8,
+    CACHE_FORMAT_RGB565,
+    CACHE_FORMAT_RGBA4444,
+    CACHE_FORMAT_RGBA8,
+)
+from nixchirp.render.shaders import (
+    begin_load_program,
+    enable_parallel_compile,
+    finish_load_program,
+)
+
+logger = logging.getLogger(__name__)
 
 
-# Fullscreen quad: positions (x,y) + texcoords (u,v)
+# Fullscreen quad as a triangle strip: positions (x,y) + texcoords (u,v)
 # Flipped V so textures aren't upside-down
 _QUAD_VERTICES = np.array([
     # x,    y,    u,   v
     -1.0, -1.0,  0.0, 1.0,   # bottom-left
      1.0, -1.0,  1.0, 1.0,   # bottom-right
-     1.0,  1.0,  1.0, 0.0,   # top-right
     -1.0,  1.0,  0.0, 0.0,   # top-left
+     1.0,  1.0,  1.0, 0.0,   # top-right
 ], dtype=np.float32)
 
-_QUAD_INDICES = np.array([0, 1, 2, 2, 3, 0], dtype=np.uint32)
+# Raw bytes handed to glBufferData, so PyOpenGL needn't inspect the array
+_QUAD_VERTICES_BYTES = _QUAD_VERTICES.tobytes()
+
+# Interleaved vertex layout: stride and attribute offsets in bytes
+_QUAD_STRIDE = 4 * 4  # 4 floats * 4 bytes
+_POSITION_OFFSET = ctypes.c_void_p(0)
+_TEXCOORD_OFFSET = ctypes.c_void_p(8)
+
+# Offset 0 into the bound pixel unpack/pack buffer
+_PBO_OFFSET = ctypes.c_void_p(0)
+
+# Cache pixel format -> (internal format, format, type) for texture uploads
+_GL_PIXEL_FORMATS = {
+    CACHE_FORMAT_RGBA8: (GL_RGBA8, GL_RGBA, GL_UNSIGNED_BYTE),
+    CACHE_FORMAT_RGB565: (GL_RGB565, GL_RGB, GL_UNSIGNED_SHORT_5_6_5),
+    CACHE_FORMAT_RGBA4444: (GL_RGBA4, GL_RGBA, GL_UNSIGNED_SHORT_4_4_4_4),
+}
+
+# Texture unit each slot's texture stays bound to for the renderer's lifetime
+_SLOT_UNITS = {"a": GL_TEXTURE0, "b": GL_TEXTURE1}
+
+# Number of pixel unpack buffers cycled through for texture uploads
+_PBO_RING_SIZE = 3
+
+# Pixel pack buffers offscreen composites are read back through
+_READBACK_RING_SIZE = 2
+
+
+def _has_direct_state_access() -> bool:
+    """Whether the current context supports GL 4.5 direct state access.
+
+    A resolved function pointer proves nothing (GLX and EGL hand one out
+    for any name), so this checks the context version, then the extension
+    list.
+    """
+    if not glTextureSubImage2D:
+        return False
+    version = (int(glGetIntegerv(GL_MAJOR_VERSION)), int(glGetIntegerv(GL_MINOR_VERSION)))
+    if version >= (4, 5):
+        return True
+    return any(
+        glGetStringi(GL_EXTENSIONS, i) == b"GL_ARB_direct_state_access"
+        for i in range(int(glGetIntegerv(GL_NUM_EXTENSIONS)))
+    )
+
+
+def _uniform_locations(program: int, *names: str) -> dict[str, int]:
+    """Look up the locations of a linked program's uniforms by name."""
+    return {name: glGetUniformLocation(program, name) for name in names}
 
 
 class GLRenderer:
@@ -82,23 +181,67 @@ class GLRenderer:
     def __init__(self) -> None:
         self._vao: int = 0
         self._vbo: int = 0
-        self._ebo: int = 0
         self._passthrough_program: int = 0
         self._chroma_program: int = 0
         self._crossfade_program: int = 0
+        # Uniform name -> location for each program, looked up once in init()
+        self._locs_passthrough: dict[str, int] = {}
+        self._locs_chroma: dict[str, int] = {}
+        self._locs_crossfade: dict[str, int] = {}
         self._texture_a: int = 0  # Primary texture
         self._texture_b: int = 0  # Secondary texture (for crossfade)
+        # GL 4.5 direct state access: update a texture without selecting its unit
+        self._dsa = False
         self._tex_a_width: int = 0
         self._tex_a_height: int = 0
         self._tex_b_width: int = 0
         self._tex_b_height: int = 0
+        self._slot_formats: dict[str, str] = {}
+        # Per-slot RGBA scratch buffers PAL8 frames are expanded into
+        self._pal_staging: dict[str, np.ndarray] = {}
+        # Slot each single-texture program's uTexture currently samples
+        self._sampler_slots: dict[int, str] = {}
+
+        # (source, frame_index) last uploaded to each slot, to skip re-uploads
+        self._slot_tags: dict[str, tuple[object, int]] = {}
+
+        # Pixel unpack buffer ring for streaming uploads
+        self._pbos: list[int] = []
+        self._pbo_sizes: list[int] = []
+        self._pbo_index: int = 0
+
+        # Offscreen RGB framebuffer and pack buffer ring for read_composite()
+        self._readback_fbo: int = 0
+        self._readback_rb: int = 0
+        self._readback_size: tuple[int, int] = (0, 0)
+        self._readback_pbos: list[int] = []
+        self._readback_ready: list[bool] = []  # Ring slot holds a finished read
+        self._readback_index: int = 0
+        self._readback_failed = False
+        self._viewport: tuple[int, int] = (0, 0)
 
     def init(self) -> None:
         """Set up VAO, VBO, shaders, and textures. Must be called after GL context is created."""
-        # Compile shaders
-        self._passthrough_program = load_shader_program("passthrough.vert", "passthrough.frag")
-        self._chroma_program = load_shader_program("passthrough.vert", "chroma.frag")
-        self._crossfade_program = load_shader_program("passthrough.vert", "crossfade.frag")
+        # Compile shaders: submit all three before waiting on any, so
+        # drivers that compile in parallel overlap them
+        enable_parallel_compile()
+        pending = [
+            begin_load_program("passthrough.vert", "passthrough.frag"),
+            begin_load_program("passthrough.vert", "chroma.frag"),
+            begin_load_program("passthrough.vert", "crossfade.frag"),
+        ]
+        self._passthrough_program, self._chroma_program, self._crossfade_program = (
+            finish_load_program(p) for p in pending
+        )
+        self._locs_passthrough = _uniform_locations(
+            self._passthrough_program, "uTexture", "uBgColor",
+        )
+        self._locs_chroma = _uniform_locations(
+            self._chroma_program, "uTexture", "uChromaColor",
+        )
+        self._locs_crossfade = _uniform_locations(
+            self._crossfade_program, "uTextureA", "uTextureB", "uBlend", "uBgColor",
+        )
 
         # Create VAO
         self._vao = glGenVertexArrays(1)
@@ -107,26 +250,52 @@ class GLRenderer:
         # VBO
         self._vbo = glGenBuffers(1)
         glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
-        glBufferData(GL_ARRAY_BUFFER, _QUAD_VERTICES.nbytes, _QUAD_VERTICES, GL_STATIC_DRAW)
-
-        # EBO
-        self._ebo = glGenBuffers(1)
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._ebo)
-        glBufferData(GL_ELEMENT_ARRAY_BUFFER, _QUAD_INDICES.nbytes, _QUAD_INDICES, GL_STATIC_DRAW)
+        glBufferData(
+            GL_ARRAY_BUFFER, len(_QUAD_VERTICES_BYTES), _QUAD_VERTICES_BYTES, GL_STATIC_DRAW,
+        )
 
-        stride = 4 * 4  # 4 floats * 4 bytes
         # Position attribute (location 0)
-        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(0))
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, _QUAD_STRIDE, _POSITION_OFFSET)
         glEnableVertexAttribArray(0)
         # TexCoord attribute (location 1)
-        glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(8))
+        glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, _QUAD_STRIDE, _TEXCOORD_OFFSET)
         glEnableVertexAttribArray(1)
 
-        glBindVertexArray(0)
-
-        # Create textures
+        # Create textures and leave each bound to its slot's unit, so
+        # crossfades sample both without any per-frame rebinding
         self._texture_a = self._create_texture()
         self._texture_b = self._create_texture()
+        glActiveTexture(GL_TEXTURE1)
+        glBindTexture(GL_TEXTURE_2D, self._texture_b)
+        glActiveTexture(GL_TEXTURE0)
+        glBindTexture(GL_TEXTURE_2D, self._texture_a)
+
+        self._dsa = _has_direct_state_access()
+
+        # Sampler units never change, so set them once
+        glUseProgram(self._passthrough_program)
+        glUniform1i(self._locs_passthrough["uTexture"], 0)
+        glUseProgram(self._chroma_program)
+        glUniform1i(self._locs_chroma["uTexture"], 0)
+        glUseProgram(self._crossfade_program)
+        glUniform1i(self._locs_crossfade["uTextureA"], 0)
+        glUniform1i(self._locs_crossfade["uTextureB"], 1)
+        glUseProgram(0)
+
+        # 16-bit formats give rows that aren't 4-byte aligned for odd widths
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        # RGB24 readback rows are only 4-byte aligned for some widths
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+
+        # Pixel unpack buffers (storage is allocated lazily on first upload)
+        self._pbos = [int(b) for b in glGenBuffers(_PBO_RING_SIZE)]
+        self._pbo_sizes = [0] * _PBO_RING_SIZE
+
+        # Only the quad is ever drawn, so its VAO and the blend state stay
+        # set.  The ImGui backend saves and restores both around its draws.
+        glBindVertexArray(self._vao)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
     def _create_texture(self) -> int:
         """Create an empty RGBA texture with linear filtering."""
@@ -139,15 +308,45 @@ class GLRenderer:
         glBindTexture(GL_TEXTURE_2D, 0)
         return tex
 
-    def upload_frame(self, frame: np.ndarray, slot: str = "a") -> None:
-        """Upload an RGBA frame (numpy H x W x 4 uint8) to a texture slot.
+    def upload_frame(
+        self,
+        frame: np.ndarray | memoryview,
+        slot: str = "a",
+        tag: tuple[object, int] | None = None,
+        pixel_format: str = CACHE_FORMAT_RGBA8,
+        palette: np.ndarray | None = None,
+    ) -> None:
+        """Upload a frame to a texture slot.
 
         Args:
-            frame: RGBA image as numpy array with shape (height, width, 4).
+            frame: RGBA image as numpy array with shape (height, width, 4),
+                or (height, width) uint16 for the packed 16-bit formats.
+                A memoryview shaped the same way (e.g. a cast of a
+                SharedMemory or mmap buffer filled by another process) is
+                read in place, without an intermediate copy.
             slot: 'a' for primary texture, 'b' for secondary (crossfade).
+            tag: Optional (source, frame_index) identifying the frame. If the
+                slot already holds the same tag the upload is skipped.
+            pixel_format: Cache pixel format of *frame* (see assets.pixels).
+            palette: (256, 4) RGBA palette, required for PAL8 frames. These
+                are expanded to RGBA on the CPU before upload.
         """
+        if tag is not None:
+            held = self._slot_tags.get(slot)
+            if held is not None and held[0] is tag[0] and held[1] == tag[1]:
+                return
+
+        if not isinstance(frame, np.ndarray):
+            frame = np.asarray(frame)  # Zero-copy view of the buffer
         h, w = frame.shape[:2]
-        tex = self._texture_a if slot == "a" else self._texture_b
+
+        if pixel_format == CACHE_FORMAT_PAL8:
+            staging = self._pal_staging.get(slot)
+            if staging is None or staging.shape[:2] != (h, w):
+                staging = np.empty((h, w, 4), dtype=np.uint8)
+                self._pal_staging[slot] = staging
+            frame = expand_to_rgba(frame, pixel_format, palette, out=staging)
+            pixel_format = CACHE_FORMAT_RGBA8
 
         # Track dimensions per slot
         if slot == "a":
@@ -155,82 +354,128 @@ class GLRenderer:
         else:
             old_w, old_h = self._tex_b_width, self._tex_b_height
 
-        glBindTexture(GL_TEXTURE_2D, tex)
-
-        # Ensure frame is contiguous in memory
-        if not frame.flags["C_CONTIGUOUS"]:
-            frame = np.ascontiguousarray(frame)
-
-        if w != old_w or h != old_h:
-            # Reallocate texture storage
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, w, h, 0, GL_RGBA, GL_UNSIGNED_BYTE, frame)
+        internal_fmt, fmt, gl_type = _GL_PIXEL_FORMATS[pixel_format]
+        realloc = w != old_w or h != old_h or self._slot_formats.get(slot) != pixel_format
+
+        # The slot's texture is already bound on its unit; just select it.
+        # With DSA, sub-image updates name the texture and need no unit.
+        unit = _SLOT_UNITS[slot]
+        select_unit = unit != GL_TEXTURE0 and (realloc or not self._dsa)
+        if select_unit:
+            glActiveTexture(unit)
+
+        if realloc:
+            # Reallocate texture storage; the pixels follow through a PBO
+            # like any other upload instead of a synchronous client copy
+            glTexImage2D(GL_TEXTURE_2D, 0, internal_fmt, w, h, 0, fmt, gl_type, None)
+            self._slot_formats[slot] = pixel_format
             if slot == "a":
                 self._tex_a_width, self._tex_a_height = w, h
             else:
                 self._tex_b_width, self._tex_b_height = w, h
+
+        tex = self._texture_a if slot == "a" else self._texture_b
+        self._sub_image_via_pbo(tex, frame, w, h, fmt, gl_type)
+
+        if select_unit:
+            glActiveTexture(GL_TEXTURE0)
+
+        if tag is not None:
+            self._slot_tags[slot] = tag
         else:
-            # Sub-image update (faster, no reallocation)
-            glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, w, h, GL_RGBA, GL_UNSIGNED_BYTE, frame)
+            self._slot_tags.pop(slot, None)
 
-        glBindTexture(GL_TEXTURE_2D, 0)
+    def _tex_sub_image(self, tex: int, w: int, h: int, fmt: int, gl_type: int, data) -> None:
+        """Replace all of *tex*; without DSA it must be bound on the active unit."""
+        if self._dsa:
+            glTextureSubImage2D(tex, 0, 0, 0, w, h, fmt, gl_type, data)
+        else:
+            glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, w, h, fmt, gl_type, data)
 
-    def render_passthrough(self, bg_color: tuple[float, float, float, float]) -> None:
-        """Render texture A over a background color."""
-        glUseProgram(self._passthrough_program)
-        glUniform4f(
-            glGetUniformLocation(self._passthrough_program, "uBgColor"),
-            *bg_color,
-        )
-        glUniform1i(
-            glGetUniformLocation(self._passthrough_program, "uTexture"),
-            0,
+    def _sub_image_via_pbo(
+        self, tex: int, frame: np.ndarray, w: int, h: int, fmt: int, gl_type: int,
+    ) -> None:
+        """Stream a frame into *tex* through the next PBO in the ring.
+
+        The buffer is invalidated on map so the driver can hand back fresh
+        storage instead of waiting for a previous transfer to finish.
+        Strided frames are copied straight into the mapped buffer, so no
+        contiguous temporary is made on the render thread.
+        """
+        if not self._pbos:
+            self._tex_sub_image(tex, w, h, fmt, gl_type, np.ascontiguousarray(frame))
+            return
+
+        i = self._pbo_index
+        self._pbo_index = (i + 1) % _PBO_RING_SIZE
+        size = frame.nbytes
+
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self._pbos[i])
+        if self._pbo_sizes[i] < size:
+            glBufferData(GL_PIXEL_UNPACK_BUFFER, size, None, GL_STREAM_DRAW)
+            self._pbo_sizes[i] = size
+
+        ptr = glMapBufferRange(
+            GL_PIXEL_UNPACK_BUFFER, 0, size,
+            GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT,
         )
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(GL_TEXTURE_2D, self._texture_a)
+        if ptr:
+            if frame.flags.c_contiguous:
+                ctypes.memmove(ptr, frame.ctypes.data, size)
+            else:
+                mapped = np.ctypeslib.as_array((ctypes.c_ubyte * size).from_address(ptr))
+                np.copyto(mapped.view(frame.dtype).reshape(frame.shape), frame)
+            glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+            self._tex_sub_image(tex, w, h, fmt, gl_type, _PBO_OFFSET)
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+        else:
+            # Mapping failed; fall back to a direct client-memory upload
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+            self._tex_sub_image(tex, w, h, fmt, gl_type, np.ascontiguousarray(frame))
+
+    def render_passthrough(
+        self,
+        bg_color: tuple[float, float, float, float],
+        slot: str = "a",
+    ) -> None:
+        """Render a texture slot (A by default) over a background color."""
+        locs = self._locs_passthrough
+        glUseProgram(self._passthrough_program)
+        self._select_sampler_slot(self._passthrough_program, locs, slot)
+        glUniform4f(locs["uBgColor"], *bg_color)
         self._draw_quad()
 
-    def render_chroma(self, chroma_color: tuple[float, float, float]) -> None:
-        """Render texture A over a chroma key background."""
+    def render_chroma(
+        self,
+        chroma_color: tuple[float, float, float],
+        slot: str = "a",
+    ) -> None:
+        """Render a texture slot (A by default) over a chroma key background."""
+        locs = self._locs_chroma
         glUseProgram(self._chroma_program)
-        glUniform3f(
-            glGetUniformLocation(self._chroma_program, "uChromaColor"),
-            *chroma_color,
-        )
-        glUniform1i(
-            glGetUniformLocation(self._chroma_program, "uTexture"),
-            0,
-        )
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(GL_TEXTURE_2D, self._texture_a)
+        self._select_sampler_slot(self._chroma_program, locs, slot)
+        glUniform3f(locs["uChromaColor"], *chroma_color)
         self._draw_quad()
 
+    def _select_sampler_slot(
+        self, program: int, locs: dict[str, int], slot: str,
+    ) -> None:
+        """Point a single-texture program's uTexture at *slot* if it isn't already."""
+        if self._sampler_slots.get(program, "a") != slot:
+            unit = 0 if slot == "a" else 1
+            glUniform1i(locs["uTexture"], unit)
+            self._sampler_slots[program] = slot
+
     def render_crossfade(
         self,
         blend: float,
         bg_color: tuple[float, float, float, float],
     ) -> None:
         """Render a crossfade between texture A and texture B."""
+        locs = self._locs_crossfade
         glUseProgram(self._crossfade_program)
-        glUniform1f(
-            glGetUniformLocation(self._crossfade_program, "uBlend"),
-            blend,
-        )
-        glUniform4f(
-            glGetUniformLocation(self._crossfade_program, "uBgColor"),
-            *bg_color,
-        )
-        glUniform1i(
-            glGetUniformLocation(self._crossfade_program, "uTextureA"),
-            0,
-        )
-        glUniform1i(
-            glGetUniformLocation(self._crossfade_program, "uTextureB"),
-            1,
-        )
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(GL_TEXTURE_2D, self._texture_a)
-        glActiveTexture(GL_TEXTURE1)
-        glBindTexture(GL_TEXTURE_2D, self._texture_b)
+        glUniform1f(locs["uBlend"], blend)
+        glUniform4f(locs["uBgColor"], *bg_color)
         self._draw_quad()
 
     def clear(self, color: tuple[float, float, float, float]) -> None:
@@ -241,15 +486,89 @@ class GLRenderer:
     def set_viewport(self, width: int, height: int) -> None:
         """Update the GL viewport."""
         glViewport(0, 0, width, height)
+        self._viewport = (width, height)
+
+    def read_composite(
+        self,
+        width: int,
+        height: int,
+        bg_color: tuple[float, float, float],
+        consume: Callable[[np.ndarray], None],
+    ) -> bool:
+        """Composite texture slot A over *bg_color* offscreen and read it back.
+
+        The frame is drawn at (width, height) and read into a pixel pack
+        buffer without waiting for the GPU.  *consume* is then called with
+        the previous call's frame as a (height, width, 3) uint8 RGB view of
+        the mapped buffer, valid only during the call, so the output lags
+        by one call.
+
+        Returns False if no offscreen framebuffer is available, in which
+        case the caller should composite on the CPU.
+        """
+        if (width, height) != self._readback_size and not self._init_readback(width, height):
+            return False
+        i = self._readback_index
+        self._readback_index = (i + 1) % _READBACK_RING_SIZE
+        size = width * height * 3
+
+        glBindFramebuffer(GL_FRAMEBUFFER, self._readback_fbo)
+        glViewport(0, 0, width, height)
+        self.render_chroma(bg_color, slot="a")
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self._readback_pbos[i])
+        glReadPixels(0, 0, width, height, GL_RGB, GL_UNSIGNED_BYTE, _PBO_OFFSET)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glViewport(0, 0, *self._viewport)
+
+        # With two buffers, the next slot in the ring holds the last read
+        j = self._readback_index
+        if self._readback_ready[j]:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, self._readback_pbos[j])
+            ptr = glMapBufferRange(GL_PIXEL_PACK_BUFFER, 0, size, GL_MAP_READ_BIT)
+            if ptr:
+                mapped = np.ctypeslib.as_array((ctypes.c_ubyte * size).from_address(ptr))
+                # GL rows run bottom-up
+                consume(mapped.reshape(height, width, 3)[::-1])
+                glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self._readback_ready[i] = True
+        return True
+
+    def _init_readback(self, width: int, height: int) -> bool:
+        """(Re)allocate the offscreen framebuffer and pack buffers for a size."""
+        if self._readback_failed:
+            return False
+        if not self._readback_fbo:
+            self._readback_fbo = glGenFramebuffers(1)
+            self._readback_rb = glGenRenderbuffers(1)
+            self._readback_pbos = [int(b) for b in glGenBuffers(_READBACK_RING_SIZE)]
+        glBindRenderbuffer(GL_RENDERBUFFER, self._readback_rb)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGB8, width, height)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+        glBindFramebuffer(GL_FRAMEBUFFER, self._readback_fbo)
+        glFramebufferRenderbuffer(
+            GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, self._readback_rb,
+        )
+        complete = glCheckFramebufferStatus(GL_FRAMEBUFFER) == GL_FRAMEBUFFER_COMPLETE
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        if not complete:
+            logger.warning("Offscreen framebuffer unavailable; compositing on the CPU")
+            self._readback_failed = True
+            return False
+
+        size = width * height * 3
+        for pbo in self._readback_pbos:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+            glBufferData(GL_PIXEL_PACK_BUFFER, size, None, GL_STREAM_READ)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self._readback_ready = [False] * _READBACK_RING_SIZE
+        self._readback_index = 0
+        self._readback_size = (width, height)
+        return True
 
     def _draw_quad(self) -> None:
-        """Draw the fullscreen quad."""
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glBindVertexArray(self._vao)
-        glDrawElements(GL_TRIANGLES, 6, GL_UNSIGNED_INT, None)
-        glBindVertexArray(0)
-        glDisable(GL_BLEND)
+        """Draw the fullscreen quad (its VAO and blending are set up in init)."""
+        glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
 
     def destroy(self) -> None:
         """Release OpenGL resources."""
@@ -257,9 +576,25 @@ class GLRenderer:
             glDeleteTextures(1, [self._texture_a])
         if self._texture_b:
             glDeleteTextures(1, [self._texture_b])
+        if self._pbos:
+            glDeleteBuffers(len(self._pbos), self._pbos)
+            self._pbos = []
+        if self._readback_fbo:
+            glDeleteFramebuffers(1, [self._readback_fbo])
+            glDeleteRenderbuffers(1, [self._readback_rb])
+            glDeleteBuffers(len(self._readback_pbos), self._readback_pbos)
+            self._readback_fbo = self._readback_rb = 0
+            self._readback_pbos = []
+            self._readback_size = (0, 0)
+        self._slot_tags.clear()
+        self._slot_formats.clear()
+        self._pal_staging.clear()
+        self._sampler_slots.clear()
+        self._locs_passthrough = {}
+        self._locs_chroma = {}
+        self._locs_crossfade = {}
         if self._vao:
+            glBindVertexArray(0)
             glDeleteVertexArrays(1, [self._vao])
         if self._vbo:
             glDeleteBuffers(1, [self._vbo])
-        if self._ebo:
-            glDeleteBuffers(1, [self._ebo])
@@ -1,59 +1,246 @@
-"""GLSL shader compilation and program management."""
+"""GLSL shader compilation and program management.
+
+Linked programs are cached on disk with glGetProgramBinary where the
+driver supports it, so later launches skip compiling and linking.
+
+Programs can be loaded in two steps: begin_load_program() submits the
+compile and link without waiting on the result, and
+finish_load_program() checks it.  Beginning every program before
+finishing any lets drivers with GL_ARB_parallel_shader_compile build
+them concurrently.
+"""
 
 from __future__ import annotations
 
+import ctypes
+import functools
+import hashlib
+import logging
+import os
+import struct
+from dataclasses import dataclass
 from importlib import resources
+from pathlib import Path
 
 from OpenGL.GL import (
     GL_COMPILE_STATUS,
     GL_FRAGMENT_SHADER,
     GL_LINK_STATUS,
+    GL_NUM_PROGRAM_BINARY_FORMATS,
+    GL_PROGRAM_BINARY_LENGTH,
+    GL_PROGRAM_BINARY_RETRIEVABLE_HINT,
+    GL_RENDERER,
+    GL_TRUE,
+    GL_VENDOR,
+    GL_VERSION,
     GL_VERTEX_SHADER,
+    GLenum,
+    GLsizei,
     glAttachShader,
     glCompileShader,
     glCreateProgram,
     glCreateShader,
+    glDeleteProgram,
     glDeleteShader,
+    glGetIntegerv,
+    glGetProgramBinary,
     glGetProgramInfoLog,
     glGetProgramiv,
     glGetShaderInfoLog,
     glGetShaderiv,
+    glGetString,
     glLinkProgram,
+    glProgramBinary,
+    glProgramParameteri,
     glShaderSource,
 )
 
+from nixchirp.config import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Older PyOpenGL releases lack the wrapper for this extension
+try:
+    from OpenGL.GL.ARB.parallel_shader_compile import glMaxShaderCompilerThreadsARB
+    _HAS_PARALLEL_COMPILE = True
+except ImportError:
+    _HAS_PARALLEL_COMPILE = False
+
 _SHADER_PKG = "nixchirp.shaders"
 
+# Cache file layout: binary format enum, then the driver's program blob
+_BINARY_HEADER = struct.Struct("<I")
+
+
+@functools.cache
+def _read_source(filename: str) -> str:
+    """Read a shader file from the shaders package, once per process.
+
+    The vertex shader is shared by every program, so this saves rereading it.
+    """
+    return resources.files(_SHADER_PKG).joinpath(filename).read_text()
+
 
-def _compile_shader(source: str, shader_type: int) -> int:
-    """Compile a single shader from source."""
+@dataclass
+class PendingProgram:
+    """A program whose compile and link may still be running in the driver."""
+
+    program: int
+    vertex: int = 0  # Shaders to check and delete; 0 if loaded from cache
+    fragment: int = 0
+    cache_path: Path | None = None  # Where to save the binary once linked
+
+
+def enable_parallel_compile() -> None:
+    """Let the driver compile shaders on its own threads, if supported.
+
+    Call once after the GL context is created.
+    """
+    if not _HAS_PARALLEL_COMPILE:
+        return
+    try:
+        if glMaxShaderCompilerThreadsARB:
+            glMaxShaderCompilerThreadsARB(0xFFFFFFFF)  # Driver's choice
+            logger.debug("Parallel shader compilation enabled")
+    except Exception:
+        logger.debug("Parallel shader compilation unavailable", exc_info=True)
+
+
+def _submit_shader(source: str, shader_type: int) -> int:
+    """Create a shader and start compiling it, without waiting for the result."""
     shader = glCreateShader(shader_type)
     glShaderSource(shader, source)
     glCompileShader(shader)
-    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
-        log = glGetShaderInfoLog(shader).decode()
-        raise RuntimeError(f"Shader compile error: {log}")
     return shader
 
 
-def _link_program(vertex: int, fragment: int) -> int:
-    """Link vertex and fragment shaders into a program."""
+def _submit_link(vertex: int, fragment: int, retrievable: bool = False) -> int:
+    """Start linking vertex and fragment shaders, without waiting for the result.
+
+    With *retrievable*, the driver is asked to keep the binary available
+    for glGetProgramBinary.
+    """
     program = glCreateProgram()
     glAttachShader(program, vertex)
     glAttachShader(program, fragment)
+    if retrievable:
+        glProgramParameteri(program, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
     glLinkProgram(program)
-    if not glGetProgramiv(program, GL_LINK_STATUS):
-        log = glGetProgramInfoLog(program).decode()
-        raise RuntimeError(f"Shader link error: {log}")
-    glDeleteShader(vertex)
-    glDeleteShader(fragment)
     return program
 
 
+def _binary_cache_path(vert_source: str, frag_source: str) -> Path | None:
+    """Cache file for a program's binary, or None if the driver can't provide one.
+
+    Binaries are only valid for the driver that produced them, so the key
+    covers the GL vendor, renderer and version as well as the sources.
+    """
+    try:
+        if not (glProgramBinary and glGetIntegerv(GL_NUM_PROGRAM_BINARY_FORMATS)):
+            return None
+        digest = hashlib.sha256()
+        for part in (vert_source, frag_source):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        for name in (GL_VENDOR, GL_RENDERER, GL_VERSION):
+            digest.update(glGetString(name) or b"")
+            digest.update(b"\0")
+    except Exception:
+        logger.debug("Program binaries unavailable", exc_info=True)
+        return None
+    return get_cache_dir() / "shaders" / f"{digest.hexdigest()}.bin"
+
+
+def _load_program_binary(path: Path) -> int:
+    """Create a program from a cached binary; 0 on a miss or if the driver rejects it."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return 0
+    if len(data) <= _BINARY_HEADER.size:
+        return 0
+    (binary_format,) = _BINARY_HEADER.unpack_from(data)
+    blob = data[_BINARY_HEADER.size:]
+
+    program = glCreateProgram()
+    try:
+        glProgramBinary(program, binary_format, blob, len(blob))
+        if glGetProgramiv(program, GL_LINK_STATUS):
+            return program
+    except Exception:
+        logger.debug("Rejected cached program %s", path.name, exc_info=True)
+    # Typically a driver update; the caller recompiles and overwrites it
+    glDeleteProgram(program)
+    return 0
+
+
+def _save_program_binary(program: int, path: Path) -> None:
+    """Write a linked program's binary to *path*, replacing it atomically."""
+    try:
+        length = glGetProgramiv(program, GL_PROGRAM_BINARY_LENGTH)
+        if not length:
+            return
+        blob = (ctypes.c_ubyte * length)()
+        written = GLsizei(0)
+        binary_format = GLenum(0)
+        glGetProgramBinary(
+            program, length, ctypes.byref(written), ctypes.byref(binary_format), blob,
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_BINARY_HEADER.pack(binary_format.value))
+            f.write(memoryview(blob)[:written.value])
+        os.replace(tmp, path)
+    except Exception:
+        logger.debug("Could not cache program binary", exc_info=True)
+
+
+def begin_load_program(vert_filename: str, frag_filename: str) -> PendingProgram:
+    """Start loading a shader program from files in the shaders package.
+
+    Uses the on-disk binary cache when possible; otherwise submits the
+    compile and link from source.  Pass the result to finish_load_program().
+    """
+    vert_source = _read_source(vert_filename)
+    frag_source = _read_source(frag_filename)
+
+    cache_path = _binary_cache_path(vert_source, frag_source)
+    if cache_path is not None:
+        program = _load_program_binary(cache_path)
+        if program:
+            logger.debug("Loaded cached program for %s + %s", vert_filename, frag_filename)
+            return PendingProgram(program)
+
+    vert = _submit_shader(vert_source, GL_VERTEX_SHADER)
+    frag = _submit_shader(frag_source, GL_FRAGMENT_SHADER)
+    program = _submit_link(vert, frag, retrievable=cache_path is not None)
+    return PendingProgram(program, vert, frag, cache_path)
+
+
+def finish_load_program(pending: PendingProgram) -> int:
+    """Wait for a program started with begin_load_program() and return it.
+
+    Raises RuntimeError with the driver's log if compiling or linking failed.
+    """
+    if not pending.vertex:
+        return pending.program
+
+    # Querying the status waits for the driver to finish
+    if not glGetProgramiv(pending.program, GL_LINK_STATUS):
+        for shader in (pending.vertex, pending.fragment):
+            if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+                log = glGetShaderInfoLog(shader).decode()
+                raise RuntimeError(f"Shader compile error: {log}")
+        log = glGetProgramInfoLog(pending.program).decode()
+        raise RuntimeError(f"Shader link error: {log}")
+    glDeleteShader(pending.vertex)
+    glDeleteShader(pending.fragment)
+    if pending.cache_path is not None:
+        _save_program_binary(pending.program, pending.cache_path)
+    return pending.program
+
+
 def load_shader_program(vert_filename: str, frag_filename: str) -> int:
-    """Load and compile a shader program from files in the shaders package."""
-    vert_source = resources.files(_SHADER_PKG).joinpath(vert_filename).read_text()
-    frag_source = resources.files(_SHADER_PKG).joinpath(frag_filename).read_text()
-    vert = _compile_shader(vert_source, GL_VERTEX_SHADER)
-    frag = _compile_shader(frag_source, GL_FRAGMENT_SHADER)
-    return _link_program(vert, frag)
+    """Load a shader program from files in the shaders package."""
+    return finish_load_program(begin_load_program(vert_filename, frag_filename))
@@ -13,9 +13,10 @@ from __future__ import annotations
 import ctypes
 import fcntl
 import logging
+import mmap
 import os
+import re
 import subprocess
-from pathlib import Path
 
 import numpy as np
 
@@ -31,6 +32,9 @@ V4L2_FIELD_NONE = 1
 V4L2_COLORSPACE_SRGB = 8
 
 V4L2_CAP_VIDEO_OUTPUT = 0x00000002
+V4L2_CAP_STREAMING = 0x04000000
+
+V4L2_MEMORY_MMAP = 1
 
 
 def _fourcc(a: str, b: str, c: str, d: str) -> int:
@@ -83,11 +87,73 @@ class _v4l2_capability(ctypes.Structure):
     ]
 
 
+class _v4l2_requestbuffers(ctypes.Structure):
+    _fields_ = [
+        ("count", ctypes.c_uint32),
+        ("type", ctypes.c_uint32),
+        ("memory", ctypes.c_uint32),
+        ("capabilities", ctypes.c_uint32),
+        ("flags", ctypes.c_uint8),
+        ("reserved", ctypes.c_uint8 * 3),
+    ]
+
+
+class _timeval(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_long),
+        ("tv_usec", ctypes.c_long),
+    ]
+
+
+class _v4l2_timecode(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("frames", ctypes.c_uint8),
+        ("seconds", ctypes.c_uint8),
+        ("minutes", ctypes.c_uint8),
+        ("hours", ctypes.c_uint8),
+        ("userbits", ctypes.c_uint8 * 4),
+    ]
+
+
+class _v4l2_buffer_m(ctypes.Union):
+    _fields_ = [
+        ("offset", ctypes.c_uint32),
+        ("userptr", ctypes.c_ulong),
+        ("planes", ctypes.c_void_p),
+        ("fd", ctypes.c_int32),
+    ]
+
+
+class _v4l2_buffer(ctypes.Structure):
+    _fields_ = [
+        ("index", ctypes.c_uint32),
+        ("type", ctypes.c_uint32),
+        ("bytesused", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("field", ctypes.c_uint32),
+        ("timestamp", _timeval),
+        ("timecode", _v4l2_timecode),
+        ("sequence", ctypes.c_uint32),
+        ("memory", ctypes.c_uint32),
+        ("m", _v4l2_buffer_m),
+        ("length", ctypes.c_uint32),
+        ("reserved2", ctypes.c_uint32),
+        ("request_fd", ctypes.c_int32),
+    ]
+
+
 def _ior(type_char: str, nr: int, size: int) -> int:
     """Compute _IOR ioctl number."""
     return (2 << 30) | (ord(type_char) << 8) | nr | (size << 16)
 
 
+def _iow(type_char: str, nr: int, size: int) -> int:
+    """Compute _IOW ioctl number."""
+    return (1 << 30) | (ord(type_char) << 8) | nr | (size << 16)
+
+
 def _iowr(type_char: str, nr: int, size: int) -> int:
     """Compute _IOWR ioctl number."""
     return ((2 | 1) << 30) | (ord(type_char) << 8) | nr | (size << 16)
@@ -95,14 +161,40 @@ def _iowr(type_char: str, nr: int, size: int) -> int:
 
 VIDIOC_QUERYCAP = _ior("V", 0, ctypes.sizeof(_v4l2_capability))
 VIDIOC_S_FMT = _iowr("V", 5, ctypes.sizeof(_v4l2_format))
+VIDIOC_REQBUFS = _iowr("V", 8, ctypes.sizeof(_v4l2_requestbuffers))
+VIDIOC_QUERYBUF = _iowr("V", 9, ctypes.sizeof(_v4l2_buffer))
+VIDIOC_QBUF = _iowr("V", 15, ctypes.sizeof(_v4l2_buffer))
+VIDIOC_DQBUF = _iowr("V", 17, ctypes.sizeof(_v4l2_buffer))
+VIDIOC_STREAMON = _iow("V", 18, ctypes.sizeof(ctypes.c_int))
+VIDIOC_STREAMOFF = _iow("V", 19, ctypes.sizeof(ctypes.c_int))
+
+# Driver buffers requested for mmap streaming output
+_STREAM_BUFFERS = 3
 
 
 # ---------------------------------------------------------------------------
 # VirtualCamera
 # ---------------------------------------------------------------------------
 
+def _is_opaque(rgba: np.ndarray) -> bool:
+    """Whether every pixel of an RGBA frame has alpha 255.
+
+    The corners are checked first, so frames with a transparent border (the
+    usual avatar) are rejected without scanning the alpha plane.
+    """
+    a = rgba[:, :, 3]
+    if a[0, 0] != 255 or a[0, -1] != 255 or a[-1, 0] != 255 or a[-1, -1] != 255:
+        return False
+    return bool(a.min() == 255)
+
+
 class VirtualCamera:
-    """Writes frames to a v4l2loopback virtual camera device."""
+    """Writes frames to a v4l2loopback virtual camera device.
+
+    Frames are composited straight into driver buffers mapped with V4L2
+    mmap streaming I/O and queued, so the kernel never copies them.  If the
+    device doesn't support streaming, frames are written with write(2).
+    """
 
     def __init__(self, device: str, width: int, height: int) -> None:
         self._device = device
@@ -110,7 +202,21 @@ class VirtualCamera:
         self._height = height
         self._fd: int | None = None
         self._status: str = "Not started"
-        self._rgb_buf: np.ndarray | None = None
+        self._rgb_buf: np.ndarray | None = None  # Frame currently being filled
+        # mmap streaming state: mapped driver buffers, RGB views of them,
+        # and indices of those not queued to the driver
+        self._streaming = False
+        self._mmaps: list[mmap.mmap] = []
+        self._buf_views: list[np.ndarray] = []
+        self._free_bufs: list[int] = []
+        # Reused QBUF/DQBUF argument, cleared before each call
+        self._ioctl_buf = _v4l2_buffer()
+        # uint16 scratch for the fixed-point composite, allocated on open()
+        self._acc: np.ndarray | None = None
+        self._tmp: np.ndarray | None = None
+        self._alpha: np.ndarray | None = None
+        self._bg_color: tuple[int, int, int] | None = None
+        self._bg: np.ndarray | None = None
 
     @property
     def is_open(self) -> bool:
@@ -120,6 +226,11 @@ class VirtualCamera:
     def status(self) -> str:
         return self._status
 
+    @property
+    def size(self) -> tuple[int, int]:
+        """Output resolution as (width, height)."""
+        return self._width, self._height
+
     def open(self) -> bool:
         """Open the v4l2loopback device and set the pixel format.
 
@@ -182,49 +293,221 @@ class VirtualCamera:
             self._fd = None
             return False
 
-        self._rgb_buf = np.empty((self._height, self._width, 3), dtype=np.uint8)
+        bytesperline = fmt.fmt.pix.bytesperline
+        caps = cap.device_caps if cap.device_caps else cap.capabilities
+        if caps & V4L2_CAP_STREAMING and bytesperline in (0, self._width * 3):
+            self._start_streaming()
+        if self._streaming:
+            self._rgb_buf = self._buf_views[0]
+        else:
+            self._rgb_buf = np.empty((self._height, self._width, 3), dtype=np.uint8)
+        self._acc = np.empty((self._height, self._width, 3), dtype=np.uint16)
+        self._tmp = np.empty_like(self._acc)
+        self._alpha = np.empty((self._height, self._width, 1), dtype=np.uint16)
 
         self._status = "Active"
-        logger.info("Virtual camera opened: %s (%dx%d RGB24)",
-                     self._device, self._width, self._height)
+        logger.info("Virtual camera opened: %s (%dx%d RGB24, %s)",
+                     self._device, self._width, self._height,
+                     "mmap streaming" if self._streaming else "write")
         return True
 
+    def _start_streaming(self) -> None:
+        """Set up mmap streaming output, leaving write(2) in use on failure."""
+        frame_bytes = self._width * self._height * 3
+        req = _v4l2_requestbuffers()
+        req.count = _STREAM_BUFFERS
+        req.type = V4L2_BUF_TYPE_VIDEO_OUTPUT
+        req.memory = V4L2_MEMORY_MMAP
+        allocated = False
+        try:
+            fcntl.ioctl(self._fd, VIDIOC_REQBUFS, req)
+            if req.count == 0:
+                return
+            allocated = True
+            for i in range(req.count):
+                buf = _v4l2_buffer()
+                buf.index = i
+                buf.type = V4L2_BUF_TYPE_VIDEO_OUTPUT
+                buf.memory = V4L2_MEMORY_MMAP
+                fcntl.ioctl(self._fd, VIDIOC_QUERYBUF, buf)
+                if buf.length < frame_bytes:
+                    raise OSError(f"driver buffer too small ({buf.length} bytes)")
+                mm = mmap.mmap(
+                    self._fd, buf.length, mmap.MAP_SHARED,
+                    mmap.PROT_READ | mmap.PROT_WRITE, offset=buf.m.offset,
+                )
+                self._mmaps.append(mm)
+                self._buf_views.append(
+                    np.frombuffer(mm, dtype=np.uint8, count=frame_bytes)
+                    .reshape(self._height, self._width, 3)
+                )
+            fcntl.ioctl(self._fd, VIDIOC_STREAMON, ctypes.c_int(V4L2_BUF_TYPE_VIDEO_OUTPUT))
+        except OSError as e:
+            logger.debug("mmap streaming unavailable, using write(): %s", e)
+            self._release_buffers()
+            if allocated:
+                # Free the driver's buffers, or the fd stays set up for
+                # mmap I/O and write(2) on it can be refused
+                req.count = 0
+                try:
+                    fcntl.ioctl(self._fd, VIDIOC_REQBUFS, req)
+                except OSError as e:
+                    logger.debug("Releasing driver buffers failed: %s", e)
+            return
+
+        # Never block the render loop waiting for the driver to hand a
+        # buffer back; a frame is dropped instead
+        flags = fcntl.fcntl(self._fd, fcntl.F_GETFL)
+        fcntl.fcntl(self._fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        self._free_bufs = list(range(len(self._mmaps)))
+        self._streaming = True
+
+    def _release_buffers(self) -> None:
+        """Unmap the streaming buffers; views must go before their mmaps."""
+        self._rgb_buf = None
+        self._buf_views = []
+        for mm in self._mmaps:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # A view is still alive; unmapped when it is collected
+        self._mmaps = []
+        self._free_bufs = []
+
+    def _next_buffer(self) -> int | None:
+        """Index of a driver buffer to fill, or None if all are still queued."""
+        if self._free_bufs:
+            return self._free_bufs.pop()
+        buf = self._clear_ioctl_buf()
+        buf.type = V4L2_BUF_TYPE_VIDEO_OUTPUT
+        buf.memory = V4L2_MEMORY_MMAP
+        try:
+            fcntl.ioctl(self._fd, VIDIOC_DQBUF, buf)
+        except BlockingIOError:
+            return None
+        return buf.index
+
+    def _clear_ioctl_buf(self) -> _v4l2_buffer:
+        """Zero the shared v4l2_buffer argument and return it."""
+        buf = self._ioctl_buf
+        ctypes.memset(ctypes.addressof(buf), 0, ctypes.sizeof(buf))
+        return buf
+
+    def _queue_buffer(self, index: int) -> None:
+        """Hand a filled buffer to the driver."""
+        buf = self._clear_ioctl_buf()
+        buf.index = index
+        buf.type = V4L2_BUF_TYPE_VIDEO_OUTPUT
+        buf.memory = V4L2_MEMORY_MMAP
+        buf.bytesused = self._width * self._height * 3
+        buf.field = V4L2_FIELD_NONE
+        fcntl.ioctl(self._fd, VIDIOC_QBUF, buf)
+
     def write_frame(self, rgba: np.ndarray, bg_color: tuple[int, int, int] = (0, 255, 0)) -> None:
         """Write an RGBA frame to the virtual camera.
 
         Composites the RGBA frame onto a solid background color and writes
         the resulting RGB24 data to the device.
         """
-        if self._fd is None or self._rgb_buf is None:
-            return
-
         h, w = rgba.shape[:2]
         if w != self._width or h != self._height:
             return
+        index = self._begin_frame()
+        if index is None:
+            return
+
+        if bg_color != self._bg_color:
+            self._bg_color = bg_color
+            self._bg = np.array(bg_color, dtype=np.uint16)
+
+        if _is_opaque(rgba):
+            # Nothing shows through; the composite is just the color planes
+            np.copyto(self._rgb_buf, rgba[:, :, :3])
+        else:
+            self._composite(rgba)
+        self._submit_frame(index)
+
+    def write_rgb(self, rgb: np.ndarray) -> None:
+        """Write an already composited (H, W, 3) uint8 frame, e.g. a GPU readback."""
+        if rgb.shape[:2] != (self._height, self._width):
+            return
+        index = self._begin_frame()
+        if index is None:
+            return
+        np.copyto(self._rgb_buf, rgb)
+        self._submit_frame(index)
 
-        alpha = rgba[:, :, 3:4].astype(np.float32) * (1.0 / 255.0)
-        fg = rgba[:, :, :3].astype(np.float32)
-        bg = np.array(bg_color, dtype=np.float32)
-        composited = fg * alpha + bg * (1.0 - alpha)
-        np.clip(composited, 0, 255, out=composited)
-        self._rgb_buf[:] = composited.astype(np.uint8)
+    def _begin_frame(self) -> int | None:
+        """Point the output buffer at the next frame to fill.
 
+        Returns the driver buffer index (-1 when writing with write(2)), or
+        None if the frame should be dropped.
+        """
+        if self._fd is None or self._rgb_buf is None:
+            return None
+        if not self._streaming:
+            return -1
         try:
-            os.write(self._fd, self._rgb_buf.tobytes())
+            index = self._next_buffer()
         except OSError as e:
-            logger.warning("Virtual camera write failed: %s", e)
-            self._status = f"Write error: {e}"
-            self.close()
+            self._write_failed(e)
+            return None
+        if index is not None:
+            self._rgb_buf = self._buf_views[index]
+        return index  # None when every buffer is still queued
+
+    def _submit_frame(self, index: int) -> None:
+        """Send the filled output buffer to the device."""
+        try:
+            if index >= 0:
+                self._queue_buffer(index)
+            else:
+                # The contiguous array is written through the buffer protocol,
+                # avoiding the full-frame bytes copy tobytes() would make
+                os.write(self._fd, self._rgb_buf)
+        except OSError as e:
+            self._write_failed(e)
+
+    def _composite(self, rgba: np.ndarray) -> None:
+        """Blend *rgba* over the background color into the output buffer."""
+        # (fg * a + bg * (255 - a)) / 255 in uint16 fixed point, on
+        # preallocated buffers: at most 255 * 255 + 128 before the divide
+        acc, tmp, alpha = self._acc, self._tmp, self._alpha
+        np.copyto(alpha, rgba[:, :, 3:4])
+        np.copyto(acc, rgba[:, :, :3])
+        acc *= alpha
+        np.subtract(255, alpha, out=alpha)
+        np.multiply(alpha, self._bg, out=tmp)
+        acc += tmp
+        # Rounded divide by 255: v = x + 128; (v + (v >> 8)) >> 8, exact here
+        acc += 128
+        np.right_shift(acc, 8, out=tmp)
+        acc += tmp
+        np.right_shift(acc, 8, out=self._rgb_buf, casting="unsafe")
+
+    def _write_failed(self, e: OSError) -> None:
+        logger.warning("Virtual camera write failed: %s", e)
+        self._status = f"Write error: {e}"
+        self.close()
 
     def close(self) -> None:
         """Close the virtual camera device."""
         if self._fd is not None:
+            if self._streaming:
+                try:
+                    fcntl.ioctl(
+                        self._fd, VIDIOC_STREAMOFF, ctypes.c_int(V4L2_BUF_TYPE_VIDEO_OUTPUT),
+                    )
+                except OSError:
+                    pass
+                self._streaming = False
+            self._release_buffers()
             try:
                 os.close(self._fd)
             except OSError:
                 pass
             self._fd = None
-            self._rgb_buf = None
+            self._acc = self._tmp = self._alpha = None
             self._status = "Closed"
             logger.info("Virtual camera closed")
 
@@ -233,6 +516,12 @@ class VirtualCamera:
 # Module-level utilities
 # ---------------------------------------------------------------------------
 
+_V4L_SYSFS = "/sys/class/video4linux"
+
+# Device names v4l2loopback uses (its default and ours), matched on raw bytes
+_LOOPBACK_NAME_RE = re.compile(rb"v4l2 loopback|dummy video|nixchirp", re.IGNORECASE)
+
+
 def is_v4l2loopback_loaded() -> bool:
     """Check if the v4l2loopback kernel module is loaded."""
     return os.path.isdir("/sys/module/v4l2loopback")
@@ -246,31 +535,32 @@ def find_v4l2loopback_devices(output_only: bool = True) -> list[str]:
                      (the writer side with exclusive_caps=1).
     """
     candidates = []
-    sysfs = Path("/sys/class/video4linux")
-    if not sysfs.exists():
+    try:
+        entries = sorted(os.scandir(_V4L_SYSFS), key=lambda e: e.name)
+    except OSError:
         return candidates
-    for entry in sorted(sysfs.iterdir()):
-        name_file = entry / "name"
-        if name_file.exists():
-            try:
-                name = name_file.read_text().strip().lower()
-            except OSError:
-                continue
-            if "v4l2 loopback" in name or "dummy video" in name or "nixchirp" in name:
-                dev_path = f"/dev/{entry.name}"
-                if os.path.exists(dev_path):
-                    candidates.append(dev_path)
+    for entry in entries:
+        try:
+            with open(os.path.join(entry.path, "name"), "rb") as f:
+                name = f.read()
+        except OSError:
+            continue
+        if _LOOPBACK_NAME_RE.search(name):
+            dev_path = f"/dev/{entry.name}"
+            if os.path.exists(dev_path):
+                candidates.append(dev_path)
 
     if not output_only or not candidates:
         return candidates
 
     # Filter for output-capable devices using QUERYCAP
     output_devs = []
+    cap = _v4l2_capability()
     for dev in candidates:
         try:
             fd = os.open(dev, os.O_RDWR)
             try:
-                cap = _v4l2_capability()
+                ctypes.memset(ctypes.addressof(cap), 0, ctypes.sizeof(cap))
                 fcntl.ioctl(fd, VIDIOC_QUERYCAP, cap)
                 if cap.device_caps & V4L2_CAP_VIDEO_OUTPUT:
                     output_devs.append(dev)
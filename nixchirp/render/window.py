@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 import sdl2
 import sdl2.ext
+from sdl2 import SDL_GetWindowSize, SDL_GL_GetDrawableSize, SDL_GL_SwapWindow
 
 if TYPE_CHECKING:
     pass
@@ -45,6 +46,16 @@ class Window:
         self._gl_context: ctypes.c_void_p | None = None
         self._running = False
 
+        # Reused out-params for the per-frame size queries
+        self._size_w = ctypes.c_int()
+        self._size_h = ctypes.c_int()
+        self._size_w_ref = ctypes.byref(self._size_w)
+        self._size_h_ref = ctypes.byref(self._size_h)
+
+        # Scratch struct SDL_PollEvent fills, reused across polls
+        self._event_buf = sdl2.SDL_Event()
+        self._event_buf_ref = ctypes.byref(self._event_buf)
+
     def create(self) -> None:
         """Initialize SDL2 and create the window with an OpenGL context."""
         if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO | sdl2.SDL_INIT_EVENTS) != 0:
@@ -117,15 +128,21 @@ class Window:
     def swap(self) -> None:
         """Swap the GL buffer to present the frame."""
         if self._window:
-            sdl2.SDL_GL_SwapWindow(self._window)
+            SDL_GL_SwapWindow(self._window)
 
     def get_size(self) -> tuple[int, int]:
         """Get the current drawable size in pixels."""
-        w = ctypes.c_int()
-        h = ctypes.c_int()
-        if self._window:
-            sdl2.SDL_GL_GetDrawableSize(self._window, ctypes.byref(w), ctypes.byref(h))
-        return w.value, h.value
+        if not self._window:
+            return 0, 0
+        SDL_GL_GetDrawableSize(self._window, self._size_w_ref, self._size_h_ref)
+        return self._size_w.value, self._size_h.value
+
+    def get_window_size(self) -> tuple[int, int]:
+        """Get the current window size in screen coordinates."""
+        if not self._window:
+            return 0, 0
+        SDL_GetWindowSize(self._window, self._size_w_ref, self._size_h_ref)
+        return self._size_w.value, self._size_h.value
 
     def set_title(self, title: str) -> None:
         """Update the window title."""
@@ -139,12 +156,11 @@ class Window:
     def poll_events(self) -> list[sdl2.SDL_Event]:
         """Poll all pending SDL events. Returns the list and sets running=False on quit."""
         events = []
-        event = sdl2.SDL_Event()
-        while sdl2.SDL_PollEvent(ctypes.byref(event)) != 0:
+        event = self._event_buf
+        while sdl2.SDL_PollEvent(self._event_buf_ref) != 0:
             if event.type == sdl2.SDL_QUIT:
                 self._running = False
-            events.append(event)
-            event = sdl2.SDL_Event()
+            events.append(sdl2.SDL_Event.from_buffer_copy(event))
         return events
 
     def destroy(self) -> None:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-import queue
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Callable
@@ -27,7 +27,7 @@ class EventType(Enum):
     SET_STATE = auto()       # Direct state change request
 
 
-@dataclass
+@dataclass(slots=True)
 class StateEvent:
     """An event requesting a state change."""
 
@@ -49,13 +49,28 @@ class StateMachine:
         self._current_state: State | None = None
         self._previous_state: State | None = None
         self._default_state: str = ""
-        self._event_queue: queue.Queue[StateEvent] = queue.Queue()
+        # append()/popleft() are atomic, so producers on other threads
+        # need no lock
+        self._event_queue: deque[StateEvent] = deque()
 
         # Mic state mapping
         self.mic_idle_state: str = ""
         self.mic_active_state: str = ""
         self.mic_intense_state: str = ""
 
+        # Event type -> target state name for that event.  Mic mappings and
+        # the default state are read at call time, so later changes apply.
+        self._resolvers: dict[EventType, Callable[[StateEvent], str]] = {
+            EventType.SET_STATE: lambda e: e.target_state,
+            EventType.MIC_ACTIVE: lambda e: self.mic_active_state,
+            EventType.MIC_IDLE: lambda e: self.mic_idle_state,
+            EventType.MIC_INTENSE: lambda e: self.mic_intense_state or self.mic_active_state,
+            EventType.MIDI_TRIGGER: lambda e: e.target_state,
+            EventType.HOTKEY_TRIGGER: lambda e: e.target_state,
+            EventType.IDLE_TIMEOUT: lambda e: e.target_state or self._default_state,
+            EventType.IDLE_CANCEL: lambda e: self.mic_idle_state or self._default_state,
+        }
+
         # Callbacks for state changes
         self._on_state_change: list[Callable[[State | None, State, str], None]] = []
 
@@ -66,6 +81,17 @@ class StateMachine:
             self._current_state = state
             self._default_state = state.name
 
+    def rename_state(self, old_name: str, new_name: str) -> State | None:
+        """Re-register a state under a new name. Returns it, or None if unknown."""
+        state = self._states.pop(old_name, None)
+        if state is None:
+            return None
+        state.name = new_name
+        self._states[new_name] = state
+        if self._default_state == old_name:
+            self._default_state = new_name
+        return state
+
     def get_state(self, name: str) -> State | None:
         """Look up a state by name."""
         return self._states.get(name)
@@ -89,7 +115,7 @@ class StateMachine:
 
     def push_event(self, event: StateEvent) -> None:
         """Push an event to be processed on the next update()."""
-        self._event_queue.put_nowait(event)
+        self._event_queue.append(event)
 
     def on_state_change(self, callback: Callable[[State | None, State, str], None]) -> None:
         """Register a callback for state changes.
@@ -101,24 +127,18 @@ class StateMachine:
     def update(self) -> StateEvent | None:
         """Process pending events. Returns the event that caused a state change, or None."""
         last_event = None
-        while not self._event_queue.empty():
-            try:
-                event = self._event_queue.get_nowait()
-            except queue.Empty:
-                break
-            result = self._handle_event(event)
-            if result:
+        queue = self._event_queue
+        while queue:
+            event = queue.popleft()
+            if self._handle_event(event):
                 last_event = event
         return last_event
 
     def _handle_event(self, event: StateEvent) -> bool:
         """Handle a single event. Returns True if state changed."""
-        target_name = self._resolve_target(event)
-        if not target_name or target_name not in self._states:
-            return False
-
-        target = self._states[target_name]
-        if target is self._current_state:
+        # One lookup; an empty or unknown name simply finds nothing
+        target = self._states.get(self._resolve_target(event))
+        if target is None or target is self._current_state:
             return False
 
         old_state = self._current_state
@@ -146,25 +166,5 @@ class StateMachine:
 
     def _resolve_target(self, event: StateEvent) -> str:
         """Determine the target state name from an event."""
-        if event.event_type == EventType.SET_STATE:
-            return event.target_state
-
-        if event.event_type == EventType.MIC_ACTIVE:
-            return self.mic_active_state
-
-        if event.event_type == EventType.MIC_IDLE:
-            return self.mic_idle_state
-
-        if event.event_type == EventType.MIC_INTENSE:
-            return self.mic_intense_state or self.mic_active_state
-
-        if event.event_type in (EventType.MIDI_TRIGGER, EventType.HOTKEY_TRIGGER):
-            return event.target_state
-
-        if event.event_type == EventType.IDLE_TIMEOUT:
-            return event.target_state or self._default_state
-
-        if event.event_type == EventType.IDLE_CANCEL:
-            return self.mic_idle_state or self._default_state
-
-        return ""
+        resolve = self._resolvers.get(event.event_type)
+        return resolve(event) if resolve is not None else ""
@@ -19,6 +19,15 @@ def parse_transition_type(name: str) -> TransitionType:
     return TransitionType.CUT
 
 
+def _smoothstep(t: float) -> float:
+    """Smooth step for a nicer crossfade than a linear ramp."""
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _cut_blend(t: float) -> float:
+    return 1.0
+
+
 class Transition:
     """Manages an in-progress transition between two states.
 
@@ -33,8 +42,11 @@ class Transition:
     ) -> None:
         self.transition_type = transition_type
         self.duration_ms = max(1, duration_ms)
-        self._start_time: float = 0.0
+        self._duration_ns = self.duration_ms * 1_000_000
+        self._blend_fn = _cut_blend if transition_type == TransitionType.CUT else _smoothstep
+        self._start_ns: int = 0
         self._active = False
+        self._blend = 1.0
 
     @property
     def active(self) -> bool:
@@ -42,32 +54,42 @@ class Transition:
 
     @property
     def blend(self) -> float:
-        """Current blend factor: 0.0 = fully old state, 1.0 = fully new state."""
-        if not self._active or self.transition_type == TransitionType.CUT:
-            return 1.0
-        elapsed_ms = (time.monotonic() - self._start_time) * 1000.0
-        t = min(1.0, elapsed_ms / self.duration_ms)
-        # Smooth step for nicer visual
-        return t * t * (3.0 - 2.0 * t)
-
-    def start(self) -> None:
-        """Begin the transition."""
+        """Blend factor as of the last tick: 0.0 = fully old state, 1.0 = fully new state."""
+        return self._blend
+
+    def start(self, now_ns: int | None = None) -> None:
+        """Begin the transition, at *now_ns* (time.monotonic_ns) if given."""
         if self.transition_type == TransitionType.CUT:
             self._active = False
+            self._blend = 1.0
             return
-        self._start_time = time.monotonic()
+        self._start_ns = time.monotonic_ns() if now_ns is None else now_ns
         self._active = True
+        self._blend = 0.0
 
-    def update(self) -> bool:
-        """Update transition state. Returns True if still in progress."""
+    def tick(self, now_ns: int) -> float:
+        """Advance to *now_ns* (time.monotonic_ns) and return the blend factor.
+
+        Callers pass the frame's own timestamp, so one clock read serves
+        every transition updated that frame.
+        """
         if not self._active:
-            return False
-        elapsed_ms = (time.monotonic() - self._start_time) * 1000.0
-        if elapsed_ms >= self.duration_ms:
+            return self._blend
+        # A transition started later in the same frame hasn't begun yet
+        elapsed_ns = max(0, now_ns - self._start_ns)
+        if elapsed_ns >= self._duration_ns:
             self._active = False
-            return False
-        return True
+            self._blend = 1.0
+        else:
+            self._blend = self._blend_fn(elapsed_ns / self._duration_ns)
+        return self._blend
+
+    def update(self) -> bool:
+        """Update transition state. Returns True if still in progress."""
+        self.tick(time.monotonic_ns())
+        return self._active
 
     def cancel(self) -> None:
         """Cancel the transition immediately."""
         self._active = False
+        self._blend = 1.0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 
@@ -16,10 +18,10 @@ def compute_rms(samples: np.ndarray) -> float:
     """
     if samples.size == 0:
         return 0.0
-    # If multi-channel, average channels
-    if samples.ndim > 1:
-        samples = samples.mean(axis=1)
-    return float(np.sqrt(np.mean(samples ** 2)))
+    samples = _mono(samples)
+    # dot() sums the squares in one float32 BLAS pass without a squared
+    # temporary; the scalar root is cheaper in math than as a NumPy ufunc
+    return math.sqrt(float(np.dot(samples, samples)) / samples.size)
 
 
 def compute_peak(samples: np.ndarray) -> float:
@@ -33,6 +35,40 @@ def compute_peak(samples: np.ndarray) -> float:
     """
     if samples.size == 0:
         return 0.0
-    if samples.ndim > 1:
-        samples = samples.mean(axis=1)
-    return float(np.max(np.abs(samples)))
+    return _peak(_mono(samples))
+
+
+def compute_stats(samples: np.ndarray) -> tuple[float, float]:
+    """Compute RMS and peak together, mixing multi-channel input only once.
+
+    Args:
+        samples: Audio samples as float32 array (mono or multi-channel).
+
+    Returns:
+        (rms, peak), both in range [0.0, 1.0] for normalized audio.
+    """
+    if samples.size == 0:
+        return 0.0, 0.0
+    samples = _mono(samples)
+    rms = math.sqrt(float(np.dot(samples, samples)) / samples.size)
+    return rms, _peak(samples)
+
+
+def _mono(samples: np.ndarray) -> np.ndarray:
+    """Mix (frames, channels) input down to 1-D by averaging channels.
+
+    Single-channel input is returned as a view, with no copy.  Real
+    multi-channel input keeps the mean: summing squares over all channels
+    would measure a different (per-channel) level.
+    """
+    if samples.ndim == 1:
+        return samples
+    if samples.shape[1] == 1:
+        return samples[:, 0]
+    return samples.mean(axis=1)
+
+
+def _peak(samples: np.ndarray) -> float:
+    """Largest absolute sample of a non-empty 1-D array."""
+    # max and -min avoid the full-size temporary np.abs() would allocate
+    return float(max(samples.max(), -samples.min()))